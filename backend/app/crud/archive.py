@@ -0,0 +1,122 @@
+# backend/app/crud/archive.py
+"""
+Archivage des tournois terminés (tables tournaments_archive et
+tournament_participations_archive).
+
+Les tournois terminés depuis plus de TOURNAMENT_ARCHIVE_AFTER_MONTHS mois sont
+déplacés par lots (INSERT ... SELECT puis DELETE, une transaction par lot) :
+les requêtes courantes sur tournaments ne parcourent plus l'historique.
+Seuls les endpoints d'historique et de statistiques lisent aussi les archives.
+"""
+from datetime import datetime
+from typing import List, Optional, Union
+
+from sqlalchemy import func, select, insert, union_all, literal
+from sqlalchemy.orm import Session, joinedload
+
+from ..models.archive import ArchivedTournament, ArchivedParticipation
+from ..models.models import Tournament, TournamentParticipation, TournamentStatus
+
+# Colonnes copiées depuis les tables d'origine (archived_at prend sa valeur par défaut)
+_TOURNAMENT_COLUMNS = [column.name for column in ArchivedTournament.__table__.columns if column.name != "archived_at"]
+_PARTICIPATION_COLUMNS = [column.name for column in ArchivedParticipation.__table__.columns]
+
+
+def archive_completed_tournaments(db: Session, completed_before: datetime, batch_size: int = 500) -> int:
+    """
+    Déplace les tournois terminés avant `completed_before` et leurs participations
+    vers les tables d'archive
+
+    Returns:
+        int: Nombre de tournois archivés
+    """
+    # Le tournoi d'identifiant maximal reste en place : sous SQLite, le supprimer
+    # permettrait la réutilisation de son identifiant par un nouveau tournoi
+    latest_id = db.query(func.max(Tournament.id)).scalar()
+    archived = 0
+
+    while True:
+        tournament_ids = [row.id for row in db.query(Tournament.id).filter(
+            Tournament.status == TournamentStatus.COMPLETED,
+            func.coalesce(Tournament.end_time, Tournament.date) < completed_before,
+            Tournament.id != latest_id
+        ).order_by(Tournament.id).limit(batch_size).all()]
+        if not tournament_ids:
+            break
+
+        tournaments = Tournament.__table__
+        participations = TournamentParticipation.__table__
+        db.execute(insert(ArchivedTournament).from_select(
+            _TOURNAMENT_COLUMNS,
+            select(*[tournaments.c[name] for name in _TOURNAMENT_COLUMNS])
+            .where(tournaments.c.id.in_(tournament_ids))
+        ))
+        db.execute(insert(ArchivedParticipation).from_select(
+            _PARTICIPATION_COLUMNS,
+            select(*[participations.c[name] for name in _PARTICIPATION_COLUMNS])
+            .where(participations.c.tournament_id.in_(tournament_ids))
+        ))
+        db.query(TournamentParticipation).filter(
+            TournamentParticipation.tournament_id.in_(tournament_ids)
+        ).delete(synchronize_session=False)
+        db.query(Tournament).filter(Tournament.id.in_(tournament_ids)).delete(synchronize_session=False)
+        db.commit()
+
+        archived += len(tournament_ids)
+
+    return archived
+
+
+def get_archived_tournament(db: Session, tournament_id: int) -> Optional[ArchivedTournament]:
+    """
+    Tournoi archivé avec ses participations
+    """
+    return db.query(ArchivedTournament).options(
+        joinedload(ArchivedTournament.participations).joinedload(ArchivedParticipation.user),
+        joinedload(ArchivedTournament.configuration)
+    ).filter(ArchivedTournament.id == tournament_id).first()
+
+
+def list_tournament_history(
+    db: Session,
+    skip: int = 0,
+    limit: int = 50,
+    league_id: Optional[int] = None
+) -> List[Union[Tournament, ArchivedTournament]]:
+    """
+    Tournois terminés, courants et archivés, du plus récent au plus ancien.
+    La page est déterminée sur les seuls (id, date) des deux tables,
+    puis les tournois de la page sont chargés avec leurs participations.
+    """
+    recent = select(Tournament.id, Tournament.date, literal(False).label("archived")) \
+        .where(Tournament.status == TournamentStatus.COMPLETED)
+    archived = select(ArchivedTournament.id, ArchivedTournament.date, literal(True).label("archived"))
+    if league_id is not None:
+        recent = recent.where(Tournament.league_id == league_id)
+        archived = archived.where(ArchivedTournament.league_id == league_id)
+
+    history = union_all(recent, archived).subquery()
+    page = db.execute(
+        select(history.c.id, history.c.archived)
+        .order_by(history.c.date.desc(), history.c.id.desc())
+        .offset(skip).limit(limit)
+    ).all()
+
+    recent_ids = [row.id for row in page if not row.archived]
+    archived_ids = [row.id for row in page if row.archived]
+    loaded = {}
+    if recent_ids:
+        for tournament in db.query(Tournament).options(
+            joinedload(Tournament.participations).joinedload(TournamentParticipation.user),
+            joinedload(Tournament.configuration)
+        ).filter(Tournament.id.in_(recent_ids)):
+            loaded[(tournament.id, False)] = tournament
+    if archived_ids:
+        for tournament in db.query(ArchivedTournament).options(
+            joinedload(ArchivedTournament.participations).joinedload(ArchivedParticipation.user),
+            joinedload(ArchivedTournament.configuration)
+        ).filter(ArchivedTournament.id.in_(archived_ids)):
+            loaded[(tournament.id, True)] = tournament
+
+    # Un tournoi archivé entre les deux requêtes est simplement absent de la page
+    return [loaded[(row.id, bool(row.archived))] for row in page if (row.id, bool(row.archived)) in loaded]
@@ -0,0 +1,158 @@
+# backend/app/crud/events.py
+"""
+Enregistrement des événements de tournoi (table tournament_events).
+
+record_event() ne fait qu'empiler l'événement dans la session ; il est écrit
+au commit, dans la même transaction que la modification qu'il décrit :
+- un UPDATE par tournoi réserve les numéros de séquence (event_seq += n),
+  sauf s'ils ont déjà été réservés par l'UPDATE du tournoi fait par l'appelant ;
+- un seul INSERT ... SELECT exécuté en lot (executemany) écrit tous les événements.
+Un rollback abandonne les événements en attente.
+"""
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import event, insert, select, bindparam
+from sqlalchemy.orm import Session
+
+from ..models.events import TournamentEvent, TournamentEventType, TournamentSnapshot
+from ..models.models import Tournament
+
+_PENDING_KEY = "pending_tournament_events"
+
+
+def record_event(
+    db: Session,
+    tournament_id: int,
+    event_type: TournamentEventType,
+    user_id: Optional[int] = None,
+    value: Optional[int] = None,
+    amount: Optional[float] = None,
+    payload: Optional[Dict] = None,
+    seq_reserved: bool = False
+):
+    """
+    Ajoute un événement à écrire au prochain commit de la session.
+    seq_reserved : l'appelant a déjà incrémenté Tournament.event_seq dans la
+    transaction (en l'ajoutant à son propre UPDATE du tournoi), ce qui évite un UPDATE.
+    """
+    db.info.setdefault(_PENDING_KEY, []).append({
+        "tournament_id": tournament_id,
+        "type": event_type,
+        "user_id": user_id,
+        "value": value,
+        "amount": amount,
+        "payload": payload,
+        "seq_reserved": seq_reserved
+    })
+
+
+def timer_payload(at: datetime) -> Dict:
+    """
+    Charge utile des événements du timer (pause, reprise, niveau, temps restant) :
+    heure UTC de la valeur du timer, identique à Tournament.last_timer_update.
+    created_at (défaut serveur) est à l'heure locale de la base et à la seconde près.
+    """
+    return {"timer_updated_at": at.isoformat()}
+
+
+def pending_events(db: Session) -> List[Dict]:
+    return db.info.get(_PENDING_KEY, [])
+
+
+# Insertion avec numéro de séquence lu dans la ligne du tournoi déjà incrémentée :
+# seq = event_seq - offset, offset allant de n-1 (premier événement) à 0 (dernier)
+_insert_event = insert(TournamentEvent).from_select(
+    ["tournament_id", "seq", "type", "user_id", "value", "amount", "payload"],
+    select(
+        Tournament.id,
+        Tournament.event_seq - bindparam("offset"),
+        bindparam("type", type_=TournamentEvent.type.type),
+        bindparam("user_id", type_=TournamentEvent.user_id.type),
+        bindparam("value", type_=TournamentEvent.value.type),
+        bindparam("amount", type_=TournamentEvent.amount.type),
+        bindparam("payload", type_=TournamentEvent.payload.type)
+    ).where(Tournament.id == bindparam("tournament_id"))
+)
+
+
+def write_pending_events(db: Session) -> int:
+    """
+    Écrit les événements en attente dans la transaction courante
+
+    Returns:
+        int: Nombre d'événements écrits
+    """
+    events = db.info.pop(_PENDING_KEY, None)
+    if not events:
+        return 0
+
+    by_tournament: "OrderedDict[int, List[Dict]]" = OrderedDict()
+    for pending in events:
+        by_tournament.setdefault(pending["tournament_id"], []).append(pending)
+
+    rows = []
+    for tournament_id, tournament_events in by_tournament.items():
+        count = len(tournament_events)
+        to_reserve = sum(1 for pending in tournament_events if not pending["seq_reserved"])
+        if to_reserve:
+            # Réservation atomique des numéros (sans incrémenter la version du tournoi)
+            db.query(Tournament).filter(Tournament.id == tournament_id).update(
+                {Tournament.event_seq: Tournament.event_seq + to_reserve},
+                synchronize_session=False
+            )
+        # Les numéros réservés dans la transaction sont contigus (ligne verrouillée)
+        for index, pending in enumerate(tournament_events):
+            row = {key: value for key, value in pending.items() if key != "seq_reserved"}
+            rows.append({**row, "offset": count - 1 - index})
+
+    db.execute(_insert_event, rows)
+    return len(rows)
+
+
+@event.listens_for(Session, "before_commit")
+def _write_events_before_commit(session: Session):
+    write_pending_events(session)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_events_after_rollback(session: Session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+def list_tournament_events(
+    db: Session,
+    tournament_id: int,
+    after_seq: int = 0,
+    limit: int = 500
+) -> List[TournamentEvent]:
+    """
+    Événements d'un tournoi dans l'ordre, à partir d'un numéro de séquence
+    """
+    return db.query(TournamentEvent).filter(
+        TournamentEvent.tournament_id == tournament_id,
+        TournamentEvent.seq > after_seq
+    ).order_by(TournamentEvent.seq).limit(limit).all()
+
+
+def get_latest_snapshot(db: Session, tournament_id: int) -> Optional[TournamentSnapshot]:
+    """
+    Dernier instantané de l'état d'un tournoi
+    """
+    return db.query(TournamentSnapshot).filter(
+        TournamentSnapshot.tournament_id == tournament_id
+    ).order_by(TournamentSnapshot.seq.desc()).first()
+
+
+def save_snapshot(db: Session, tournament_id: int, seq: int, state: Dict):
+    """
+    Enregistre un instantané et supprime les précédents (seul le dernier est relu).
+    L'appelant gère le commit ; un instantané déjà écrit pour ce seq (autre worker)
+    lève une IntegrityError.
+    """
+    db.add(TournamentSnapshot(tournament_id=tournament_id, seq=seq, state=state))
+    db.query(TournamentSnapshot).filter(
+        TournamentSnapshot.tournament_id == tournament_id,
+        TournamentSnapshot.seq < seq
+    ).delete(synchronize_session=False)
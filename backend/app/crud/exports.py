@@ -0,0 +1,123 @@
+# backend/app/crud/exports.py
+"""
+Requêtes des exports (tournois, résultats, statistiques joueurs).
+
+Les requêtes ne sélectionnent que des colonnes (pas d'objets ORM) et sont lues
+par lots avec un curseur côté serveur (stream_results + yield_per) : la mémoire utilisée
+ne dépend pas du nombre de lignes exportées. Les tournois archivés sont inclus.
+"""
+from datetime import datetime
+from typing import Dict, Iterator, Optional
+
+from sqlalchemy import select, union_all, literal
+from sqlalchemy.orm import Session
+
+from ..models.archive import ArchivedTournament, ArchivedParticipation
+from ..models.models import Tournament, TournamentParticipation, TournamentStatus, TournamentType, User
+from ..models.stats import PlayerStats
+from .stats import COUNTER_FIELDS
+
+# Lignes lues par aller-retour avec la base
+EXPORT_BATCH_SIZE = 1000
+
+
+def _filter_tournaments(statement, model, league_id, date_from, date_to, tournament_type):
+    if league_id is not None:
+        statement = statement.where(model.league_id == league_id)
+    if date_from is not None:
+        statement = statement.where(model.date >= date_from)
+    if date_to is not None:
+        statement = statement.where(model.date < date_to)
+    if tournament_type is not None:
+        statement = statement.where(model.tournament_type == tournament_type)
+    return statement
+
+
+def tournaments_statement(
+    league_id: Optional[int] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    tournament_type: Optional[TournamentType] = None
+):
+    """Une ligne par tournoi (courants et archivés), par date croissante"""
+    selects = []
+    for model, archived in ((Tournament, False), (ArchivedTournament, True)):
+        selects.append(_filter_tournaments(select(
+            model.id,
+            model.name,
+            model.tournament_type,
+            model.status,
+            model.date,
+            model.league_id,
+            model.buy_in,
+            model.registered_count,
+            model.total_buyin,
+            model.total_rebuys,
+            model.prize_pool,
+            model.clay_token_holder_id,
+            model.bounty_hunter_id,
+            literal(archived).label("archived")
+        ), model, league_id, date_from, date_to, tournament_type))
+    tournaments = union_all(*selects).subquery()
+    return select(tournaments).order_by(tournaments.c.date, tournaments.c.id)
+
+
+def results_statement(
+    league_id: Optional[int] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    tournament_type: Optional[TournamentType] = None
+):
+    """Une ligne par résultat d'un joueur dans un tournoi terminé, par date croissante"""
+    selects = []
+    for tournament_model, participation_model in (
+        (Tournament, TournamentParticipation),
+        (ArchivedTournament, ArchivedParticipation)
+    ):
+        selects.append(_filter_tournaments(
+            select(
+                tournament_model.id.label("tournament_id"),
+                tournament_model.name.label("tournament_name"),
+                tournament_model.tournament_type,
+                tournament_model.date,
+                tournament_model.league_id,
+                participation_model.user_id,
+                User.username,
+                participation_model.current_position.label("position"),
+                participation_model.num_rebuys,
+                participation_model.total_buyin,
+                participation_model.prize_won
+            )
+            .join(participation_model, participation_model.tournament_id == tournament_model.id)
+            .join(User, User.id == participation_model.user_id)
+            .where(tournament_model.status == TournamentStatus.COMPLETED),
+            tournament_model, league_id, date_from, date_to, tournament_type
+        ))
+    results = union_all(*selects).subquery()
+    return select(results).order_by(results.c.date, results.c.tournament_id, results.c.position)
+
+
+def player_stats_statement(league_id: Optional[int] = None, season: Optional[int] = None):
+    """Une ligne par (joueur, ligue, saison)"""
+    statement = select(
+        PlayerStats.user_id,
+        User.username,
+        PlayerStats.league_id,
+        PlayerStats.season,
+        *[getattr(PlayerStats, field) for field in COUNTER_FIELDS]
+    ).join(User, User.id == PlayerStats.user_id)
+    if league_id is not None:
+        statement = statement.where(PlayerStats.league_id == league_id)
+    if season is not None:
+        statement = statement.where(PlayerStats.season == season)
+    return statement.order_by(PlayerStats.season, PlayerStats.league_id, PlayerStats.user_id)
+
+
+def stream_rows(db: Session, statement) -> Iterator[Dict]:
+    """
+    Lignes d'une requête sous forme de dictionnaires, lues par lots de
+    EXPORT_BATCH_SIZE avec un curseur côté serveur
+    """
+    result = db.execute(statement.execution_options(stream_results=True)).yield_per(EXPORT_BATCH_SIZE)
+    for row in result.mappings():
+        yield dict(row)
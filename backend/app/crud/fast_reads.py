@@ -0,0 +1,438 @@
+# backend/app/crud/fast_reads.py
+"""
+Chemins de lecture rapides des endpoints les plus sollicités (liste et détail
+des tournois, horloge, classements).
+
+Les requêtes SQLAlchemy Core ne sélectionnent que les colonnes exposées et les
+réponses sont construites directement en dictionnaires : ni identity map, ni
+chargements paresseux, ni conversion from_attributes des objets ORM.
+Les dictionnaires ont la forme exacte des schémas de réponse (TournamentResponse,
+LeaderboardEntry) : les routes les renvoient tels quels, sans revalidation
+(voir serialization.trusted_response).
+
+Les requêtes *_stamp ne lisent que les versions des entités d'une représentation,
+pour calculer son ETag (voir serialization.entity_tag) avant de la charger.
+"""
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional
+
+from sqlalchemy import select, bindparam, exists, func, literal, union_all
+from sqlalchemy.orm import Session
+
+from ..models.archive import ArchivedTournament, ArchivedParticipation
+from ..models.configuration import TournamentConfiguration, BlindsStructure, SoundConfiguration
+from ..models.models import (
+    Tournament, TournamentParticipation, TournamentStatus, TournamentType, User, League, LeagueAdmin
+)
+
+# Champs de TournamentResponse (hors participations et configuration)
+TOURNAMENT_FIELDS = (
+    "id", "name", "tournament_type", "date", "max_players", "buy_in", "num_tables",
+    "players_per_table", "status", "league_id", "admin_id", "start_time", "end_time",
+    "current_level", "total_rebuys", "prize_pool", "registered_count", "version",
+    "clay_token_holder_id", "bounty_hunter_id", "tables_state"
+)
+PARTICIPATION_FIELDS = (
+    "id", "tournament_id", "user_id", "is_registered", "is_active", "registration_time",
+    "elimination_time", "current_position", "num_rebuys", "total_buyin", "prize_won"
+)
+# Champs de UserSimple
+USER_FIELDS = (
+    "id", "email", "username", "first_name", "last_name", "address", "profile_image_path", "league_id"
+)
+CONFIGURATION_FIELDS = (
+    "id", "name", "tournament_type", "is_default", "buy_in", "rebuy_levels", "created_by_id", "created_at"
+)
+BLINDS_STRUCTURE_FIELDS = ("id", "name", "structure", "starting_chips", "is_default", "created_by_id", "created_at")
+SOUND_CONFIGURATION_FIELDS = ("id", "name", "sounds", "is_default", "created_by_id", "created_at")
+# Champs de UserResponse (hors ligue et statut d'administrateur)
+USER_RESPONSE_COLUMNS = USER_FIELDS + ("created_at", "last_login")
+USER_RESPONSE_FIELDS = frozenset(USER_RESPONSE_COLUMNS + ("league", "is_league_admin"))
+# Tous les champs de TournamentResponse (réponse complète)
+TOURNAMENT_RESPONSE_FIELDS = frozenset(TOURNAMENT_FIELDS + ("configuration", "participations"))
+
+
+def _columns(table, fields, prefix: str = ""):
+    return [table.c[field].label(f"{prefix}{field}") for field in fields]
+
+
+def _pick(row, fields, prefix: str = "") -> Dict:
+    return {field: row[f"{prefix}{field}"] for field in fields}
+
+
+@lru_cache(maxsize=64)
+def _tournament_statement(archived: bool, fields: FrozenSet[str]):
+    """
+    Requête des tournois limitée aux champs demandés (l'identifiant est toujours lu).
+    La configuration n'est jointe que si elle est demandée. Construite une seule
+    fois par ensemble de champs sur les tables (pas d'attributs ORM) ; elle ne porte
+    pas de filtre : le détail et la liste y ajoutent les leurs.
+
+    Returns:
+        (table des tournois, requête, colonnes du tournoi sélectionnées)
+    """
+    tournaments = (ArchivedTournament if archived else Tournament).__table__
+    columns = tuple(field for field in TOURNAMENT_FIELDS if field == "id" or field in fields)
+    selected = _columns(tournaments, columns)
+    from_clause = tournaments
+
+    if "configuration" in fields:
+        # Configuration complète dans la même requête (jointures externes)
+        configuration = TournamentConfiguration.__table__.alias("configuration")
+        blinds_structure = BlindsStructure.__table__.alias("blinds_structure")
+        sound_configuration = SoundConfiguration.__table__.alias("sound_configuration")
+        selected += [
+            *_columns(configuration, CONFIGURATION_FIELDS, "c_"),
+            *_columns(blinds_structure, BLINDS_STRUCTURE_FIELDS, "b_"),
+            *_columns(sound_configuration, SOUND_CONFIGURATION_FIELDS, "s_")
+        ]
+        from_clause = (
+            from_clause
+            .outerjoin(configuration, configuration.c.id == tournaments.c.configuration_id)
+            .outerjoin(blinds_structure, blinds_structure.c.id == configuration.c.blinds_structure_id)
+            .outerjoin(sound_configuration, sound_configuration.c.id == configuration.c.sound_configuration_id)
+        )
+
+    return tournaments, select(*selected).select_from(from_clause), columns
+
+
+@lru_cache(maxsize=64)
+def _tournament_detail_statement(archived: bool, fields: FrozenSet[str]):
+    tournaments, statement, columns = _tournament_statement(archived, fields)
+    return statement.where(tournaments.c.id == bindparam("tournament_id")), columns
+
+
+@lru_cache(maxsize=2)
+def _participants_statement(archived: bool):
+    """Participations (avec joueur) d'un ensemble de tournois"""
+    participations = (ArchivedParticipation if archived else TournamentParticipation).__table__
+    users = User.__table__
+    return select(
+        *_columns(participations, PARTICIPATION_FIELDS),
+        *_columns(users, USER_FIELDS, "u_")
+    ).select_from(
+        participations.join(users, users.c.id == participations.c.user_id)
+    ).where(
+        participations.c.tournament_id.in_(bindparam("tournament_ids", expanding=True))
+    ).order_by(participations.c.id)
+
+
+def _tournament_from_row(row, columns, fields: FrozenSet[str]) -> Dict:
+    tournament = _pick(row, columns)
+    if "tables_state" in tournament:
+        tournament["tables_state"] = tournament["tables_state"] or {}
+    if "configuration" in fields:
+        tournament["configuration"] = None
+        if row["c_id"] is not None:
+            tournament["configuration"] = {
+                **_pick(row, CONFIGURATION_FIELDS, "c_"),
+                "blinds_structure": _pick(row, BLINDS_STRUCTURE_FIELDS, "b_"),
+                "sound_configuration": (
+                    _pick(row, SOUND_CONFIGURATION_FIELDS, "s_") if row["s_id"] is not None else None
+                )
+            }
+    if "participations" in fields:
+        tournament["participations"] = []
+    return tournament
+
+
+def _attach_participations(db: Session, archived: bool, tournaments: List[Dict]) -> List[Dict]:
+    """Ajoute les participations (avec joueur) aux tournois, en une requête"""
+    if not tournaments:
+        return tournaments
+    by_id = {tournament["id"]: tournament for tournament in tournaments}
+    for row in db.execute(_participants_statement(archived), {"tournament_ids": list(by_id)}).mappings():
+        by_id[row["tournament_id"]]["participations"].append({
+            **_pick(row, PARTICIPATION_FIELDS),
+            "league_id": None,
+            "user": _pick(row, USER_FIELDS, "u_")
+        })
+    return tournaments
+
+
+def _tournament_dict(db: Session, archived: bool, tournament_id: int, fields: FrozenSet[str]) -> Optional[Dict]:
+    statement, columns = _tournament_detail_statement(archived, fields)
+    row = db.execute(statement, {"tournament_id": tournament_id}).mappings().first()
+    if row is None:
+        return None
+    tournament = _tournament_from_row(row, columns, fields)
+    if "participations" in fields:
+        _attach_participations(db, archived, [tournament])
+    return tournament
+
+
+def get_tournament_response(
+    db: Session,
+    tournament_id: int,
+    fields: Optional[FrozenSet[str]] = None,
+    archived: Optional[bool] = None
+) -> Optional[Dict]:
+    """
+    Détail d'un tournoi au format TournamentResponse, en deux requêtes
+    (tournoi + configuration, puis participations + joueurs).
+    Les tournois archivés sont lus dans les tables d'archive.
+
+    `fields` limite la réponse à ces champs : les relations non demandées
+    (configuration, participations) ne sont ni jointes ni chargées.
+    `archived` (connu par get_tournament_stamp) évite de chercher le tournoi
+    dans les deux tables.
+    """
+    fields = fields or TOURNAMENT_RESPONSE_FIELDS
+    if archived is not None:
+        return _tournament_dict(db, archived, tournament_id, fields)
+    return (
+        _tournament_dict(db, False, tournament_id, fields)
+        or _tournament_dict(db, True, tournament_id, fields)
+    )
+
+
+def _tournament_stamp_statement(archived: bool):
+    """
+    Versions de tout ce que contient le détail d'un tournoi : le tournoi (version
+    pour les UPDATE ORM, event_seq pour les incréments atomiques et les actions
+    journalisées, dont toute modification des participations), sa configuration
+    et la somme des versions des joueurs inscrits (à participations constantes,
+    la somme augmente dès qu'un joueur est modifié).
+    """
+    tournaments = (ArchivedTournament if archived else Tournament).__table__
+    participations = (ArchivedParticipation if archived else TournamentParticipation).__table__
+    users = User.__table__
+    configurations = TournamentConfiguration.__table__
+    blinds_structures = BlindsStructure.__table__
+    sound_configurations = SoundConfiguration.__table__
+    players_version = select(func.coalesce(func.sum(users.c.version), 0)).select_from(
+        participations.join(users, users.c.id == participations.c.user_id)
+    ).where(participations.c.tournament_id == tournaments.c.id).scalar_subquery()
+    return select(
+        literal(archived).label("archived"),
+        tournaments.c.version,
+        tournaments.c.event_seq,
+        configurations.c.version.label("configuration_version"),
+        blinds_structures.c.version.label("blinds_structure_version"),
+        sound_configurations.c.version.label("sound_configuration_version"),
+        players_version.label("players_version")
+    ).select_from(
+        tournaments
+        .outerjoin(configurations, configurations.c.id == tournaments.c.configuration_id)
+        .outerjoin(blinds_structures, blinds_structures.c.id == configurations.c.blinds_structure_id)
+        .outerjoin(sound_configurations, sound_configurations.c.id == configurations.c.sound_configuration_id)
+    ).where(tournaments.c.id == bindparam("tournament_id"))
+
+
+# Tables courantes et archives en une seule requête
+_TOURNAMENT_STAMP_STATEMENT = union_all(_tournament_stamp_statement(False), _tournament_stamp_statement(True))
+
+
+def get_tournament_stamp(db: Session, tournament_id: int) -> Optional[Dict]:
+    """
+    Versions du détail d'un tournoi (courant ou archivé), en une requête.
+
+    Returns:
+        None si le tournoi n'existe pas, sinon {"archived", "version", "stamp"}
+        où `stamp` regroupe toutes les versions lues
+    """
+    row = db.execute(_TOURNAMENT_STAMP_STATEMENT, {"tournament_id": tournament_id}).first()
+    if row is None:
+        return None
+    return {"archived": bool(row.archived), "version": row.version, "stamp": tuple(row)}
+
+
+def list_tournament_responses(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    status: Optional[TournamentStatus] = None,
+    tournament_type: Optional[TournamentType] = None,
+    fields: Optional[FrozenSet[str]] = None
+) -> List[Dict]:
+    """
+    Page de tournois au format TournamentResponse (mêmes filtres et même ordre
+    que tournament_crud.list_tournaments), en deux requêtes au plus.
+    `fields` : voir get_tournament_response.
+    """
+    fields = fields or TOURNAMENT_RESPONSE_FIELDS
+    tournaments_table, statement, columns = _tournament_statement(False, fields)
+    if status:
+        statement = statement.where(tournaments_table.c.status == status)
+    if tournament_type:
+        statement = statement.where(tournaments_table.c.tournament_type == tournament_type)
+    statement = statement.order_by(tournaments_table.c.date.desc()).offset(skip).limit(limit)
+
+    tournaments = [_tournament_from_row(row, columns, fields) for row in db.execute(statement).mappings()]
+    if "participations" in fields:
+        _attach_participations(db, False, tournaments)
+    return tournaments
+
+
+def _projected_seconds(row, now: datetime) -> Optional[int]:
+    """Temps restant projeté à `now` : le timer tourne sauf en pause"""
+    if row["seconds_remaining"] is None:
+        return None
+    if (row["paused_at"] is not None or row["last_timer_update"] is None
+            or row["status"] != TournamentStatus.IN_PROGRESS):
+        return row["seconds_remaining"]
+    elapsed = int((now - row["last_timer_update"].replace(tzinfo=None)).total_seconds())
+    return max(0, row["seconds_remaining"] - max(0, elapsed))
+
+
+def _clock_statement():
+    tournaments = Tournament.__table__
+    configurations = TournamentConfiguration.__table__
+    blinds_structures = BlindsStructure.__table__
+    return select(
+        tournaments.c.id,
+        tournaments.c.version,
+        tournaments.c.status,
+        tournaments.c.current_level,
+        tournaments.c.seconds_remaining,
+        tournaments.c.level_duration,
+        tournaments.c.paused_at,
+        tournaments.c.last_timer_update,
+        blinds_structures.c.structure
+    ).select_from(
+        tournaments
+        .outerjoin(configurations, configurations.c.id == tournaments.c.configuration_id)
+        .outerjoin(blinds_structures, blinds_structures.c.id == configurations.c.blinds_structure_id)
+    ).where(tournaments.c.id == bindparam("tournament_id"))
+
+
+_CLOCK_STATEMENT = _clock_statement()
+
+
+def get_clock_snapshot(db: Session, tournament_id: int) -> Optional[Dict]:
+    """
+    Horloge d'un tournoi (niveau, blindes, temps restant projeté à l'instant
+    de la lecture), en une requête sur les seules colonnes du timer
+    """
+    row = db.execute(_CLOCK_STATEMENT, {"tournament_id": tournament_id}).mappings().first()
+    if row is None:
+        return None
+
+    now = datetime.utcnow()
+    levels = {level.get("level"): level for level in row["structure"] or []}
+    current_level = row["current_level"] or 0
+    return {
+        "id": row["id"],
+        "version": row["version"],
+        "status": row["status"].value,
+        "current_level": current_level,
+        "level": levels.get(current_level),
+        "next_level": levels.get(current_level + 1),
+        "seconds_remaining": _projected_seconds(row, now),
+        "level_duration": row["level_duration"],
+        "paused": row["paused_at"] is not None,
+        "last_timer_update": row["last_timer_update"].isoformat() if row["last_timer_update"] else None,
+        "server_time": now.isoformat()
+    }
+
+
+_BLINDS_STRUCTURE_STAMP_STATEMENT = select(BlindsStructure.__table__.c.version).where(
+    BlindsStructure.__table__.c.id == bindparam("structure_id")
+)
+
+
+def get_blinds_structure_stamp(db: Session, structure_id: int) -> Optional[int]:
+    """Version d'une structure de blindes (None si elle n'existe pas)"""
+    return db.execute(_BLINDS_STRUCTURE_STAMP_STATEMENT, {"structure_id": structure_id}).scalar()
+
+
+def _league_stamps_statement():
+    """
+    Version de chaque ligue (incrémentée quand ses membres ou administrateurs
+    changent) et somme des versions de ses membres (modifications de profil)
+    """
+    leagues = League.__table__
+    users = User.__table__
+    return select(
+        leagues.c.id,
+        leagues.c.version,
+        func.coalesce(func.sum(users.c.version), 0).label("members_version")
+    ).select_from(
+        leagues.outerjoin(users, users.c.league_id == leagues.c.id)
+    ).group_by(leagues.c.id, leagues.c.version).order_by(leagues.c.id)
+
+
+_LEAGUE_STAMPS_STATEMENT = _league_stamps_statement()
+_LEAGUE_STAMP_STATEMENT = _LEAGUE_STAMPS_STATEMENT.where(League.__table__.c.id == bindparam("league_id"))
+
+
+def get_league_stamps(db: Session) -> tuple:
+    """Versions de toutes les ligues (liste des ligues), en une requête"""
+    return tuple(tuple(row) for row in db.execute(_LEAGUE_STAMPS_STATEMENT))
+
+
+def get_league_stamp(db: Session, league_id: int) -> Optional[tuple]:
+    """Versions d'une ligue (None si elle n'existe pas)"""
+    row = db.execute(_LEAGUE_STAMP_STATEMENT, {"league_id": league_id}).first()
+    return tuple(row) if row is not None else None
+
+
+_LEADERBOARD_USERS_STATEMENT = select(
+    User.__table__.c.id, User.__table__.c.username, User.__table__.c.profile_image_path
+).where(User.__table__.c.id.in_(bindparam("user_ids", expanding=True)))
+
+
+def get_leaderboard_entries(db: Session, entries: List[Dict]) -> List[Dict]:
+    """
+    Complète les entrées d'un classement (rang, joueur, score) avec le nom et
+    l'image des joueurs, en une requête. Format LeaderboardEntry.
+    """
+    if not entries:
+        return []
+    users = {
+        row.id: row
+        for row in db.execute(_LEADERBOARD_USERS_STATEMENT, {"user_ids": [entry["user_id"] for entry in entries]})
+    }
+    return [
+        {
+            "rank": entry["rank"],
+            "user_id": entry["user_id"],
+            "username": users[entry["user_id"]].username,
+            "profile_image_path": users[entry["user_id"]].profile_image_path,
+            "score": entry["score"]
+        }
+        for entry in entries
+        if entry["user_id"] in users
+    ]
+
+
+@lru_cache(maxsize=32)
+def _user_statement(fields: FrozenSet[str]):
+    """Requête d'un utilisateur limitée aux champs demandés (ligue jointe si demandée)"""
+    users = User.__table__
+    columns = tuple(field for field in USER_RESPONSE_COLUMNS if field == "id" or field in fields)
+    selected = _columns(users, columns)
+    from_clause = users
+    if "league" in fields:
+        leagues = League.__table__
+        selected += [leagues.c.name.label("l_name"), leagues.c.description.label("l_description")]
+        from_clause = from_clause.outerjoin(leagues, leagues.c.id == users.c.league_id)
+    if "is_league_admin" in fields:
+        league_admins = LeagueAdmin.__table__
+        selected.append(exists().where(
+            league_admins.c.league_id == users.c.league_id,
+            league_admins.c.user_id == users.c.id
+        ).label("is_league_admin"))
+    return select(*selected).select_from(from_clause).where(users.c.id == bindparam("user_id")), columns
+
+
+def get_user_response(db: Session, user_id: int, fields: Optional[FrozenSet[str]] = None) -> Optional[Dict]:
+    """
+    Utilisateur au format UserResponse (ligue et statut d'administrateur de la
+    ligue inclus), en une requête. `fields` limite la réponse à ces champs.
+    """
+    fields = fields or USER_RESPONSE_FIELDS
+    statement, columns = _user_statement(fields)
+    row = db.execute(statement, {"user_id": user_id}).mappings().first()
+    if row is None:
+        return None
+
+    user = _pick(row, columns)
+    if "league" in fields:
+        user["league"] = (
+            {"name": row["l_name"], "description": row["l_description"]} if row["l_name"] is not None else None
+        )
+    if "is_league_admin" in fields:
+        user["is_league_admin"] = bool(row["is_league_admin"])
+    return user
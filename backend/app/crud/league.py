@@ -5,8 +5,23 @@ from typing import Optional
 
 from ..models.models import League, LeagueAdmin, User
 from ..schemas.schemas import LeagueCreate, LeagueResponse
+from ..services.user_cache import user_cache
 
 # crud/leagues.py
+def touch_leagues(db: Session, *league_ids: Optional[int]) -> None:
+    """
+    Incrémente la version des ligues dont les membres ou les administrateurs
+    changent (ETag de GET /leagues/). Ne valide pas la transaction : à appeler
+    avant le commit de la modification.
+    """
+    league_ids = {league_id for league_id in league_ids if league_id is not None}
+    if league_ids:
+        db.query(League).filter(League.id.in_(league_ids)).update(
+            {League.version: League.version + 1},
+            synchronize_session=False
+        )
+
+
 def create_league(db: Session, league: LeagueCreate, admin_id: int) -> League:
     # Création de la ligue
     db_league = League(
@@ -29,10 +44,12 @@ def create_league(db: Session, league: LeagueCreate, admin_id: int) -> League:
     )
     db.add(league_admin)
 
-    # Mettre à jour la ligue de l'admin
+    # Mettre à jour la ligue de l'admin (qui quitte son ancienne ligue)
+    touch_leagues(db, db_league.id, admin.league_id)
     admin.league_id = db_league.id
 
     db.commit()
+    user_cache.invalidate_user(user_id=admin_id)
     return db_league
 
 def get_league_with_members(db: Session, league_id: int):
@@ -64,5 +81,6 @@ def add_league_admin(db: Session, league_id: int, user_id: int) -> bool:
     # Ajouter l'administrateur
     league_admin = LeagueAdmin(league_id=league_id, user_id=user_id)
     db.add(league_admin)
+    touch_leagues(db, league_id)
     db.commit()
     return True
\ No newline at end of file
@@ -0,0 +1,405 @@
+# backend/app/crud/results_import.py
+"""
+Import en flux de l'historique des résultats (CSV ou NDJSON).
+
+Une ligne par résultat d'un joueur ; les lignes d'un même tournoi sont
+consécutives (tri du tableur par tournoi). Colonnes :
+    tournament_ref      identifiant du tournoi dans le fichier (optionnel,
+                        à défaut : tournament_name + date)
+    tournament_name, tournament_type (CLASSIQUE, MTT, JAPT), date (ISO 8601), buy_in
+    player              pseudo ou email d'un membre de la ligue
+    position            classement final (1 = vainqueur)
+    prize_won, num_rebuys              optionnels (0 par défaut)
+    bounty_hunter, clay_token          optionnels (1/true/oui/x) : joueur chasseur
+                                       de primes / détenteur du jeton du tournoi
+
+Le fichier est lu ligne à ligne : la mémoire utilisée ne dépend que de la taille
+d'un lot. Chaque lot (chunk_size lignes au plus, tournois complets) est validé
+en une fois (joueurs et doublons en requêtes groupées), puis écrit dans sa
+propre transaction : tournois, participations en un seul executemany et
+player_stats. Un tournoi dont une ligne est invalide est rejeté en entier ;
+un tournoi déjà présent (même nom et même date dans la ligue) est ignoré,
+ce qui permet de relancer un import interrompu.
+"""
+import csv
+import json
+import logging
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import insert, or_
+from sqlalchemy.orm import Session
+
+from ..models.archive import ArchivedTournament
+from ..models.configuration import TournamentConfiguration
+from ..models.models import Tournament, TournamentParticipation, TournamentStatus, TournamentType, User
+from . import stats as stats_crud
+
+logger = logging.getLogger(__name__)
+
+# Erreurs détaillées conservées dans le rapport (les suivantes sont seulement comptées)
+MAX_REPORTED_ERRORS = 100
+# Garde-fou : lignes maximum pour un tournoi (sinon le fichier n'est pas trié par tournoi)
+MAX_ROWS_PER_TOURNAMENT = 500
+
+_TRUE_VALUES = {"1", "true", "oui", "yes", "x"}
+
+
+class ImportReport:
+    """
+    Avancement et résultat d'un import
+    """
+
+    def __init__(self):
+        self.rows_read = 0
+        self.tournaments_imported = 0
+        self.tournaments_skipped = 0  # Déjà présents en base
+        self.tournaments_rejected = 0
+        self.participations_imported = 0
+        self.error_count = 0
+        self.errors: List[Dict] = []
+        self.updated_user_ids = set()
+
+    def add_error(self, line: int, message: str):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "message": message})
+
+    def to_dict(self) -> Dict:
+        return {
+            "rows_read": self.rows_read,
+            "tournaments_imported": self.tournaments_imported,
+            "tournaments_skipped": self.tournaments_skipped,
+            "tournaments_rejected": self.tournaments_rejected,
+            "participations_imported": self.participations_imported,
+            "error_count": self.error_count,
+            "errors": self.errors
+        }
+
+
+class _ImportedTournament:
+    """Lignes d'un tournoi du fichier, validées"""
+
+    def __init__(self, line: int, key: str, rows: List[Tuple[int, Dict]]):
+        self.line = line
+        self.key = key
+        self.rows = rows
+        self.tournament: Optional[Tournament] = None
+        self.results: List[Dict] = []
+
+
+def iter_csv_rows(lines: Iterable[str]) -> Iterator[Tuple[int, Dict]]:
+    """Lignes d'un CSV (en-tête obligatoire) avec leur numéro dans le fichier"""
+    reader = csv.DictReader(lines)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def iter_ndjson_rows(lines: Iterable[str]) -> Iterator[Tuple[int, Dict]]:
+    """Objets JSON, un par ligne (lignes vides ignorées)"""
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            row = {"_error": f"JSON invalide : {e}"}
+        if not isinstance(row, dict):
+            row = {"_error": "Objet JSON attendu"}
+        yield line_number, row
+
+
+def _value(row: Dict, field: str) -> str:
+    value = row.get(field)
+    return "" if value is None else str(value).strip()
+
+
+def _group_tournaments(rows: Iterable[Tuple[int, Dict]], report: ImportReport) -> Iterator[_ImportedTournament]:
+    """Regroupe les lignes consécutives d'un même tournoi"""
+    current: Optional[_ImportedTournament] = None
+    for line, row in rows:
+        report.rows_read += 1
+        key = _value(row, "tournament_ref") or f"{_value(row, 'tournament_name')}@{_value(row, 'date')}"
+        if current is not None and current.key != key:
+            yield current
+            current = None
+        if current is None:
+            current = _ImportedTournament(line, key, [])
+        if len(current.rows) < MAX_ROWS_PER_TOURNAMENT:
+            current.rows.append((line, row))
+        elif len(current.rows) == MAX_ROWS_PER_TOURNAMENT:
+            current.rows.append((line, {"_error": f"Plus de {MAX_ROWS_PER_TOURNAMENT} lignes pour un tournoi"}))
+    if current is not None:
+        yield current
+
+
+def _validate(imported: _ImportedTournament) -> List[Tuple[int, str]]:
+    """
+    Valide les lignes d'un tournoi et prépare ses résultats (joueurs non résolus)
+    """
+    # Lignes illisibles (JSON invalide, tournoi trop long) : rejet avec leur propre message
+    errors = [(line, row["_error"]) for line, row in imported.rows if "_error" in row]
+    if errors:
+        return errors
+
+    first_line, first = imported.rows[0]
+    try:
+        tournament_type = TournamentType(_value(first, "tournament_type").upper())
+        date = datetime.fromisoformat(_value(first, "date"))
+        buy_in = float(_value(first, "buy_in"))
+        if buy_in <= 0:
+            raise ValueError("buy_in doit être positif")
+        name = _value(first, "tournament_name")
+        if not 3 <= len(name) <= 100:
+            raise ValueError("tournament_name doit contenir entre 3 et 100 caractères")
+    except ValueError as e:
+        return [(first_line, f"Tournoi invalide : {e}")]
+
+    seen_players, seen_positions = set(), set()
+    for line, row in imported.rows:
+        try:
+            player = _value(row, "player")
+            if not player:
+                raise ValueError("player manquant")
+            position = int(_value(row, "position"))
+            if position < 1:
+                raise ValueError("position doit être supérieure ou égale à 1")
+            prize_won = float(_value(row, "prize_won") or 0)
+            num_rebuys = int(_value(row, "num_rebuys") or 0)
+            if prize_won < 0 or num_rebuys < 0:
+                raise ValueError("prize_won et num_rebuys ne peuvent pas être négatifs")
+        except ValueError as e:
+            errors.append((line, str(e)))
+            continue
+        if player.lower() in seen_players:
+            errors.append((line, f"Joueur en double dans le tournoi : {player}"))
+        if position in seen_positions:
+            errors.append((line, f"Position en double dans le tournoi : {position}"))
+        seen_players.add(player.lower())
+        seen_positions.add(position)
+        imported.results.append({
+            "line": line,
+            "player": player,
+            "position": position,
+            "prize_won": prize_won,
+            "num_rebuys": num_rebuys,
+            "bounty_hunter": _value(row, "bounty_hunter").lower() in _TRUE_VALUES,
+            "clay_token": _value(row, "clay_token").lower() in _TRUE_VALUES
+        })
+
+    imported.tournament = Tournament(
+        name=name,
+        tournament_type=tournament_type,
+        date=date,
+        buy_in=buy_in
+    )
+    return errors
+
+
+def _default_configurations(db: Session) -> Dict[str, Tuple[int, Optional[int]]]:
+    """(configuration_id, sound_configuration_id) par défaut de chaque type de tournoi"""
+    configurations = {}
+    for configuration in db.query(
+        TournamentConfiguration.id,
+        TournamentConfiguration.tournament_type,
+        TournamentConfiguration.sound_configuration_id
+    ).filter(TournamentConfiguration.is_default.is_(True)).order_by(TournamentConfiguration.id):
+        configurations.setdefault(
+            configuration.tournament_type,
+            (configuration.id, configuration.sound_configuration_id)
+        )
+    return configurations
+
+
+def _import_chunk(
+    db: Session,
+    league_id: int,
+    admin_id: int,
+    configurations: Dict[str, Tuple[int, Optional[int]]],
+    chunk: List[_ImportedTournament],
+    report: ImportReport
+):
+    valid = []
+    for imported in chunk:
+        errors = _validate(imported)
+        if errors:
+            report.tournaments_rejected += 1
+            for line, message in errors:
+                report.add_error(line, message)
+        else:
+            valid.append(imported)
+
+    # Résolution des joueurs du lot en une requête (pseudo ou email, membres de la ligue)
+    players = {result["player"] for imported in valid for result in imported.results}
+    users = {}
+    if players:
+        for user in db.query(User.id, User.username, User.email).filter(
+            User.league_id == league_id,
+            or_(User.username.in_(players), User.email.in_(players))
+        ):
+            users[user.username] = user.id
+            users[user.email] = user.id
+
+    # Tournois déjà importés (même nom et même date), tables courante et archive
+    names = {imported.tournament.name for imported in valid}
+    existing = set()
+    if names:
+        for model in (Tournament, ArchivedTournament):
+            existing.update(
+                (row.name, row.date.replace(tzinfo=None))
+                for row in db.query(model.name, model.date).filter(
+                    model.league_id == league_id,
+                    model.name.in_(names)
+                )
+            )
+
+    to_insert = []
+    for imported in valid:
+        tournament = imported.tournament
+        if (tournament.name, tournament.date.replace(tzinfo=None)) in existing:
+            report.tournaments_skipped += 1
+            continue
+        unknown = [result for result in imported.results if result["player"] not in users]
+        if unknown:
+            report.tournaments_rejected += 1
+            for result in unknown:
+                report.add_error(result["line"], f"Joueur inconnu dans la ligue : {result['player']}")
+            continue
+        configuration = configurations.get(tournament.tournament_type.value)
+        if configuration is None:
+            report.tournaments_rejected += 1
+            report.add_error(imported.line, f"Aucune configuration par défaut pour {tournament.tournament_type.value}")
+            continue
+        existing.add((tournament.name, tournament.date.replace(tzinfo=None)))
+
+        for result in imported.results:
+            result["user_id"] = users[result["player"]]
+            result["total_buyin"] = tournament.buy_in * (1 + result["num_rebuys"])
+        total_buyin = sum(result["total_buyin"] for result in imported.results)
+        tournament.status = TournamentStatus.COMPLETED
+        tournament.start_time = tournament.end_time = tournament.date
+        tournament.league_id = league_id
+        tournament.admin_id = admin_id
+        tournament.configuration_id, tournament.sound_configuration_id = configuration
+        tournament.max_players = max(2, len(imported.results))
+        tournament.registered_count = len(imported.results)
+        tournament.total_buyin = tournament.prize_pool = total_buyin
+        tournament.total_rebuys = sum(result["num_rebuys"] for result in imported.results)
+        tournament.tables_state = {}
+        tournament.bounty_hunter_id = next(
+            (result["user_id"] for result in imported.results if result["bounty_hunter"]), None
+        )
+        tournament.clay_token_holder_id = next(
+            (result["user_id"] for result in imported.results if result["clay_token"]), None
+        )
+        to_insert.append(imported)
+
+    if not to_insert:
+        return
+
+    # Tournois : une insertion par tournoi (identifiant généré nécessaire)
+    db.add_all([imported.tournament for imported in to_insert])
+    db.flush()
+
+    # Participations du lot : un seul executemany
+    participations = [
+        {
+            "tournament_id": imported.tournament.id,
+            "user_id": result["user_id"],
+            "is_registered": True,
+            "is_active": False,
+            "registration_time": imported.tournament.date,
+            "elimination_time": imported.tournament.date,
+            "current_position": result["position"],
+            "num_rebuys": result["num_rebuys"],
+            "total_buyin": result["total_buyin"],
+            "prize_won": result["prize_won"]
+        }
+        for imported in to_insert
+        for result in imported.results
+    ]
+    db.execute(insert(TournamentParticipation), participations)
+
+    report.updated_user_ids.update(stats_crud.apply_tournament_results_to_stats(db, [
+        (
+            imported.tournament,
+            [
+                (result["user_id"], result["position"], result["total_buyin"], result["prize_won"])
+                for result in imported.results
+            ]
+        )
+        for imported in to_insert
+    ]))
+
+    report.tournaments_imported += len(to_insert)
+    report.participations_imported += len(participations)
+
+
+def _flush_chunk(
+    db: Session,
+    league_id: int,
+    admin_id: int,
+    configurations: Dict[str, Tuple[int, Optional[int]]],
+    chunk: List[_ImportedTournament],
+    report: ImportReport,
+    progress: Optional[Callable[[ImportReport], None]]
+):
+    """
+    Écrit un lot dans sa propre transaction puis signale l'avancement.
+    En cas d'échec, le rapport ne compte que les lots déjà commités.
+    """
+    imported = (report.tournaments_imported, report.participations_imported, set(report.updated_user_ids))
+    try:
+        _import_chunk(db, league_id, admin_id, configurations, chunk, report)
+        db.commit()
+    except Exception:
+        db.rollback()
+        report.tournaments_imported, report.participations_imported, report.updated_user_ids = imported
+        raise
+    if progress is not None:
+        progress(report)
+
+
+def import_results(
+    db: Session,
+    league_id: int,
+    admin_id: int,
+    rows: Iterable[Tuple[int, Dict]],
+    chunk_size: int = 1000,
+    progress: Optional[Callable[[ImportReport], None]] = None,
+    report: Optional[ImportReport] = None
+) -> ImportReport:
+    """
+    Importe des résultats historiques lus en flux, par lots validés et commités.
+    Si l'import s'interrompt (lecture du fichier, base de données), les lots déjà
+    commités restent en base : `report` fourni par l'appelant indique ce qui l'a été.
+
+    Args:
+        db (Session): Session de base de données
+        league_id (int): Ligue des tournois importés
+        admin_id (int): Administrateur attribué aux tournois importés
+        rows: Lignes numérotées (iter_csv_rows ou iter_ndjson_rows)
+        chunk_size (int): Nombre de lignes par transaction (tournois complets)
+        progress: Appelée après chaque lot avec le rapport courant
+        report: Rapport à compléter (un nouveau rapport par défaut)
+
+    Returns:
+        ImportReport: Compteurs et erreurs (les MAX_REPORTED_ERRORS premières)
+    """
+    if report is None:
+        report = ImportReport()
+    configurations = _default_configurations(db)
+
+    chunk: List[_ImportedTournament] = []
+    chunk_rows = 0
+    for imported in _group_tournaments(rows, report):
+        chunk.append(imported)
+        chunk_rows += len(imported.rows)
+        if chunk_rows >= chunk_size:
+            _flush_chunk(db, league_id, admin_id, configurations, chunk, report, progress)
+            chunk, chunk_rows = [], 0
+    if chunk:
+        _flush_chunk(db, league_id, admin_id, configurations, chunk, report, progress)
+
+    return report
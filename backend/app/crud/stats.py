@@ -0,0 +1,372 @@
+# backend/app/crud/stats.py
+from sqlalchemy.orm import Session
+from sqlalchemy import func, desc, insert, update, bindparam
+from typing import Optional, List, Dict, Tuple
+
+from ..models.models import Tournament, TournamentParticipation, TournamentStatus, User
+from ..models.archive import ArchivedTournament, ArchivedParticipation
+from ..models.stats import PlayerStats
+
+# Part du prize pool attribuée au chasseur de primes
+BOUNTY_SHARE = 0.1
+
+# Colonnes cumulables de PlayerStats
+COUNTER_FIELDS = (
+    "games_played", "victories", "itm_count", "positions_sum", "positions_count",
+    "total_buyin", "total_earnings", "bounty_count", "bounty_earnings", "clay_token_wins",
+    "season_points"
+)
+
+
+def season_of(tournament_date) -> int:
+    """
+    Saison d'un tournoi (année civile de sa date)
+    """
+    return tournament_date.year
+
+
+def _empty_counters() -> Dict[str, float]:
+    return {field: 0 for field in COUNTER_FIELDS}
+
+
+def points_for_position(position: Optional[int], num_players: int) -> int:
+    """
+    Points de championnat : le dernier marque 1 point, le vainqueur autant que de joueurs
+    """
+    if position is None or position < 1 or position > num_players:
+        return 0
+    return num_players - position + 1
+
+
+def _participation_counters(
+    position: Optional[int],
+    total_buyin: float,
+    prize_won: float,
+    num_players: int
+) -> Dict[str, float]:
+    """
+    Contribution d'une participation aux compteurs d'un joueur
+    """
+    counters = _empty_counters()
+    counters["season_points"] = points_for_position(position, num_players)
+    counters["games_played"] = 1
+    counters["total_buyin"] = total_buyin or 0
+    counters["total_earnings"] = prize_won or 0
+    if prize_won:
+        counters["itm_count"] = 1
+    if position is not None:
+        counters["positions_sum"] = position
+        counters["positions_count"] = 1
+        if position == 1:
+            counters["victories"] = 1
+    return counters
+
+
+def _tournament_contributions(
+    tournament: Tournament,
+    participations: List[Tuple[int, Optional[int], float, float]]
+) -> Dict[int, Dict[str, float]]:
+    """
+    Calcule les incréments par joueur pour un tournoi terminé.
+    participations : liste de (user_id, position, total_buyin, prize_won)
+    """
+    contributions: Dict[int, Dict[str, float]] = {}
+
+    for user_id, position, total_buyin, prize_won in participations:
+        counters = contributions.setdefault(user_id, _empty_counters())
+        counters_delta = _participation_counters(position, total_buyin, prize_won, len(participations))
+        for field, value in counters_delta.items():
+            counters[field] += value
+
+    if tournament.bounty_hunter_id:
+        counters = contributions.setdefault(tournament.bounty_hunter_id, _empty_counters())
+        counters["bounty_count"] += 1
+        counters["bounty_earnings"] += (tournament.prize_pool or 0) * BOUNTY_SHARE
+
+    if tournament.clay_token_holder_id:
+        counters = contributions.setdefault(tournament.clay_token_holder_id, _empty_counters())
+        counters["clay_token_wins"] += 1
+
+    return contributions
+
+
+def _stats_statements():
+    """
+    Requêtes d'application des incréments, construites une fois :
+    - création des lignes manquantes à zéro, sans erreur si une transaction
+      concurrente vient de créer la même ligne (INSERT IGNORE / INSERT OR IGNORE) ;
+    - incréments calculés par la base (col = col + :delta), comme pour les rebuys :
+      deux clôtures simultanées dans la même ligue et la même saison ne peuvent
+      pas perdre de mise à jour.
+    """
+    stats = PlayerStats.__table__
+    scope = (
+        stats.c.user_id == bindparam("b_user_id"),
+        stats.c.league_id == bindparam("b_league_id"),
+        stats.c.season == bindparam("b_season")
+    )
+    create_missing = insert(stats).prefix_with("IGNORE", dialect="mysql").prefix_with("OR IGNORE", dialect="sqlite")
+    increment = update(stats).where(*scope).values({
+        field: stats.c[field] + bindparam(f"d_{field}") for field in COUNTER_FIELDS
+    })
+    return create_missing, increment
+
+
+_CREATE_MISSING_STATS, _INCREMENT_STATS = _stats_statements()
+
+
+def _apply_contributions(
+    db: Session,
+    league_id: int,
+    season: int,
+    contributions: Dict[int, Dict[str, float]]
+) -> None:
+    """
+    Crée les lignes manquantes puis ajoute les incréments par des UPDATE atomiques
+    (deux requêtes executemany, joueurs dans l'ordre des identifiants pour que
+    deux transactions verrouillent les lignes dans le même ordre)
+    """
+    if not contributions:
+        return
+
+    user_ids = sorted(contributions)
+    db.execute(_CREATE_MISSING_STATS, [
+        dict(user_id=user_id, league_id=league_id, season=season, **_empty_counters())
+        for user_id in user_ids
+    ])
+    db.execute(_INCREMENT_STATS, [
+        {
+            "b_user_id": user_id,
+            "b_league_id": league_id,
+            "b_season": season,
+            **{f"d_{field}": contributions[user_id][field] for field in COUNTER_FIELDS}
+        }
+        for user_id in user_ids
+    ])
+
+
+def apply_tournament_to_stats(db: Session, tournament: Tournament) -> List[int]:
+    """
+    Met à jour player_stats avec les résultats d'un tournoi qui vient d'être terminé.
+    Ne fait pas de commit : doit être appelé dans la transaction qui clôture le tournoi.
+
+    Args:
+        db (Session): Session de base de données
+        tournament (Tournament): Tournoi terminé
+
+    Returns:
+        List[int]: IDs des joueurs dont les statistiques ont changé
+    """
+    participations = db.query(
+        TournamentParticipation.user_id,
+        TournamentParticipation.current_position,
+        TournamentParticipation.total_buyin,
+        TournamentParticipation.prize_won
+    ).filter(TournamentParticipation.tournament_id == tournament.id).all()
+
+    contributions = _tournament_contributions(tournament, participations)
+    _apply_contributions(db, tournament.league_id, season_of(tournament.date), contributions)
+    return list(contributions.keys())
+
+
+def apply_tournament_results_to_stats(
+    db: Session,
+    results: List[Tuple[Tournament, List[Tuple[int, Optional[int], float, float]]]]
+) -> List[int]:
+    """
+    Met à jour player_stats pour un lot de tournois terminés dont les participations
+    sont déjà connues (import de l'historique) : deux requêtes par (ligue, saison).
+    Ne fait pas de commit.
+
+    Args:
+        results: liste de (tournoi, [(user_id, position, total_buyin, prize_won), ...])
+
+    Returns:
+        List[int]: IDs des joueurs dont les statistiques ont changé
+    """
+    by_scope: Dict[Tuple[int, int], Dict[int, Dict[str, float]]] = {}
+    for tournament, participations in results:
+        scope = by_scope.setdefault((tournament.league_id, season_of(tournament.date)), {})
+        for user_id, counters in _tournament_contributions(tournament, participations).items():
+            total = scope.setdefault(user_id, _empty_counters())
+            for field, value in counters.items():
+                total[field] += value
+
+    user_ids = set()
+    for (league_id, season), contributions in by_scope.items():
+        _apply_contributions(db, league_id, season, contributions)
+        user_ids.update(contributions.keys())
+    return list(user_ids)
+
+
+def move_clay_token_win(
+    db: Session,
+    tournament: Tournament,
+    old_holder_id: Optional[int],
+    new_holder_id: Optional[int]
+) -> None:
+    """
+    Reporte dans player_stats le changement de détenteur du jeton d'un tournoi déjà terminé.
+    Ne fait pas de commit.
+    """
+    contributions: Dict[int, Dict[str, float]] = {}
+    if old_holder_id:
+        contributions.setdefault(old_holder_id, _empty_counters())["clay_token_wins"] -= 1
+    if new_holder_id:
+        contributions.setdefault(new_holder_id, _empty_counters())["clay_token_wins"] += 1
+    _apply_contributions(db, tournament.league_id, season_of(tournament.date), contributions)
+
+
+def rebuild_player_stats(db: Session, league_id: Optional[int] = None) -> int:
+    """
+    Reconstruit entièrement player_stats depuis l'historique des tournois terminés
+    (tables courantes et archives)
+
+    Args:
+        db (Session): Session de base de données
+        league_id (Optional[int]): Limite la reconstruction à une ligue
+
+    Returns:
+        int: Nombre de lignes de statistiques écrites
+    """
+    tournaments = {}
+    participations_by_tournament: Dict[int, list] = {}
+    for tournament_model, participation_model in (
+        (Tournament, TournamentParticipation),
+        (ArchivedTournament, ArchivedParticipation)
+    ):
+        tournaments_query = db.query(
+            tournament_model.id,
+            tournament_model.league_id,
+            tournament_model.date,
+            tournament_model.prize_pool,
+            tournament_model.bounty_hunter_id,
+            tournament_model.clay_token_holder_id
+        ).filter(tournament_model.status == TournamentStatus.COMPLETED)
+        if league_id is not None:
+            tournaments_query = tournaments_query.filter(tournament_model.league_id == league_id)
+        model_tournaments = {t.id: t for t in tournaments_query.all()}
+        if not model_tournaments:
+            continue
+        tournaments.update(model_tournaments)
+
+        # Regroupement des participations par tournoi (une seule requête par table)
+        participations = db.query(
+            participation_model.tournament_id,
+            participation_model.user_id,
+            participation_model.current_position,
+            participation_model.total_buyin,
+            participation_model.prize_won
+        ).filter(participation_model.tournament_id.in_(model_tournaments.keys())).all()
+        for p in participations:
+            participations_by_tournament.setdefault(p.tournament_id, []).append(
+                (p.user_id, p.current_position, p.total_buyin, p.prize_won)
+            )
+
+    # Agrégation en mémoire par (joueur, ligue, saison)
+    aggregates: Dict[Tuple[int, int, int], Dict[str, float]] = {}
+    for tournament in tournaments.values():
+        contributions = _tournament_contributions(
+            tournament, participations_by_tournament.get(tournament.id, [])
+        )
+        scope = (tournament.league_id, season_of(tournament.date))
+        for user_id, counters in contributions.items():
+            total = aggregates.setdefault((user_id,) + scope, _empty_counters())
+            for field, value in counters.items():
+                total[field] += value
+
+    delete_query = db.query(PlayerStats)
+    if league_id is not None:
+        delete_query = delete_query.filter(PlayerStats.league_id == league_id)
+    delete_query.delete(synchronize_session=False)
+
+    db.bulk_insert_mappings(PlayerStats, [
+        dict(user_id=user_id, league_id=scope_league, season=season, **counters)
+        for (user_id, scope_league, season), counters in aggregates.items()
+    ])
+    db.commit()
+
+    return len(aggregates)
+
+
+def get_user_statistics(
+    db: Session,
+    user_id: int,
+    league_id: Optional[int] = None,
+    season: Optional[int] = None
+) -> Dict[str, float]:
+    """
+    Statistiques cumulées d'un joueur (somme de ses quelques lignes player_stats)
+    """
+    query = db.query(*[func.coalesce(func.sum(getattr(PlayerStats, field)), 0) for field in COUNTER_FIELDS]) \
+        .filter(PlayerStats.user_id == user_id)
+    if league_id is not None:
+        query = query.filter(PlayerStats.league_id == league_id)
+    if season is not None:
+        query = query.filter(PlayerStats.season == season)
+
+    totals = dict(zip(COUNTER_FIELDS, query.one()))
+    total_buyin = totals["total_buyin"]
+    total_earnings = totals["total_earnings"]
+
+    return {
+        "total_games": totals["games_played"],
+        "total_earnings": total_earnings,
+        "roi": ((total_earnings - total_buyin) / total_buyin * 100) if total_buyin > 0 else 0,
+        "average_position": (totals["positions_sum"] / totals["positions_count"]) if totals["positions_count"] else 0,
+        "victories": totals["victories"],
+        "itm_count": totals["itm_count"],
+        "bounties": totals["bounty_count"],
+        "clay_token_wins": totals["clay_token_wins"],
+        "season_points": totals["season_points"]
+    }
+
+
+def get_bounty_hunters_ranking(
+    db: Session,
+    limit: int = 10,
+    league_id: Optional[int] = None,
+    season: Optional[int] = None
+):
+    """
+    Classement des chasseurs de primes, lu depuis player_stats
+    """
+    bounty_count = func.sum(PlayerStats.bounty_count).label('bounty_count')
+    bounty_earnings = func.sum(PlayerStats.bounty_earnings).label('bounty_earnings')
+
+    query = db.query(User, bounty_count, bounty_earnings) \
+        .join(PlayerStats, PlayerStats.user_id == User.id) \
+        .filter(PlayerStats.bounty_count > 0)
+    if league_id is not None:
+        query = query.filter(PlayerStats.league_id == league_id)
+    if season is not None:
+        query = query.filter(PlayerStats.season == season)
+
+    return query.group_by(User.id) \
+        .order_by(desc('bounty_count'), desc('bounty_earnings')) \
+        .limit(limit) \
+        .all()
+
+
+def list_league_player_stats(
+    db: Session,
+    league_id: int,
+    season: Optional[int] = None
+) -> List[Dict[str, float]]:
+    """
+    Statistiques cumulées de chaque joueur d'une ligue (pour la page de statistiques),
+    avec son nom et son avatar
+    """
+    query = db.query(
+        PlayerStats.user_id,
+        User.username,
+        User.profile_image_path,
+        *[func.sum(getattr(PlayerStats, field)).label(field) for field in COUNTER_FIELDS]
+    ).join(User, User.id == PlayerStats.user_id).filter(PlayerStats.league_id == league_id)
+    if season is not None:
+        query = query.filter(PlayerStats.season == season)
+
+    return [
+        row._asdict()
+        for row in query.group_by(PlayerStats.user_id, User.username, User.profile_image_path).all()
+    ]
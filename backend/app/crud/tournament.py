@@ -1,12 +1,59 @@
 # backend/app/crud/tournament.py
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, desc
+from sqlalchemy import and_, or_, desc, func, select, insert, exists, case
+from sqlalchemy.exc import IntegrityError
 from typing import Optional, List, Dict
 from datetime import datetime
 
 from ..models.models import Tournament, TournamentParticipation, TournamentStatus, TournamentType
 from ..schemas.schemas import TournamentCreate, TournamentUpdate, ParticipationCreate, ParticipationUpdate
 from ..models.models import User
+from . import stats as stats_crud
+from .events import record_event
+from ..models.events import TournamentEventType
+
+class TournamentVersionConflict(Exception):
+    """
+    Le tournoi a été modifié (par un autre appareil) depuis la version connue du client
+    """
+
+    def __init__(self, tournament_id: int, expected_version: Optional[int] = None):
+        super().__init__(f"Tournoi {tournament_id} modifié (version attendue : {expected_version})")
+        self.tournament_id = tournament_id
+        self.expected_version = expected_version
+
+
+def check_version(tournament: Tournament, expected_version: Optional[int]):
+    """
+    Vérifie la précondition If-Match (aucune vérification si expected_version est None).
+    La concurrence entre cette lecture et le commit est couverte par version_id_col.
+    """
+    if expected_version is not None and tournament.version != expected_version:
+        raise TournamentVersionConflict(tournament.id, expected_version)
+
+
+def get_tournament_state(db: Session, tournament_id: int) -> Optional[Dict]:
+    """
+    État courant d'un tournoi (renvoyé avec une réponse 409 pour resynchroniser le client)
+    """
+    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
+    if not tournament:
+        return None
+    return {
+        "id": tournament.id,
+        "version": tournament.version,
+        "status": tournament.status.value,
+        "current_level": tournament.current_level,
+        "seconds_remaining": tournament.seconds_remaining,
+        "level_duration": tournament.level_duration,
+        "paused": tournament.paused_at is not None,
+        "paused_at": tournament.paused_at.isoformat() if tournament.paused_at else None,
+        "last_timer_update": tournament.last_timer_update.isoformat() if tournament.last_timer_update else None,
+        "tables_state": tournament.tables_state or {},
+        "registered_count": tournament.registered_count,
+        "clay_token_holder_id": tournament.clay_token_holder_id
+    }
+
 
 def create_tournament(db: Session, tournament: TournamentCreate, admin_id: int) -> Tournament:
     """
@@ -80,82 +127,236 @@ def list_tournaments(
 
     return query.offset(skip).limit(limit).all()
 
+# Statut de départ requis pour chaque statut cible
+_STATUS_TRANSITIONS = {
+    TournamentStatus.IN_PROGRESS: TournamentStatus.PLANNED,
+    TournamentStatus.COMPLETED: TournamentStatus.IN_PROGRESS
+}
+
 def update_tournament_status(
     db: Session, 
     tournament_id: int, 
     new_status: TournamentStatus, 
-    admin_id: int
+    admin_id: int,
+    expected_version: Optional[int] = None
 ) -> Optional[Tournament]:
     """
-    Met à jour le statut d'un tournoi
+    Met à jour le statut d'un tournoi.
+    Le tournoi déjà chargé par la route (dépendance load_tournament) est relu
+    dans l'identity map de la session, sans nouvelle requête.
+
+    Seules les transitions PLANNED -> IN_PROGRESS et IN_PROGRESS -> COMPLETED
+    sont acceptées : un tournoi terminé ne repasse jamais par la fin et ses
+    statistiques ne sont appliquées qu'une fois.
+
+    Raises:
+        ValueError: Transition de statut refusée
     """
-    tournament = get_tournament(db, tournament_id)
+    tournament = db.query(Tournament).get(tournament_id)
     
     if not tournament or tournament.admin_id != admin_id:
         return None
-        
+    check_version(tournament, expected_version)
+
+    if _STATUS_TRANSITIONS.get(new_status) != tournament.status:
+        raise ValueError(
+            f"Transition de statut impossible : {tournament.status.value} -> {new_status.value}"
+        )
+
     if new_status == TournamentStatus.IN_PROGRESS:
         tournament.start_time = datetime.utcnow()
+        record_event(db, tournament_id, TournamentEventType.STARTED)
     elif new_status == TournamentStatus.COMPLETED:
         tournament.end_time = datetime.utcnow()
-        
+        # Mise à jour des statistiques dans la même transaction
+        stats_crud.apply_tournament_to_stats(db, tournament)
+        record_event(db, tournament_id, TournamentEventType.COMPLETED)
+
     tournament.status = new_status
     db.commit()
     db.refresh(tournament)
     return tournament
 
-def register_player(db: Session, tournament_id: int, user_id: int) -> TournamentParticipation:
+def _registration_error(db: Session, tournament_id: int, user_id: int) -> str:
     """
-    Inscrit un joueur à un tournoi
+    Raison d'un refus d'inscription (chemin d'échec uniquement : requêtes de diagnostic)
     """
-    tournament = get_tournament(db, tournament_id)
-    print("tournament = " + str(tournament))
+    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
     if not tournament or tournament.status != TournamentStatus.PLANNED:
-        raise ValueError("Tournoi non trouvé ou inscriptions closes")
+        return "Tournoi non trouvé ou inscriptions closes"
 
-    # Vérifier que le tournoi et l'utilisateur existent et sont dans la même ligue
-    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
     user = db.query(User).filter(User.id == user_id).first()
-    print("user = " + str(user))
+    if not user:
+        return "Utilisateur non trouvé"
+    if user.league_id != tournament.league_id:
+        return "L'utilisateur doit appartenir à la même ligue que le tournoi"
 
-    if not tournament or not user:
-        raise ValueError("Utilisateur non trouvé")
+    return "Nombre maximum de joueurs atteint"
 
-    if user.league_id != tournament.league_id:
-        raise ValueError("L'utilisateur doit appartenir à la même ligue que le tournoi")
 
+def register_player(db: Session, tournament_id: int, user_id: int) -> int:
+    """
+    Inscrit un joueur à un tournoi en trois requêtes, sans lecture préalable :
 
-    # Vérifier si le joueur n'est pas déjà inscrit
-    existing = db.query(TournamentParticipation).filter(
-        and_(
-            TournamentParticipation.tournament_id == tournament_id,
-            TournamentParticipation.user_id == user_id
+    1. UPDATE conditionnel du compteur d'inscrits (tournoi PLANNED, même ligue
+       que le joueur, places restantes) : deux inscriptions concurrentes ne
+       peuvent pas dépasser max_players. Il réserve aussi le numéro de
+       l'événement REGISTERED.
+    2. INSERT de la participation : la contrainte unique (tournament_id, user_id)
+       rejette les doublons et l'annulation de la transaction rend la place.
+    3. INSERT de l'événement REGISTERED, écrit au commit dans la même transaction.
+
+    Returns:
+        int: ID de la participation créée
+    """
+    user_league = select(User.league_id).where(User.id == user_id).scalar_subquery()
+    reserved = db.query(Tournament).filter(
+        Tournament.id == tournament_id,
+        Tournament.status == TournamentStatus.PLANNED,
+        Tournament.league_id == user_league,
+        Tournament.registered_count < Tournament.max_players
+    ).update(
+        {
+            Tournament.registered_count: Tournament.registered_count + 1,
+            Tournament.event_seq: Tournament.event_seq + 1  # Numéro de l'événement REGISTERED
+        },
+        synchronize_session=False
+    )
+    if not reserved:
+        db.rollback()
+        raise ValueError(_registration_error(db, tournament_id, user_id))
+
+    try:
+        result = db.execute(
+            insert(TournamentParticipation).values(
+                tournament_id=tournament_id,
+                user_id=user_id,
+                total_buyin=select(Tournament.buy_in).where(Tournament.id == tournament_id).scalar_subquery()
+            )
         )
-    ).first()
-    print("existing = " + str(existing))
-    if existing:
+        record_event(db, tournament_id, TournamentEventType.REGISTERED, user_id=user_id, seq_reserved=True)
+        db.commit()
+    except IntegrityError:
+        db.rollback()
         raise ValueError("Joueur déjà inscrit")
-        
-    # Vérifier le nombre maximum de joueurs
-    current_players = db.query(TournamentParticipation).filter(
-        TournamentParticipation.tournament_id == tournament_id
-    ).count()
-    
-    if current_players >= tournament.max_players:
-        raise ValueError("Nombre maximum de joueurs atteint")
-        
-    # Créer la participation
-    participation = TournamentParticipation(
-        tournament_id=tournament_id,
-        user_id=user_id,
-        total_buyin=tournament.buy_in
+
+    return result.inserted_primary_key[0]
+
+
+def sync_registered_counts(db: Session) -> int:
+    """
+    Recalcule registered_count depuis les participations (reprise de données existantes)
+
+    Returns:
+        int: Nombre de tournois mis à jour
+    """
+    participants = select(func.count(TournamentParticipation.id)).where(
+        TournamentParticipation.tournament_id == Tournament.id
+    ).scalar_subquery()
+    updated = db.query(Tournament).update(
+        {Tournament.registered_count: participants},
+        synchronize_session=False
     )
-    print("participation = " + str(participation))
-    db.add(participation)
     db.commit()
-    db.refresh(participation)
-    
-    return participation
+    return updated
+
+
+def register_players(db: Session, tournament_id: int, user_ids: List[int]) -> List[Dict]:
+    """
+    Inscrit un lot de joueurs à un tournoi en une transaction.
+    Les vérifications sont ensemblistes (une requête pour tous les joueurs) :
+    le nombre de requêtes SQL ne dépend pas de la taille du lot.
+
+    Args:
+        db (Session): Session de base de données
+        tournament_id (int): ID du tournoi
+        user_ids (List[int]): IDs des joueurs, dans l'ordre de priorité
+
+    Returns:
+        List[Dict]: Un résultat par ID demandé ({user_id, status, detail})
+    """
+    # Lecture dans l'identity map si la route a déjà chargé le tournoi
+    tournament = db.query(Tournament).get(tournament_id)
+    if not tournament or tournament.status != TournamentStatus.PLANNED:
+        raise ValueError("Tournoi non trouvé ou inscriptions closes")
+
+    requested = list(dict.fromkeys(user_ids))
+    league_by_user = dict(
+        db.query(User.id, User.league_id).filter(User.id.in_(requested)).all()
+    )
+    already_registered = {
+        user_id for (user_id,) in db.query(TournamentParticipation.user_id).filter(
+            TournamentParticipation.tournament_id == tournament_id,
+            TournamentParticipation.user_id.in_(requested)
+        )
+    }
+    remaining_places = tournament.max_players - tournament.registered_count
+
+    results = []
+    new_participations = []
+    seen = set()
+    for user_id in user_ids:
+        if user_id in seen:
+            results.append({"user_id": user_id, "status": "duplicate", "detail": "ID présent plusieurs fois"})
+            continue
+        seen.add(user_id)
+
+        if user_id not in league_by_user:
+            results.append({"user_id": user_id, "status": "user_not_found", "detail": "Utilisateur non trouvé"})
+        elif league_by_user[user_id] != tournament.league_id:
+            results.append({
+                "user_id": user_id,
+                "status": "wrong_league",
+                "detail": "L'utilisateur doit appartenir à la même ligue que le tournoi"
+            })
+        elif user_id in already_registered:
+            results.append({"user_id": user_id, "status": "already_registered", "detail": "Joueur déjà inscrit"})
+        elif len(new_participations) >= remaining_places:
+            results.append({
+                "user_id": user_id,
+                "status": "tournament_full",
+                "detail": "Nombre maximum de joueurs atteint"
+            })
+        else:
+            new_participations.append({
+                "tournament_id": tournament_id,
+                "user_id": user_id,
+                "total_buyin": tournament.buy_in,
+                "action_history": []
+            })
+            results.append({"user_id": user_id, "status": "registered", "detail": None})
+
+    # Réservation des places : échoue si des inscriptions concurrentes ont consommé les places lues
+    if new_participations:
+        reserved = db.query(Tournament).filter(
+            Tournament.id == tournament_id,
+            Tournament.status == TournamentStatus.PLANNED,
+            Tournament.registered_count + len(new_participations) <= Tournament.max_players
+        ).update(
+            {
+                Tournament.registered_count: Tournament.registered_count + len(new_participations),
+                Tournament.event_seq: Tournament.event_seq + len(new_participations)
+            },
+            synchronize_session=False
+        )
+        if not reserved:
+            db.rollback()
+            raise ValueError("Places modifiées par des inscriptions simultanées, veuillez réessayer")
+
+        # Une seule requête INSERT (executemany) et un seul commit
+        try:
+            db.bulk_insert_mappings(TournamentParticipation, new_participations)
+            for participation in new_participations:
+                record_event(
+                    db, tournament_id, TournamentEventType.REGISTERED,
+                    user_id=participation["user_id"], seq_reserved=True
+                )
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise ValueError("Inscriptions simultanées des mêmes joueurs, veuillez réessayer")
+
+    return results
 
 
 def unregister_player(db: Session, tournament_id: int, user_id: int) -> bool:
@@ -170,30 +371,35 @@ def unregister_player(db: Session, tournament_id: int, user_id: int) -> bool:
     Returns:
         bool: True si la désinscription a réussi, False sinon
     """
-    # Vérifier que le tournoi existe et est en phase PLANNED
-    tournament = db.query(Tournament).filter(
+    # Suppression de la participation, uniquement si le tournoi est en phase PLANNED
+    planned = exists().where(
         Tournament.id == tournament_id,
         Tournament.status == TournamentStatus.PLANNED
-    ).first()
-
-    if not tournament:
-        return False
-
-    # Trouver la participation de l'utilisateur
-    participation = db.query(TournamentParticipation).filter(
+    )
+    deleted = db.query(TournamentParticipation).filter(
         TournamentParticipation.tournament_id == tournament_id,
-        TournamentParticipation.user_id == user_id
-    ).first()
+        TournamentParticipation.user_id == user_id,
+        planned
+    ).delete(synchronize_session=False)
 
-    if not participation:
+    if not deleted:
+        db.rollback()
         return False
 
-    # Supprimer la participation
-    db.delete(participation)
+    # Libération de la place dans la même transaction
+    db.query(Tournament).filter(Tournament.id == tournament_id).update(
+        {
+            Tournament.registered_count: Tournament.registered_count - deleted,
+            Tournament.event_seq: Tournament.event_seq + 1
+        },
+        synchronize_session=False
+    )
+    record_event(db, tournament_id, TournamentEventType.UNREGISTERED, user_id=user_id, seq_reserved=True)
     db.commit()
 
     return True
 
+
 def process_elimination(
     db: Session,
     tournament_id: int,
@@ -202,8 +408,16 @@ def process_elimination(
     prize_amount: float = 0
 ) -> Optional[TournamentParticipation]:
     """
-    Traite l'élimination d'un joueur
+    Traite l'élimination d'un joueur (tournoi en cours uniquement : le classement
+    d'un tournoi terminé est déjà reporté dans player_stats)
+
+    Raises:
+        ValueError: Tournoi non trouvé ou pas en cours
     """
+    tournament = db.query(Tournament).get(tournament_id)
+    if not tournament or tournament.status != TournamentStatus.IN_PROGRESS:
+        raise ValueError("Tournoi non trouvé ou pas en cours")
+
     participation = db.query(TournamentParticipation).filter(
         and_(
             TournamentParticipation.tournament_id == tournament_id,
@@ -219,11 +433,79 @@ def process_elimination(
     participation.elimination_time = datetime.utcnow()
     participation.current_position = final_position
     participation.prize_won = prize_amount
+    record_event(
+        db, tournament_id, TournamentEventType.ELIMINATED,
+        user_id=player_id, value=final_position, amount=prize_amount
+    )
 
     db.commit()
     db.refresh(participation)
     return participation
 
+def record_results(db: Session, tournament_id: int, results: List[Dict]) -> int:
+    """
+    Enregistre le classement final d'un tournoi en une seule requête UPDATE
+    (CASE sur user_id) et une seule transaction.
+
+    Args:
+        db (Session): Session de base de données
+        tournament_id (int): ID du tournoi
+        results (List[Dict]): [{player_id, position, prize_amount}, ...]
+
+    Returns:
+        int: Nombre de participations mises à jour
+    """
+    player_ids = [result["player_id"] for result in results]
+    positions = [result["position"] for result in results]
+    if len(set(player_ids)) != len(player_ids):
+        raise ValueError("Un joueur apparaît plusieurs fois dans le classement")
+    if len(set(positions)) != len(positions):
+        raise ValueError("Une position est attribuée à plusieurs joueurs")
+
+    tournament = db.query(Tournament).get(tournament_id)
+    if not tournament or tournament.status == TournamentStatus.COMPLETED:
+        raise ValueError("Tournoi non trouvé ou déjà terminé")
+
+    registered = {
+        user_id for (user_id,) in db.query(TournamentParticipation.user_id).filter(
+            TournamentParticipation.tournament_id == tournament_id,
+            TournamentParticipation.user_id.in_(player_ids)
+        )
+    }
+    missing = [player_id for player_id in player_ids if player_id not in registered]
+    if missing:
+        raise ValueError(f"Joueurs non inscrits à ce tournoi : {missing}")
+
+    position_by_player = {result["player_id"]: result["position"] for result in results}
+    prize_by_player = {result["player_id"]: result["prize_amount"] for result in results}
+    # Le vainqueur reste actif, les autres sont éliminés
+    eliminated = [player_id for player_id, position in position_by_player.items() if position != 1]
+    now = datetime.utcnow()
+
+    updated = db.query(TournamentParticipation).filter(
+        TournamentParticipation.tournament_id == tournament_id,
+        TournamentParticipation.user_id.in_(player_ids)
+    ).update(
+        {
+            TournamentParticipation.current_position: case(position_by_player, value=TournamentParticipation.user_id),
+            TournamentParticipation.prize_won: case(prize_by_player, value=TournamentParticipation.user_id),
+            TournamentParticipation.is_active: TournamentParticipation.user_id.notin_(eliminated),
+            TournamentParticipation.elimination_time: case(
+                (TournamentParticipation.user_id.in_(eliminated), now),
+                else_=TournamentParticipation.elimination_time
+            )
+        },
+        synchronize_session=False
+    )
+    # Du dernier au vainqueur, comme des éliminations successives
+    for result in sorted(results, key=lambda result: result["position"], reverse=True):
+        record_event(
+            db, tournament_id, TournamentEventType.FINISHED,
+            user_id=result["player_id"], value=result["position"], amount=result["prize_amount"]
+        )
+    db.commit()
+    return updated
+
 def process_rebuy(
     db: Session,
     tournament_id: int,
@@ -231,48 +513,113 @@ def process_rebuy(
     rebuy_amount: float
 ) -> Optional[TournamentParticipation]:
     """
-    Traite un rebuy pour un joueur
+    Traite un rebuy pour un joueur.
+
+    Les compteurs sont incrémentés par la base (x = x + :montant) et non en
+    Python : deux rebuys simultanés ne peuvent pas perdre de mise à jour.
+    Les lignes sont verrouillées dans l'ordre participation puis tournoi.
     """
-    participation = db.query(TournamentParticipation).filter(
-        and_(
-            TournamentParticipation.tournament_id == tournament_id,
-            TournamentParticipation.user_id == player_id,
-            TournamentParticipation.is_active == True
-        )
-    ).first()
-    
-    if not participation:
+    # Mettre à jour les statistiques du rebuy (joueur encore en jeu uniquement)
+    updated = db.query(TournamentParticipation).filter(
+        TournamentParticipation.tournament_id == tournament_id,
+        TournamentParticipation.user_id == player_id,
+        TournamentParticipation.is_active == True
+    ).update(
+        {
+            TournamentParticipation.num_rebuys: TournamentParticipation.num_rebuys + 1,
+            TournamentParticipation.total_buyin: TournamentParticipation.total_buyin + rebuy_amount
+        },
+        synchronize_session=False
+    )
+    if not updated:
+        db.rollback()
         return None
-        
-    # Mettre à jour les statistiques du rebuy
-    participation.num_rebuys += 1
-    participation.total_buyin += rebuy_amount
-
-    # Mettre à jour les totaux du tournoi
-    tournament = participation.tournament
-    tournament.total_buyin += rebuy_amount
-    tournament.total_rebuys += 1
-    tournament.prize_pool = tournament.total_buyin  # Ou appliquer une formule spécifique
-    
+
+    # Mettre à jour les totaux du tournoi. prize_pool est placé en premier :
+    # MySQL évalue les affectations dans l'ordre et lirait sinon le nouveau total_buyin
+    db.query(Tournament).filter(Tournament.id == tournament_id).update(
+        [
+            (Tournament.prize_pool, Tournament.total_buyin + rebuy_amount),  # Ou appliquer une formule spécifique
+            (Tournament.total_buyin, Tournament.total_buyin + rebuy_amount),
+            (Tournament.total_rebuys, Tournament.total_rebuys + 1),
+            (Tournament.event_seq, Tournament.event_seq + 1)
+        ],
+        synchronize_session=False,
+        update_args={"preserve_parameter_order": True}
+    )
+    record_event(
+        db, tournament_id, TournamentEventType.REBUY,
+        user_id=player_id, amount=rebuy_amount, seq_reserved=True
+    )
     db.commit()
-    db.refresh(participation)
-    return participation
+
+    # Relecture des valeurs écrites (équivalent de RETURNING, absent de MySQL)
+    return db.query(TournamentParticipation).filter(
+        TournamentParticipation.tournament_id == tournament_id,
+        TournamentParticipation.user_id == player_id
+    ).populate_existing().first()
 
 def update_table_state(
     db: Session,
     tournament_id: int,
     new_state: Dict,
-    admin_id: int
+    admin_id: int,
+    expected_version: Optional[int] = None
 ) -> Optional[Tournament]:
     """
     Met à jour l'état des tables
     """
-    tournament = get_tournament(db, tournament_id)
+    tournament = db.query(Tournament).get(tournament_id)
     
     if not tournament or tournament.admin_id != admin_id:
         return None
+    check_version(tournament, expected_version)
         
     tournament.tables_state = new_state
+    record_event(db, tournament_id, TournamentEventType.TABLES_UPDATED, payload=new_state)
+    db.commit()
+    db.refresh(tournament)
+    return tournament
+
+
+def update_clay_token_holder(
+    db: Session,
+    tournament_id: int,
+    player_id: int,
+    expected_version: Optional[int] = None
+) -> Optional[Tournament]:
+    """
+    Met à jour le détenteur du jeton d'argile d'un tournoi JAPT
+
+    Args:
+        db (Session): Session de base de données
+        tournament_id (int): ID du tournoi
+        player_id (int): ID du joueur qui remporte le jeton
+        expected_version (Optional[int]): Version connue du client (If-Match)
+
+    Returns:
+        Optional[Tournament]: Tournoi mis à jour ou None si le joueur n'y participe pas
+    """
+    # Relu dans l'identity map si la route l'a déjà chargé
+    tournament = db.query(Tournament).get(tournament_id)
+    if not tournament or tournament.tournament_type != TournamentType.JAPT:
+        return None
+    check_version(tournament, expected_version)
+
+    participation = db.query(TournamentParticipation.id).filter(
+        TournamentParticipation.tournament_id == tournament_id,
+        TournamentParticipation.user_id == player_id
+    ).first()
+    if not participation:
+        return None
+
+    old_holder_id = tournament.clay_token_holder_id
+    if old_holder_id != player_id and tournament.status == TournamentStatus.COMPLETED:
+        # Les statistiques du tournoi ont déjà été comptabilisées
+        stats_crud.move_clay_token_win(db, tournament, old_holder_id, player_id)
+
+    tournament.clay_token_holder_id = player_id
+    record_event(db, tournament_id, TournamentEventType.CLAY_TOKEN_AWARDED, user_id=player_id)
     db.commit()
     db.refresh(tournament)
     return tournament
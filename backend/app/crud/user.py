@@ -1,12 +1,14 @@
 # backend/app/crud/user.py
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import or_
-import bcrypt
 from typing import Optional
 from pydantic import EmailStr
 from pathlib import Path
 
 from ..config import settings
+from ..services.user_cache import user_cache
+from ..services import password_service
+from . import league as league_crud
 from ..models.models import User, League, LeagueAdmin
 from ..schemas.schemas import UserCreate, UserUpdateProfile
 
@@ -80,9 +82,10 @@ def get_user_by_username(db: Session, username: str) -> Optional[User]:
     """
     return db.query(User).filter(User.username == username).first()
 
-def create_user(db: Session, user: UserCreate) -> User:
+async def create_user(db: Session, user: UserCreate) -> User:
     """
     Crée un nouvel utilisateur
+    Le hachage du mot de passe est exécuté hors de la boucle d'événements
     
     Args:
         db (Session): Session de base de données
@@ -109,10 +112,7 @@ def create_user(db: Session, user: UserCreate) -> User:
             raise ValueError("La ligue spécifiée n'existe pas")
 
     # Hashage du mot de passe
-    hashed_password = bcrypt.hashpw(
-        user.password.encode('utf-8'), 
-        bcrypt.gensalt()
-    ).decode('utf-8')
+    hashed_password = await password_service.hash_password(user.password)
     
     # Création du nouvel utilisateur
     db_user = User(
@@ -153,21 +153,27 @@ def update_user_profile(
         return None
     
     # Mise à jour des champs non-None
-    for field, value in profile_data.dict(exclude_unset=True).items():
+    updates = profile_data.dict(exclude_unset=True)
+    if "league_id" in updates and updates["league_id"] != db_user.league_id:
+        # Changement de ligue : les membres des deux ligues changent
+        league_crud.touch_leagues(db, db_user.league_id, updates["league_id"])
+    for field, value in updates.items():
         setattr(db_user, field, value)
     
     db.commit()
     db.refresh(db_user)
+    user_cache.invalidate_user(user_id=user_id)
     
     return db_user
 
-def authenticate_user(
+async def authenticate_user(
     db: Session, 
     email: str, 
     password: str
 ) -> Optional[User]:
     """
     Authentifie un utilisateur
+    Si le hash stocké n'utilise pas le coût configuré, il est recalculé de façon transparente
     
     Args:
         db (Session): Session de base de données
@@ -183,12 +189,15 @@ def authenticate_user(
         return None
     
     # Vérification du mot de passe
-    if not bcrypt.checkpw(
-        password.encode('utf-8'), 
-        user.hashed_password.encode('utf-8')
-    ):
+    if not await password_service.verify_password(password, user.hashed_password):
         return None
-    
+
+    # Mise à niveau du coût bcrypt après une connexion réussie
+    if password_service.needs_rehash(user.hashed_password):
+        user.hashed_password = await password_service.hash_password(password)
+        db.commit()
+        user_cache.invalidate_user(user_id=user.id)
+
     return user
 
 def list_users(
@@ -227,4 +236,5 @@ def update_profile_image(db: Session, user_id: int, image_path: str) -> Optional
     user.profile_image_path = image_path
     db.commit()
     db.refresh(user)
+    user_cache.invalidate_user(user_id=user_id)
     return user
\ No newline at end of file
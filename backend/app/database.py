@@ -1,35 +1,134 @@
 # backend/database.py
-from sqlalchemy import create_engine
+import itertools
+import threading
+import time
+from typing import Dict, Optional
+
+from fastapi import Request
+from jose import jwt, JWTError
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import settings
+from . import instrumentation, pool_monitoring
 
 # URL de connexion à la base de données MySQL
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-# Création du moteur de base de données
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, 
-    pool_pre_ping=True,  # Test de connexion avant utilisation
-    pool_size=10,        # Nombre de connexions dans le pool
-    max_overflow=20      # Connexions supplémentaires autorisées
-)
+
+def _configure_sqlite(db_engine):
+    """
+    Pragmas appliqués à chaque nouvelle connexion SQLite :
+    WAL (lecteurs non bloqués par l'écrivain), clés étrangères appliquées
+    comme sous MySQL/InnoDB, attente du verrou plutôt qu'une erreur immédiate.
+    """
+    @event.listens_for(db_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+            cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+            cursor.execute("PRAGMA foreign_keys=ON")
+            cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+            # Valeur négative : taille du cache en KiB plutôt qu'en pages
+            cursor.execute(f"PRAGMA cache_size=-{int(settings.SQLITE_CACHE_SIZE_KB)}")
+            cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+        finally:
+            cursor.close()
+
+
+def _create_engine(url: str, name: str):
+    """
+    Crée un moteur avec pool instrumenté (voir pool_monitoring.py)
+    et comptage des requêtes SQL par requête HTTP
+    """
+    metrics = pool_monitoring.PoolMetrics(name)
+    connect_args = {}
+    is_sqlite = url.startswith("sqlite")
+    if is_sqlite:
+        # Connexions partagées entre les threads du pool
+        connect_args["check_same_thread"] = False
+        connect_args["timeout"] = settings.SQLITE_BUSY_TIMEOUT_MS / 1000
+
+    db_engine = create_engine(
+        url,
+        poolclass=pool_monitoring.make_pool_class(metrics),
+        pool_size=settings.DB_POOL_SIZE,          # Nombre de connexions dans le pool
+        max_overflow=settings.DB_MAX_OVERFLOW,    # Connexions supplémentaires autorisées
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        connect_args=connect_args
+    )
+
+    if is_sqlite:
+        _configure_sqlite(db_engine)
+
+    # Test des connexions restées inactives (remplace pool_pre_ping à chaque checkout)
+    pool_monitoring.install(db_engine, metrics, settings.DB_POOL_PING_IDLE_SECONDS)
+    instrumentation.install(db_engine)
+    return db_engine
+
+
+def _session_factory(bind):
+    return sessionmaker(
+        autocommit=False,     # Pas de commit automatique
+        autoflush=False,      # Pas de flush automatique
+        bind=bind
+    )
+
+
+# Création du moteur de base de données (primaire : lectures et écritures)
+engine = _create_engine(SQLALCHEMY_DATABASE_URL, "primary")
 
 # Création d'une session factory
-SessionLocal = sessionmaker(
-    autocommit=False,     # Pas de commit automatique
-    autoflush=False,      # Pas de flush automatique
-    bind=engine
-)
+SessionLocal = _session_factory(engine)
+
+# Réplicas en lecture seule (optionnels), utilisés à tour de rôle par get_read_db
+replica_engines = [
+    _create_engine(url, f"replica-{index}")
+    for index, url in enumerate(settings.DATABASE_REPLICA_URLS)
+]
+ReplicaSessionLocals = [_session_factory(replica) for replica in replica_engines]
+_replica_cycle = itertools.cycle(ReplicaSessionLocals) if ReplicaSessionLocals else None
+_replica_cycle_lock = threading.Lock()
 
 # Base déclarative pour les modèles
 Base = declarative_base()
 
+
+def is_sqlite() -> bool:
+    return engine.dialect.name == "sqlite"
+
+
+def init_db():
+    """
+    Création du schéma à partir des modèles (mode embarqué SQLite ou DB_CREATE_ALL)
+    puis des configurations par défaut. Sans effet sur les tables existantes.
+    """
+    create_all = settings.DB_CREATE_ALL if settings.DB_CREATE_ALL is not None else is_sqlite()
+    if not create_all:
+        return
+
+    # Import de tous les modèles pour les enregistrer dans Base.metadata
+    from .models import models, blog, configuration, stats, events, archive  # noqa: F401
+    from .crud.configuration import create_default_configurations
+
+    Base.metadata.create_all(bind=engine)
+    for replica in replica_engines:
+        Base.metadata.create_all(bind=replica)
+
+    db = SessionLocal()
+    try:
+        create_default_configurations(db)
+    finally:
+        db.close()
+
 def get_db():
     """
     Générateur de session de base de données.
     Permet de gérer proprement les connexions et les transactions.
-    
+
     Utilisation typique dans les routes FastAPI :
     db: Session = Depends(get_db)
     """
@@ -38,3 +137,75 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+class ReadYourWritesTracker:
+    """
+    Mémorise, par utilisateur, l'instant de sa dernière écriture : pendant
+    READ_YOUR_WRITES_SECONDS ses lectures restent sur le primaire pour qu'il
+    voie ses propres modifications malgré le retard de réplication.
+    """
+
+    def __init__(self, window_seconds: float):
+        self.window_seconds = window_seconds
+        self._last_writes: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def request_key(request: Request) -> Optional[str]:
+        """Sujet du token (non vérifié : sert uniquement au routage) ou adresse du client"""
+        authorization = request.headers.get("authorization", "")
+        if authorization.lower().startswith("bearer "):
+            try:
+                subject = jwt.get_unverified_claims(authorization[7:]).get("sub")
+                if subject:
+                    return f"user:{subject}"
+            except JWTError:
+                pass
+        return f"client:{request.client.host}" if request.client else None
+
+    def mark_write(self, request: Request):
+        key = self.request_key(request)
+        if key is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._last_writes[key] = now
+            # Purge des entrées expirées pour borner la mémoire
+            if len(self._last_writes) > 10000:
+                self._last_writes = {
+                    k: t for k, t in self._last_writes.items() if now - t < self.window_seconds
+                }
+
+    def is_sticky(self, request: Request) -> bool:
+        key = self.request_key(request)
+        last_write = self._last_writes.get(key) if key else None
+        return last_write is not None and time.monotonic() - last_write < self.window_seconds
+
+
+read_your_writes = ReadYourWritesTracker(settings.READ_YOUR_WRITES_SECONDS)
+
+
+def read_session_factory(request: Request):
+    """
+    Fabrique de sessions en lecture seule : réplicas à tour de rôle,
+    ou primaire si aucun réplica n'est configuré ou si l'utilisateur vient d'écrire.
+    """
+    if _replica_cycle is None or read_your_writes.is_sticky(request):
+        return SessionLocal
+    with _replica_cycle_lock:
+        return next(_replica_cycle)
+
+
+def get_read_db(request: Request):
+    """
+    Session pour les endpoints en lecture seule (voir read_session_factory).
+
+    Utilisation typique dans les routes FastAPI :
+    db: Session = Depends(get_read_db)
+    """
+    db = read_session_factory(request)()
+    try:
+        yield db
+    finally:
+        db.close()
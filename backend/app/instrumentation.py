@@ -0,0 +1,287 @@
+# backend/app/instrumentation.py
+"""
+Instrumentation des requêtes SQL par requête HTTP.
+
+Des hooks SQLAlchemy (before/after_cursor_execute) comptent les requêtes et
+le temps passé en base pour la requête HTTP courante (contextvar). Le middleware
+de main.py expose ces mesures dans les en-têtes X-DB-Queries et Server-Timing.
+
+Les mêmes hooks alimentent le journal des requêtes lentes : chaque requête est
+réduite à une empreinte (littéraux normalisés) et agrégée en mémoire.
+"""
+import logging
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger("slow_queries")
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Levée quand un bloc ou un endpoint dépasse son budget de requêtes SQL"""
+
+
+class RequestQueryStats:
+    """
+    Mesures SQL d'une requête HTTP (ou d'un bloc instrumenté)
+    """
+
+    def __init__(self, label: str = ""):
+        self.label = label
+        self.count = 0
+        self.total_time = 0.0  # en secondes
+        self.statements: Counter = Counter()
+        self.budget: Optional[int] = None
+
+    def record(self, statement: str, duration: float):
+        self.count += 1
+        self.total_time += duration
+        self.statements[statement] += 1
+
+    @property
+    def total_time_ms(self) -> float:
+        return self.total_time * 1000
+
+    def repeated_statements(self, threshold: int):
+        """Requêtes identiques exécutées au moins `threshold` fois (symptôme de N+1)"""
+        return [(statement, count) for statement, count in self.statements.items() if count >= threshold]
+
+    def over_budget(self) -> bool:
+        return self.budget is not None and self.count > self.budget
+
+    def describe(self) -> str:
+        lines = [f"{self.label}: {self.count} requêtes SQL ({self.total_time_ms:.1f} ms)"]
+        for statement, count in self.statements.most_common(5):
+            lines.append(f"  x{count} {' '.join(statement.split())[:200]}")
+        return "\n".join(lines)
+
+
+_current_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("db_query_stats", default=None)
+
+
+def current_stats() -> Optional[RequestQueryStats]:
+    return _current_stats.get()
+
+
+def start_request(label: str = "") -> object:
+    """Démarre la collecte pour la requête courante, retourne le jeton à passer à end_request"""
+    return _current_stats.set(RequestQueryStats(label))
+
+
+def end_request(token) -> Optional[RequestQueryStats]:
+    """Termine la collecte et signale les requêtes répétées (N+1 probables)"""
+    stats = _current_stats.get()
+    _current_stats.reset(token)
+    if stats is None:
+        return None
+
+    repeated = stats.repeated_statements(settings.DB_N_PLUS_ONE_THRESHOLD)
+    if repeated:
+        logger.warning(
+            f"Possible N+1 on {stats.label}: "
+            + "; ".join(f"x{count} {' '.join(statement.split())[:120]}" for statement, count in repeated)
+        )
+    if stats.over_budget():
+        logger.warning(f"Query budget exceeded ({stats.budget})\n{stats.describe()}")
+    return stats
+
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|:\w+|\?")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """
+    Empreinte d'une requête : littéraux et paramètres remplacés par ?,
+    listes IN (...) réduites, espaces normalisés.
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _VALUE_LIST.sub("(?+)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+class FingerprintStats:
+    """
+    Agrégat d'une empreinte : compteurs et échantillon borné des latences récentes
+    """
+
+    def __init__(self, sample_size: int):
+        self.count = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.rows = 0
+        self.samples = deque(maxlen=sample_size)
+        self.last_route: Optional[str] = None
+
+    def record(self, duration: float, rows: int, route: Optional[str]):
+        self.count += 1
+        self.total_time += duration
+        self.max_time = max(self.max_time, duration)
+        self.rows += max(rows, 0)
+        self.samples.append(duration)
+        if route:
+            self.last_route = route
+
+    def percentile(self, ratio: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(ratio * len(ordered)))]
+
+
+class SlowQueryLog:
+    """
+    Agrégation en mémoire des requêtes par empreinte et journalisation
+    des requêtes dépassant le seuil configuré (avec la route appelante).
+    """
+
+    def __init__(self, threshold_ms: float, sample_size: int = 500):
+        self.threshold_ms = threshold_ms
+        self.sample_size = sample_size
+        self._stats: Dict[str, FingerprintStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, duration: float, rows: int, route: Optional[str]):
+        key = fingerprint(statement)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = FingerprintStats(self.sample_size)
+            stats.record(duration, rows, route)
+
+        if duration * 1000 >= self.threshold_ms:
+            slow_query_logger.warning(
+                f"Slow query ({duration * 1000:.1f} ms, {rows} rows) on {route or 'hors requête'}: {key[:500]}"
+            )
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def report(self, sort_by: str = "total_ms", limit: int = 50) -> List[Dict]:
+        """Tableau agrégé par empreinte, trié par la colonne demandée"""
+        with self._lock:
+            items = list(self._stats.items())
+
+        rows = [
+            {
+                "fingerprint": key,
+                "count": stats.count,
+                "total_ms": round(stats.total_time * 1000, 3),
+                "p50_ms": round(stats.percentile(0.50) * 1000, 3),
+                "p95_ms": round(stats.percentile(0.95) * 1000, 3),
+                "max_ms": round(stats.max_time * 1000, 3),
+                "rows": stats.rows,
+                "avg_rows": round(stats.rows / stats.count, 2) if stats.count else 0,
+                "last_route": stats.last_route
+            }
+            for key, stats in items
+        ]
+        if rows and sort_by in rows[0]:
+            rows.sort(key=lambda row: row[sort_by], reverse=True)
+        return rows[:limit]
+
+
+slow_query_log = SlowQueryLog(settings.SLOW_QUERY_THRESHOLD_MS)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get("query_start_time")
+    if not start_times:
+        return
+    duration = time.perf_counter() - start_times.pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, duration)
+    slow_query_log.record(statement, duration, cursor.rowcount, stats.label if stats else None)
+
+
+def _handle_error(exception_context):
+    # after_cursor_execute n'est pas appelé sur une requête en échec : on jette son
+    # instant de départ, sinon il serait apparié à la requête suivante de la connexion
+    if exception_context.connection is not None:
+        exception_context.connection.info.pop("query_start_time", None)
+
+
+def install(engine: Engine):
+    """Branche les hooks de mesure sur un moteur SQLAlchemy"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def server_timing_headers(stats: RequestQueryStats) -> dict:
+    """En-têtes HTTP exposant les mesures SQL"""
+    return {
+        "X-DB-Queries": str(stats.count),
+        "Server-Timing": f'db;dur={stats.total_time_ms:.2f};desc="{stats.count} queries"'
+    }
+
+
+def query_budget(max_queries: int):
+    """
+    Dépendance FastAPI déclarant le budget de requêtes SQL d'un endpoint.
+
+    Utilisation :
+        @router.get("/", dependencies=[Depends(query_budget(3))])
+
+    En mode strict (settings.DB_QUERY_BUDGET_STRICT, pour les tests) un dépassement
+    transforme la réponse en erreur 500 ; sinon il est seulement journalisé.
+    """
+    async def declare_budget(request: Request):
+        stats = current_stats()
+        if stats is not None:
+            stats.budget = max_queries
+    return declare_budget
+
+
+@contextmanager
+def assert_max_queries(max_queries: int, label: str = "block"):
+    """
+    Assertion de test : échoue si le bloc exécute plus de `max_queries` requêtes SQL.
+
+        with assert_max_queries(2):
+            tournament_crud.get_tournament(db, 1)
+    """
+    token = _current_stats.set(RequestQueryStats(label))
+    try:
+        yield _current_stats.get()
+    finally:
+        stats = _current_stats.get()
+        _current_stats.reset(token)
+    if stats.count > max_queries:
+        raise QueryBudgetExceeded(f"Budget de {max_queries} requêtes dépassé\n{stats.describe()}")
+
+
+def assert_response_query_budget(response, max_queries: int):
+    """
+    Assertion de test sur une réponse HTTP (TestClient) à partir de l'en-tête X-DB-Queries
+    """
+    count = int(response.headers.get("X-DB-Queries", 0))
+    if count > max_queries:
+        raise QueryBudgetExceeded(
+            f"{response.request.method} {response.request.url.path}: "
+            f"{count} requêtes SQL pour un budget de {max_queries}"
+        )
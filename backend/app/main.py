@@ -5,13 +5,21 @@ from fastapi import FastAPI
 from contextlib import asynccontextmanager
 
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import ValidationError
+from sqlalchemy.orm.exc import StaleDataError
 
 from .config import settings
-from .routes import auth, users, tournaments, blog, configurations, leagues, websockets
+from . import instrumentation
+from .routes import auth, users, tournaments, blog, configurations, leagues, websockets, leaderboards, monitoring, exports
 import logging
 from .services.timer_service import start_timer_service, stop_timer_service
+from .services.leaderboard_service import leaderboard_service
+from .services import password_service
+from .database import SessionLocal, read_your_writes, init_db
+from .crud import tournament as tournament_crud
+from .crud import fast_reads
+from .serialization import entity_tag
 
 
 # Au début du fichier, après les imports
@@ -22,20 +30,35 @@ validation_logger.setLevel(logging.DEBUG)
 # Context manager pour le startup/shutdown
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Startup: création du schéma en mode embarqué (SQLite)
+    init_db()
+
     # Startup: démarrer le service de timer
     await start_timer_service()
 
+    # Startup: matérialiser les classements depuis player_stats
+    db = SessionLocal()
+    try:
+        leaderboard_service.rebuild(db)
+    except Exception as e:
+        logging.error(f"Unable to build leaderboards at startup: {e}")
+    finally:
+        db.close()
+
     yield
 
     # Shutdown: arrêter le service de timer
     await stop_timer_service()
+    password_service.shutdown()
 
 # Création de l'application FastAPI
 app = FastAPI(
     title=settings.APP_NAME,
     description="pokweb : application de gestion de tournois de poker. Notamment pour le célèbre JAPT",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # Encodage JSON des réponses par orjson (voir serialization.py)
+    default_response_class=ORJSONResponse
 )
 
 
@@ -90,6 +113,33 @@ async def pydantic_validation_exception_handler(request, exc: ValidationError):
         }
     )
 
+# Verrouillage optimiste des tournois : If-Match périmé ou écriture concurrente
+@app.exception_handler(tournament_crud.TournamentVersionConflict)
+@app.exception_handler(StaleDataError)
+async def tournament_conflict_handler(request, exc):
+    tournament_id = getattr(exc, "tournament_id", None) or request.path_params.get("tournament_id")
+    current_state = None
+    headers = None
+    if tournament_id is not None:
+        db = SessionLocal()
+        try:
+            current_state = tournament_crud.get_tournament_state(db, int(tournament_id))
+            # Même ETag que GET /tournaments/{id} (sans ?fields=), réutilisable en If-None-Match
+            stamp = fast_reads.get_tournament_stamp(db, int(tournament_id))
+            if stamp:
+                headers = {"ETag": entity_tag(stamp["stamp"], (), version=stamp["version"])}
+        finally:
+            db.close()
+
+    return JSONResponse(
+        status_code=409,
+        content={
+            "detail": "Le tournoi a été modifié entre-temps, rechargez son état avant de réessayer",
+            "current": current_state
+        },
+        headers=headers
+    )
+
 @app.middleware("http")
 async def debug_validation_errors(request, call_next):
     try:
@@ -151,6 +201,34 @@ async def log_requests(request, call_next):
     print(f"Response status: {response.status_code}")
     return response
 
+# Mesure des requêtes SQL de chaque requête HTTP (en-têtes X-DB-Queries / Server-Timing)
+@app.middleware("http")
+async def db_query_metrics(request, call_next):
+    token = instrumentation.start_request(f"{request.method} {request.url.path}")
+    try:
+        response = await call_next(request)
+    finally:
+        stats = instrumentation.end_request(token)
+
+    if stats.over_budget() and settings.DB_QUERY_BUDGET_STRICT:
+        return JSONResponse(
+            status_code=500,
+            content={"detail": "Budget de requêtes SQL dépassé", "queries": stats.count, "budget": stats.budget},
+            headers=instrumentation.server_timing_headers(stats)
+        )
+
+    response.headers.update(instrumentation.server_timing_headers(stats))
+    return response
+
+# Lecture de ses propres écritures : après une mutation réussie, les lectures
+# de l'utilisateur restent quelques secondes sur le primaire (voir get_read_db)
+@app.middleware("http")
+async def read_your_writes_stickiness(request, call_next):
+    response = await call_next(request)
+    if request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+        read_your_writes.mark_write(request)
+    return response
+
 # Inclusion des différentes routes
 app.include_router(auth.router, prefix="/auth", tags=["Authentification"])
 app.include_router(users.router, prefix="/users", tags=["Utilisateurs"])
@@ -158,6 +236,9 @@ app.include_router(tournaments.router, prefix="/tournaments", tags=["Tournois"])
 app.include_router(blog.router, prefix="/blog", tags=["Blog"])
 app.include_router(configurations.router, prefix="/configurations", tags=["Configurations"])
 app.include_router(leagues.router, prefix="/leagues", tags=["Ligues"])
+app.include_router(leaderboards.router, prefix="/leaderboards", tags=["Classements"])
+app.include_router(monitoring.router, prefix="/monitoring", tags=["Monitoring"])
+app.include_router(exports.router, prefix="/exports", tags=["Exports"])
 
 # Inclusion des routes WebSocket après les autres routes
 app.include_router(websockets.router, prefix="/ws", tags=["WebSockets"])
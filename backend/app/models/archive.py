@@ -0,0 +1,88 @@
+# backend/app/models/archive.py
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, JSON, Enum, Index
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from ..database import Base
+from .models import TournamentType, TournamentStatus
+
+
+class ArchivedTournament(Base):
+    """
+    Tournoi terminé déplacé hors de la table tournaments par le job d'archivage
+    (voir crud/archive.py). Mêmes colonnes et mêmes identifiants que dans la
+    table d'origine : les réponses TournamentResponse s'appliquent telles quelles.
+    """
+    __tablename__ = "tournaments_archive"
+    __table_args__ = (
+        Index('ix_tournaments_archive_league_date', 'league_id', 'date'),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    name = Column(String(100), nullable=False)
+    tournament_type = Column(Enum(TournamentType), nullable=False)
+    status = Column(Enum(TournamentStatus), nullable=False)
+
+    configuration_id = Column(Integer, ForeignKey('tournament_configurations.id'))
+    configuration = relationship("TournamentConfiguration")
+    sound_configuration_id = Column(Integer, ForeignKey('sound_configurations.id'))
+
+    date = Column(DateTime(timezone=True), nullable=False)
+    start_time = Column(DateTime(timezone=True), nullable=True)
+    end_time = Column(DateTime(timezone=True), nullable=True)
+    current_level = Column(Integer, default=0)
+    seconds_remaining = Column(Integer, nullable=True)
+    level_duration = Column(Integer, nullable=True)
+    paused_at = Column(DateTime(timezone=True), nullable=True)
+    last_timer_update = Column(DateTime(timezone=True), nullable=True)
+
+    max_players = Column(Integer, nullable=False)
+    registered_count = Column(Integer, nullable=False, default=0)
+    buy_in = Column(Float, nullable=False)
+    num_tables = Column(Integer, default=1)
+    players_per_table = Column(Integer, default=10)
+
+    total_buyin = Column(Float, default=0)
+    total_rebuys = Column(Integer, default=0)
+    prize_pool = Column(Float, default=0)
+
+    clay_token_holder_id = Column(Integer, ForeignKey('users.id'), nullable=True)
+    bounty_hunter_id = Column(Integer, ForeignKey('users.id'), nullable=True)
+    tables_state = Column(JSON, default={})
+    admin_id = Column(Integer, ForeignKey('users.id'))
+    league_id = Column(Integer, ForeignKey('leagues.id'), nullable=False)
+    version = Column(Integer, nullable=False, default=1)
+    event_seq = Column(Integer, nullable=False, default=0)
+
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    participations = relationship("ArchivedParticipation", back_populates="tournament")
+    clay_token_holder = relationship("User", foreign_keys=[clay_token_holder_id])
+
+
+class ArchivedParticipation(Base):
+    """
+    Participation d'un tournoi archivé (action_history, obsolète, n'est pas conservé)
+    """
+    __tablename__ = "tournament_participations_archive"
+    __table_args__ = (
+        Index('ix_participations_archive_tournament', 'tournament_id'),
+        Index('ix_participations_archive_user', 'user_id'),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+
+    tournament_id = Column(Integer, ForeignKey('tournaments_archive.id'), nullable=False)
+    tournament = relationship("ArchivedTournament", back_populates="participations")
+
+    user_id = Column(Integer, ForeignKey('users.id'))
+    user = relationship("User")
+
+    is_registered = Column(Boolean, default=True)
+    is_active = Column(Boolean, default=True)
+    registration_time = Column(DateTime(timezone=True))
+    elimination_time = Column(DateTime(timezone=True), nullable=True)
+    current_position = Column(Integer, nullable=True)
+
+    num_rebuys = Column(Integer, default=0)
+    total_buyin = Column(Float, default=0)
+    prize_won = Column(Float, default=0)
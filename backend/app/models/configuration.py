@@ -1,7 +1,7 @@
 # backend/app/models/configuration.py
 from sqlalchemy import Column, Integer, String, JSON, Boolean, ForeignKey, Float, DateTime
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, literal_column
 from ..database import Base
 
 
@@ -15,6 +15,8 @@ class BlindsStructure(Base):
     starting_chips = Column(Integer, nullable=False, default=20000)  # Déplacé ici depuis PayoutStructure
     created_by_id = Column(Integer, ForeignKey('users.id'), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Incrémentée par la base à chaque UPDATE (ETag des lectures)
+    version = Column(Integer, nullable=False, default=1, server_default="1", onupdate=literal_column("version") + 1)
 
     created_by = relationship("User", back_populates="blinds_structures")
     tournament_configurations = relationship("TournamentConfiguration", back_populates="blinds_structure")
@@ -29,6 +31,8 @@ class SoundConfiguration(Base):
     sounds = Column(JSON, nullable=False)  # {event_type: sound_path}
     created_by_id = Column(Integer, ForeignKey('users.id'), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Incrémentée par la base à chaque UPDATE (ETag des lectures)
+    version = Column(Integer, nullable=False, default=1, server_default="1", onupdate=literal_column("version") + 1)
 
     created_by = relationship("User", back_populates="sound_configurations")
     tournament_configurations = relationship("TournamentConfiguration", back_populates="sound_configuration")
@@ -50,6 +54,8 @@ class TournamentConfiguration(Base):
 
     created_by_id = Column(Integer, ForeignKey('users.id'), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Incrémentée par la base à chaque UPDATE (ETag des lectures)
+    version = Column(Integer, nullable=False, default=1, server_default="1", onupdate=literal_column("version") + 1)
 
     # Relations
     blinds_structure = relationship("BlindsStructure", back_populates="tournament_configurations")
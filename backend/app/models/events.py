@@ -0,0 +1,65 @@
+# backend/app/models/events.py
+from sqlalchemy import Column, Integer, BigInteger, Float, DateTime, JSON, Enum, UniqueConstraint, Index
+from sqlalchemy.sql import func
+from ..database import Base
+import enum
+
+
+class TournamentEventType(enum.Enum):
+    """
+    Types d'événements d'un tournoi
+    """
+    REGISTERED = "REGISTERED"  # Inscription d'un joueur
+    UNREGISTERED = "UNREGISTERED"  # Désinscription
+    STARTED = "STARTED"
+    PAUSED = "PAUSED"  # value : secondes restantes
+    RESUMED = "RESUMED"  # value : secondes restantes
+    LEVEL_CHANGED = "LEVEL_CHANGED"  # value : niveau, amount : durée (s)
+    TIMER_SET = "TIMER_SET"  # value : secondes restantes
+    REBUY = "REBUY"  # amount : montant
+    ELIMINATED = "ELIMINATED"  # value : position, amount : gains
+    FINISHED = "FINISHED"  # Classement saisi en lot - value : position, amount : gains
+    TABLES_UPDATED = "TABLES_UPDATED"  # Déplacement de joueurs, payload : état des tables
+    CLAY_TOKEN_AWARDED = "CLAY_TOKEN_AWARDED"
+    COMPLETED = "COMPLETED"
+
+
+class TournamentEvent(Base):
+    """
+    Journal append-only des actions d'un tournoi (remplace l'écriture du JSON
+    action_history des participations). Une ligne par événement, numérotée
+    par tournoi (seq), écrite en lot au commit (voir crud/events.py).
+
+    Pas de clé étrangère sur tournament_id : les événements des tournois
+    archivés doivent pouvoir être déplacés indépendamment.
+    """
+    __tablename__ = "tournament_events"
+    __table_args__ = (
+        UniqueConstraint('tournament_id', 'seq', name='uq_tournament_events_seq'),
+        Index('ix_tournament_events_user_type', 'user_id', 'type'),
+    )
+
+    # BIGINT sous MySQL, INTEGER (rowid auto-incrémenté) sous SQLite
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    tournament_id = Column(Integer, nullable=False)
+    seq = Column(Integer, nullable=False)  # Ordre des événements dans le tournoi (1, 2, ...)
+    type = Column(Enum(TournamentEventType), nullable=False)
+    user_id = Column(Integer, nullable=True)  # Joueur concerné
+    value = Column(Integer, nullable=True)  # Position, niveau ou secondes selon le type
+    amount = Column(Float, nullable=True)  # Montant (rebuy, gains)
+    payload = Column(JSON, nullable=True)  # Données non typées (état des tables)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class TournamentSnapshot(Base):
+    """
+    État replié d'un tournoi (voir services/tournament_state.py) après
+    l'événement `seq`, écrit tous les TOURNAMENT_SNAPSHOT_INTERVAL événements :
+    au redémarrage, seul le journal postérieur au dernier instantané est relu.
+    """
+    __tablename__ = "tournament_snapshots"
+
+    tournament_id = Column(Integer, primary_key=True)
+    seq = Column(Integer, primary_key=True)  # Dernier événement inclus dans l'état
+    state = Column(JSON, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
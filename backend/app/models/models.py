@@ -1,7 +1,7 @@
 # backend/app/models/user.py
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Float, JSON, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Float, JSON, Enum, UniqueConstraint
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, literal_column
 from ..database import Base
 import enum
 
@@ -11,6 +11,9 @@ class League(Base):
     id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False, unique=True)
     description = Column(String(500))
+    # Incrémentée à chaque modification de la ligue, de ses membres ou de ses
+    # administrateurs (voir league_crud.touch_leagues) : ETag de GET /leagues/
+    version = Column(Integer, nullable=False, default=1, server_default="1", onupdate=literal_column("version") + 1)
 
     # Admins de la ligue
     admins = relationship("User", secondary="league_admins", back_populates="administered_league")
@@ -75,6 +78,7 @@ class Tournament(Base):
 
     # Paramètres du tournoi
     max_players = Column(Integer, nullable=False)
+    registered_count = Column(Integer, nullable=False, default=0, server_default="0")  # Inscrits (incrémenté atomiquement)
     buy_in = Column(Float, nullable=False)
     num_tables = Column(Integer, default=1)
     players_per_table = Column(Integer, default=10)
@@ -103,6 +107,13 @@ class Tournament(Base):
     clay_token_holder = relationship("User", foreign_keys=[clay_token_holder_id])
     bounty_hunter = relationship("User", foreign_keys=[bounty_hunter_id])
 
+    # Verrouillage optimiste : chaque UPDATE ORM vérifie et incrémente la version
+    # (les incréments atomiques par query.update() ne la modifient pas)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    # Dernier numéro de séquence attribué dans tournament_events
+    event_seq = Column(Integer, nullable=False, default=0, server_default="0")
+    __mapper_args__ = {"version_id_col": version}
+
 
 class TournamentParticipation(Base):
     """
@@ -110,6 +121,10 @@ class TournamentParticipation(Base):
     Stocke toutes les informations sur l'état d'un joueur dans le tournoi
     """
     __tablename__ = "tournament_participations"
+    __table_args__ = (
+        # Un joueur ne peut être inscrit qu'une fois à un tournoi
+        UniqueConstraint('tournament_id', 'user_id', name='uq_participation_tournament_user'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -132,7 +147,7 @@ class TournamentParticipation(Base):
     prize_won = Column(Float, default=0)  # Gains éventuels
 
     # Historique des actions (stocké en JSON pour la flexibilité)
-    action_history = Column(JSON, default=[])  # Liste des actions (rebuys, éliminations, etc.)
+    action_history = Column(JSON, default=[])  # Obsolète : les actions sont journalisées dans tournament_events
 
 
 class User(Base):
@@ -154,6 +169,11 @@ class User(Base):
     last_login = Column(DateTime(timezone=True), nullable=True)
 
     member_status = Column(String(255), nullable=True) # Statut de l'utilisateur dans sa ligue (PENDING ou APPROVED)
+    # Administrateur de l'application (monitoring, maintenance), voir scripts/grant_admin.py
+    is_admin = Column(Boolean, nullable=False, default=False, server_default="0")
+
+    # Incrémentée par la base à chaque UPDATE de l'utilisateur (ETag des tournois et des ligues)
+    version = Column(Integer, nullable=False, default=1, server_default="1", onupdate=literal_column("version") + 1)
 
 
     # Relations
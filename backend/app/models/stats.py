@@ -0,0 +1,46 @@
+# backend/app/models/stats.py
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, UniqueConstraint, Index
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from ..database import Base
+
+
+class PlayerStats(Base):
+    """
+    Statistiques agrégées d'un joueur, par ligue et par saison.
+    Table dénormalisée, mise à jour à la clôture de chaque tournoi
+    (voir crud/stats.py) pour éviter de recalculer depuis les participations.
+    """
+    __tablename__ = "player_stats"
+    __table_args__ = (
+        UniqueConstraint('user_id', 'league_id', 'season', name='uq_player_stats_scope'),
+        Index('ix_player_stats_league_season', 'league_id', 'season'),
+    )
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey('users.id'), nullable=False, index=True)
+    league_id = Column(Integer, ForeignKey('leagues.id'), nullable=False)
+    season = Column(Integer, nullable=False)  # Année du tournoi
+
+    # Compteurs de parties
+    games_played = Column(Integer, nullable=False, default=0)
+    victories = Column(Integer, nullable=False, default=0)
+    itm_count = Column(Integer, nullable=False, default=0)  # Nombre de places payées
+    positions_sum = Column(Integer, nullable=False, default=0)  # Pour la position moyenne
+    positions_count = Column(Integer, nullable=False, default=0)
+
+    # Gestion financière
+    total_buyin = Column(Float, nullable=False, default=0)
+    total_earnings = Column(Float, nullable=False, default=0)
+
+    # Primes et jeton d'argile
+    bounty_count = Column(Integer, nullable=False, default=0)
+    bounty_earnings = Column(Float, nullable=False, default=0)
+    clay_token_wins = Column(Integer, nullable=False, default=0)
+
+    # Points de championnat (voir crud/stats.points_for_position)
+    season_points = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    user = relationship("User")
@@ -0,0 +1,148 @@
+# backend/app/pool_monitoring.py
+"""
+Observabilité du pool de connexions et validation des connexions inactives.
+
+- Le pool QueuePool est sous-classé pour mesurer le temps d'attente de chaque
+  checkout (histogramme) et compter les timeouts.
+- Le pre-ping systématique (pool_pre_ping) est remplacé par un ping effectué
+  seulement si la connexion est restée inactive plus longtemps que le seuil
+  configuré : pas d'aller-retour supplémentaire sur les connexions chaudes.
+"""
+import logging
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger(__name__)
+
+# Bornes supérieures (ms) des classes de l'histogramme des temps d'attente
+WAIT_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+
+class PoolMetrics:
+    """
+    Compteurs d'un pool de connexions
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pool = None
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_histogram = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.peak_checked_out = 0
+        self.pre_pings = 0
+        self.pre_ping_failures = 0
+        self._lock = threading.Lock()
+
+    def record_wait(self, duration: float):
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += duration
+            self.max_wait = max(self.max_wait, duration)
+            self.wait_histogram[bisect_left(WAIT_BUCKETS_MS, duration * 1000)] += 1
+            if self.pool is not None:
+                self.peak_checked_out = max(self.peak_checked_out, self.pool.checkedout())
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> Dict:
+        pool = self.pool
+        histogram = {
+            f"<={bound}ms": count for bound, count in zip(WAIT_BUCKETS_MS, self.wait_histogram)
+        }
+        histogram[f">{WAIT_BUCKETS_MS[-1]}ms"] = self.wait_histogram[-1]
+        size = pool.size() if pool is not None else 0
+        return {
+            "name": self.name,
+            "pool_size": size,
+            "checked_out": pool.checkedout() if pool is not None else 0,
+            "checked_in": pool.checkedin() if pool is not None else 0,
+            "overflow": pool.overflow() if pool is not None else 0,
+            "peak_checked_out": self.peak_checked_out,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(self.total_wait / self.checkouts * 1000, 3) if self.checkouts else 0,
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+            "wait_histogram": histogram,
+            "pre_pings": self.pre_pings,
+            "pre_ping_failures": self.pre_ping_failures,
+            # Taille suggérée : pic de connexions simultanées observé (avec un minimum de 1)
+            "suggested_pool_size": max(1, self.peak_checked_out),
+            "saturated": self.timeouts > 0 or (size > 0 and self.peak_checked_out > size)
+        }
+
+
+# Métriques de tous les pools instrumentés, par nom de moteur
+pool_registry: Dict[str, PoolMetrics] = {}
+
+
+def make_pool_class(metrics: PoolMetrics):
+    """
+    Sous-classe de QueuePool liée à un objet de métriques
+    (conservée lors d'un pool.recreate(), qui réutilise la même classe)
+    """
+
+    class InstrumentedQueuePool(QueuePool):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            metrics.pool = self
+
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                return super()._do_get()
+            except exc.TimeoutError:
+                metrics.record_timeout()
+                raise
+            finally:
+                metrics.record_wait(time.perf_counter() - start)
+
+    return InstrumentedQueuePool
+
+
+def install(engine: Engine, metrics: PoolMetrics, idle_ping_seconds: Optional[float]):
+    """
+    Branche la validation des connexions inactives sur un moteur.
+    idle_ping_seconds : None désactive le ping, 0 pingue à chaque checkout.
+    """
+    pool_registry[metrics.name] = metrics
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        connection_record.info["last_checkin"] = time.monotonic()
+
+    if idle_ping_seconds is None:
+        return
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        last_checkin = connection_record.info.get("last_checkin")
+        # Connexion neuve ou récemment utilisée : pas de ping
+        if last_checkin is None or time.monotonic() - last_checkin < idle_ping_seconds:
+            return
+
+        metrics.pre_pings += 1
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+        except Exception as e:
+            metrics.pre_ping_failures += 1
+            logger.warning(f"Stale connection in pool {metrics.name}: {e}")
+            # Le pool invalide la connexion et en ouvre une nouvelle
+            raise exc.DisconnectionError() from e
+        finally:
+            try:
+                cursor.close()
+            except Exception:
+                pass
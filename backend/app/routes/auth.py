@@ -7,9 +7,11 @@ from jose import JWTError, jwt
 
 from ..database import get_db
 from ..crud import user as user_crud
-from ..models.models import League, LeagueAdmin
+from ..crud import league as league_crud
+from ..models.models import League, LeagueAdmin, User
 from ..schemas import schemas as user_schemas
 from ..config import settings
+from ..services.user_cache import user_cache
 
 router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
@@ -44,13 +46,30 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
+    # Chemin rapide : utilisateur en cache, rattaché à la session sans requête SQL
+    user = user_cache.get(db, username)
+    if user is not None:
+        return user
+
     user = user_crud.get_user_by_username(db, username)
     if user is None:
         raise credentials_exception
 
+    user_cache.put(username, user)
 
     return user
 
+
+async def get_current_admin(current_user: User = Depends(get_current_user)):
+    """Utilisateur courant, s'il est administrateur de l'application (monitoring, maintenance)"""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Réservé aux administrateurs"
+        )
+    return current_user
+
+
 # @router.post("/register", response_model=user_schemas.UserResponse)
 # async def register(
 #     user_data: user_schemas.UserCreate,
@@ -96,7 +115,7 @@ async def register(
                 league_id = user_data.league.get("id")
 
         # Créer l'utilisateur
-        db_user = user_crud.create_user(db, user_data)
+        db_user = await user_crud.create_user(db, user_data)
 
         # Si une nouvelle ligue a été créée, créer l'association admin
         if league_id and user_data.league.get("isNew"):
@@ -106,6 +125,8 @@ async def register(
             )
             db.add(league_admin)
 
+        # Nouveau membre ou nouvel administrateur : la ligue change
+        league_crud.touch_leagues(db, db_user.league_id, league_id)
         db.commit()
         return db_user
 
@@ -122,7 +143,7 @@ async def login(
     """
     Endpoint de connexion - génère un token JWT
     """
-    user = user_crud.authenticate_user(
+    user = await user_crud.authenticate_user(
         db, 
         form_data.username, 
         form_data.password
@@ -6,7 +6,7 @@ import shutil
 from pathlib import Path
 from datetime import datetime
 
-from ..database import get_db
+from ..database import get_db, get_read_db
 from ..crud import blog as blog_crud
 from ..schemas.blog import BlogPostCreate, BlogPostResponse
 from .auth import get_current_user
@@ -57,7 +57,7 @@ async def create_blog_post(
 async def list_blog_posts(
     skip: int = 0,
     limit: int = 10,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Liste les articles de blog"""
     return blog_crud.list_blog_posts(db, skip=skip, limit=limit)
@@ -65,7 +65,7 @@ async def list_blog_posts(
 @router.get("/{post_id}", response_model=BlogPostResponse)
 async def get_blog_post(
     post_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Récupère un article de blog spécifique"""
     post = blog_crud.get_blog_post_by_id(db, post_id)
@@ -1,5 +1,5 @@
 # backend/app/routes/configurations.py
-from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile, Request, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import shutil
@@ -9,6 +9,9 @@ import logging
 
 from ..database import get_db
 from ..crud import configuration as config_crud
+from ..crud import fast_reads
+from ..instrumentation import query_budget
+from ..serialization import entity_tag, etag_headers, not_modified
 from ..schemas.schemas import (
     TournamentConfigCreate, TournamentConfigResponse,
     BlindsStructureCreate, BlindsStructureResponse,
@@ -57,20 +60,31 @@ async def get_blinds_structures(
     return config_crud.list_blinds_structures(db, current_user.id)
 
 
-@router.get("/blinds/{structure_id}", response_model=BlindsStructureResponse)
+@router.get("/blinds/{structure_id}", response_model=BlindsStructureResponse,
+            dependencies=[Depends(query_budget(2))])
 async def get_blinds_structure(
         structure_id: int,
+        request: Request,
+        response: Response,
         db: Session = Depends(get_db)
 ):
     """
     Récupère une structure de blindes par son ID
+    (ETag dérivé de sa version : 304 si If-None-Match correspond)
     """
-    structure = config_crud.get_blinds_structure(db, structure_id)
-    if not structure:
+    version = fast_reads.get_blinds_structure_stamp(db, structure_id)
+    if version is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Structure de blindes non trouvée"
         )
+    etag = entity_tag("blinds_structure", structure_id, version)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+
+    structure = config_crud.get_blinds_structure(db, structure_id)
+    response.headers.update(etag_headers(etag))
     return structure
 
 
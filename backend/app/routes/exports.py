@@ -0,0 +1,122 @@
+# backend/app/routes/exports.py
+import csv
+import io
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Dict, Iterator, List, Optional
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+
+from .auth import get_current_user
+from ..crud import exports as exports_crud
+from ..database import read_session_factory
+from ..models.models import TournamentType, User
+
+router = APIRouter()
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson"
+}
+# Lignes regroupées dans chaque morceau envoyé au client
+CHUNK_ROWS = 500
+
+
+def _plain(value):
+    """Valeur sérialisable en CSV/JSON"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _encode(rows: Iterator[Dict], fieldnames: List[str], file_format: str) -> Iterator[str]:
+    """Encode les lignes par morceaux de CHUNK_ROWS lignes"""
+    buffer = io.StringIO()
+    writer = None
+    if file_format == "csv":
+        writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+        writer.writeheader()
+
+    count = 0
+    for row in rows:
+        row = {key: _plain(value) for key, value in row.items()}
+        if writer is not None:
+            writer.writerow(row)
+        else:
+            buffer.write(json.dumps(row, ensure_ascii=False))
+            buffer.write("\n")
+        count += 1
+        if count % CHUNK_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _export_response(request: Request, statement, file_format: str, filename: str) -> StreamingResponse:
+    session_factory = read_session_factory(request)
+    fieldnames = list(statement.selected_columns.keys())
+
+    def generate():
+        # Session ouverte dans le générateur : celles des dépendances (get_db)
+        # sont fermées avant l'envoi du corps de la réponse
+        db = session_factory()
+        try:
+            yield from _encode(exports_crud.stream_rows(db, statement), fieldnames, file_format)
+        finally:
+            db.close()
+
+    return StreamingResponse(
+        generate(),
+        media_type=MEDIA_TYPES[file_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{file_format}"'}
+    )
+
+
+@router.get("/tournaments")
+async def export_tournaments(
+    request: Request,
+    league_id: Optional[int] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    tournament_type: Optional[TournamentType] = None,
+    file_format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    current_user: User = Depends(get_current_user)
+):
+    """Exporte les tournois (archives incluses), une ligne par tournoi"""
+    statement = exports_crud.tournaments_statement(league_id, date_from, date_to, tournament_type)
+    return _export_response(request, statement, file_format, "tournois")
+
+
+@router.get("/results")
+async def export_results(
+    request: Request,
+    league_id: Optional[int] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    tournament_type: Optional[TournamentType] = None,
+    file_format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    current_user: User = Depends(get_current_user)
+):
+    """Exporte les résultats des tournois terminés, une ligne par joueur et par tournoi"""
+    statement = exports_crud.results_statement(league_id, date_from, date_to, tournament_type)
+    return _export_response(request, statement, file_format, "resultats")
+
+
+@router.get("/player-stats")
+async def export_player_stats(
+    request: Request,
+    league_id: Optional[int] = None,
+    season: Optional[int] = None,
+    file_format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    current_user: User = Depends(get_current_user)
+):
+    """Exporte les statistiques cumulées, une ligne par joueur, ligue et saison"""
+    statement = exports_crud.player_stats_statement(league_id, season)
+    return _export_response(request, statement, file_format, "statistiques")
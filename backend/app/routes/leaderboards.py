@@ -0,0 +1,75 @@
+# backend/app/routes/leaderboards.py
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from ..database import get_db, get_read_db
+from ..crud import fast_reads
+from ..serialization import trusted_response
+from ..models.models import User
+from ..schemas.schemas import LeaderboardEntry, LeaderboardRankResponse
+from ..services.leaderboard_service import leaderboard_service, LeaderboardMetric
+from .auth import get_current_admin
+
+router = APIRouter()
+
+
+@router.get("/{league_id}/{metric}", response_model=List[LeaderboardEntry])
+async def get_leaderboard(
+    league_id: int,
+    metric: LeaderboardMetric,
+    season: Optional[int] = None,
+    skip: int = 0,
+    limit: int = 20,
+    db: Session = Depends(get_read_db)
+):
+    """Récupère une page du classement d'une ligue"""
+    board = leaderboard_service.get(league_id, metric, season)
+    return trusted_response(fast_reads.get_leaderboard_entries(db, board.page(skip, limit)))
+
+
+@router.get("/{league_id}/{metric}/users/{user_id}", response_model=LeaderboardRankResponse)
+async def get_user_rank(
+    league_id: int,
+    metric: LeaderboardMetric,
+    user_id: int,
+    season: Optional[int] = None
+):
+    """Récupère le rang d'un joueur dans un classement"""
+    board = leaderboard_service.get(league_id, metric, season)
+    return LeaderboardRankResponse(
+        user_id=user_id,
+        rank=board.rank(user_id),
+        score=board.score(user_id),
+        total_players=len(board)
+    )
+
+
+@router.get("/{league_id}/{metric}/users/{user_id}/around", response_model=List[LeaderboardEntry])
+async def get_leaderboard_around_user(
+    league_id: int,
+    metric: LeaderboardMetric,
+    user_id: int,
+    season: Optional[int] = None,
+    radius: int = 5,
+    db: Session = Depends(get_read_db)
+):
+    """Récupère la portion du classement autour d'un joueur"""
+    board = leaderboard_service.get(league_id, metric, season)
+    entries = board.around(user_id, radius)
+    if not entries:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Joueur absent de ce classement"
+        )
+    return trusted_response(fast_reads.get_leaderboard_entries(db, entries))
+
+
+@router.post("/rebuild")
+async def rebuild_leaderboards(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin)
+):
+    """Reconstruit les classements en mémoire (après une reconstruction de player_stats). Administrateurs uniquement."""
+    leaderboard_service.rebuild(db)
+    return {"status": "success", "message": "Classements reconstruits"}
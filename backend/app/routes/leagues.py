@@ -1,14 +1,19 @@
 # routes/leagues.py
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
+from sqlalchemy.orm import Session, joinedload
+from collections import defaultdict
 from typing import List
 from sqlalchemy import func, distinct
 
-from ..database import get_db
+from ..database import get_db, get_read_db
 from ..models.models import League, LeagueAdmin, User
 from .auth import get_current_user
 from ..schemas.schemas import LeagueResponse, LeagueCreate, UserResponse
 from ..crud import league as league_crud
+from ..crud import fast_reads
+from ..instrumentation import query_budget
+from ..serialization import entity_tag, etag_headers, not_modified
+from ..services.user_cache import user_cache
 
 router = APIRouter()
 
@@ -42,45 +47,64 @@ async def create_league(
     return response
 
 
-@router.get("/", response_model=List[LeagueResponse])
+@router.get("/", response_model=List[LeagueResponse], dependencies=[Depends(query_budget(3))])
 async def get_leagues(
-        db: Session = Depends(get_db),
+        request: Request,
+        response: Response,
+        db: Session = Depends(get_read_db),
 ):
-    """Liste toutes les ligues avec leur membres et administrateurs"""
-    # Récupération de toutes les ligues
-    leagues = db.query(League).all()
-
-    # Pour chaque ligue, récupérer les membres et les administrateurs
-    league_responses = []
-    for league in leagues:
-        # Récupérer la ligue avec ses membres
-        league_data = league_crud.get_league_with_members(db, league.id)
-
-        # Récupérer les IDs des administrateurs séparément
-        admin_records = db.query(LeagueAdmin).filter(LeagueAdmin.league_id == league.id).all()
-        admin_ids = [admin.user_id for admin in admin_records]
-
-        # Créer un objet de réponse compatible avec LeagueResponse
-        # au lieu de modifier directement l'objet SQLAlchemy
-        league_dict = {
-            "id": league_data.id,
-            "name": league_data.name,
-            "description": league_data.description,
-            "members": league_data.members,
-            "admins": admin_ids  # Ajouter les admins ici
+    """
+    Liste toutes les ligues avec leur membres et administrateurs
+    (ETag dérivé des versions des ligues et de leurs membres : 304 si If-None-Match correspond)
+    """
+    etag = entity_tag("leagues", fast_reads.get_league_stamps(db))
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    response.headers.update(etag_headers(etag))
+
+    # Récupération de toutes les ligues et de leurs membres en une requête
+    # (la ligue de chaque membre est chargée dans la même jointure pour la sérialisation)
+    leagues = db.query(League).options(
+        joinedload(League.members).joinedload(User.league)
+    ).all()
+
+    # Récupération des IDs des administrateurs de toutes les ligues en une requête
+    admin_ids_by_league = defaultdict(list)
+    for admin in db.query(LeagueAdmin).all():
+        admin_ids_by_league[admin.league_id].append(admin.user_id)
+
+    # Créer un objet de réponse compatible avec LeagueResponse
+    # au lieu de modifier directement l'objet SQLAlchemy
+    return [
+        {
+            "id": league.id,
+            "name": league.name,
+            "description": league.description,
+            "members": league.members,
+            "admins": admin_ids_by_league[league.id]
         }
-
-        league_responses.append(league_dict)
-
-    return league_responses
+        for league in leagues
+    ]
 
 
 @router.get("/{league_id}", response_model=LeagueResponse)
 async def get_league(
         league_id: int,
-        db: Session = Depends(get_db)
+        request: Request,
+        response: Response,
+        db: Session = Depends(get_read_db)
 ):
-    """Récupère une ligue spécifique avec ses membres et administrateurs"""
+    """Récupère une ligue spécifique avec ses membres et administrateurs (ETag : voir get_leagues)"""
+    stamp = fast_reads.get_league_stamp(db, league_id)
+    if not stamp:
+        raise HTTPException(status_code=404, detail="Ligue non trouvée")
+    etag = entity_tag("league", stamp)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    response.headers.update(etag_headers(etag))
+
     # Récupérer la ligue avec ses membres
     league = league_crud.get_league_with_members(db, league_id)
     if not league:
@@ -127,7 +151,9 @@ async def join_league(
     # Mettre l'utilisateur en statut "en attente" pour cette ligue
     current_user.league_id = league_id
     current_user.member_status = "PENDING"
+    league_crud.touch_leagues(db, league_id)
     db.commit()
+    user_cache.invalidate_user(user_id=current_user.id)
 
     return {"status": "success", "message": "Demande d'adhésion envoyée"}
 
@@ -163,6 +189,7 @@ async def approve_member(
     # Approuver l'utilisateur
     user.member_status = "APPROVED"
     db.commit()
+    user_cache.invalidate_user(user_id=user.id)
 
     return {"status": "success", "message": "Membre approuvé avec succès"}
 
@@ -198,6 +225,8 @@ async def reject_member(
     # Retirer l'utilisateur de la ligue
     user.league_id = None
     user.member_status = None
+    league_crud.touch_leagues(db, league_id)
     db.commit()
+    user_cache.invalidate_user(user_id=user.id)
 
     return {"status": "success", "message": "Membre rejeté avec succès"}
\ No newline at end of file
@@ -0,0 +1,51 @@
+# backend/app/routes/monitoring.py
+from fastapi import APIRouter, Depends
+
+from .auth import get_current_admin
+from ..models.models import User
+from ..services.user_cache import user_cache
+from ..instrumentation import slow_query_log
+from ..pool_monitoring import pool_registry
+
+router = APIRouter()
+
+
+@router.get("/auth-cache")
+async def get_auth_cache_stats(
+    current_user: User = Depends(get_current_admin)
+):
+    """Statistiques du cache des utilisateurs authentifiés (taux de succès, évictions...)"""
+    return user_cache.stats()
+
+
+@router.get("/slow-queries")
+async def get_slow_queries(
+    sort_by: str = "total_ms",
+    limit: int = 50,
+    current_user: User = Depends(get_current_admin)
+):
+    """
+    Agrégat des requêtes SQL par empreinte : nombre, p50/p95/max, lignes.
+    sort_by : total_ms, count, p50_ms, p95_ms, max_ms, rows
+    """
+    return {
+        "threshold_ms": slow_query_log.threshold_ms,
+        "queries": slow_query_log.report(sort_by=sort_by, limit=limit)
+    }
+
+
+@router.delete("/slow-queries")
+async def reset_slow_queries(
+    current_user: User = Depends(get_current_admin)
+):
+    """Remet à zéro l'agrégat des requêtes"""
+    slow_query_log.reset()
+    return {"status": "success", "message": "Statistiques des requêtes réinitialisées"}
+
+
+@router.get("/pool")
+async def get_pool_metrics(
+    current_user: User = Depends(get_current_admin)
+):
+    """Métriques des pools de connexions : occupation, débordement, attentes, pings"""
+    return [metrics.snapshot() for metrics in pool_registry.values()]
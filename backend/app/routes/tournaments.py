@@ -1,28 +1,52 @@
 # backend/app/routes/tournaments.py
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 import logging
 
 from ..schemas.schemas import (
     TournamentCreate, 
     TournamentResponse, 
-    RebuyRequest
+    RebuyRequest,
+    BulkRegistrationRequest,
+    BulkRegistrationResponse,
+    TournamentResultsRequest,
+    TournamentEventResponse,
+    ResultsImportReport
 )
-from ..models.models import TournamentType, TournamentStatus, Tournament
+from ..models.models import (
+    TournamentType,
+    TournamentStatus,
+    Tournament
+)
+from ..models.configuration import TournamentConfiguration
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Header, File, UploadFile, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, joinedload
 from datetime import datetime
+import io
 
-from ..database import get_db
+from ..database import get_db, get_read_db
+from ..instrumentation import query_budget
+from ..serialization import trusted_response, sparse_fields, entity_tag, etag_headers, not_modified
 from ..crud import tournament as tournament_crud
+from ..crud import events as events_crud
+from ..crud import archive as archive_crud
+from ..crud import fast_reads
+from ..crud import results_import
+from ..models.events import TournamentEventType
 from ..schemas.schemas import TournamentStateUpdate
 from .auth import get_current_user
-from ..models.models import User
+from ..services.leaderboard_service import leaderboard_service
+from ..services.clay_token_cache import clay_token_cache
+from ..models.models import User, LeagueAdmin
 from .websockets import (
     notify_tournament_started,
     notify_level_change,
     notify_pause_status,
     notify_player_eliminated,
+    notify_results_recorded,
     notify_rebuy,
     notify_table_update,
     notify_timer_tick
@@ -33,13 +57,25 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+# Profils de chargement du tournoi : options appliquées à l'unique SELECT de la requête
+LOAD_PROFILES = {
+    # Ligne du tournoi seule (contrôles et mises à jour de colonnes)
+    "row": (),
+    # Avec sa configuration et sa structure de blindes (changement de niveau,
+    # jetons de départ des rebuys)
+    "blinds": (
+        joinedload(Tournament.configuration).joinedload(TournamentConfiguration.blinds_structure),
+    )
+}
+
+
 # Fonction d'autorisation centralisée
-def check_tournament_admin(tournament_id: int, user_id: int, db: Session):
+def check_tournament_admin(tournament_id: int, user_id: int, db: Session, options=()):
     """
     Vérifie que l'utilisateur est admin du tournoi et que le tournoi existe
     Retourne le tournoi si OK, sinon lève une exception HTTPException
     """
-    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
+    tournament = db.query(Tournament).options(*options).filter(Tournament.id == tournament_id).first()
 
     if not tournament:
         raise HTTPException(
@@ -55,6 +91,55 @@ def check_tournament_admin(tournament_id: int, user_id: int, db: Session):
 
     return tournament
 
+def load_tournament(profile: str = "row"):
+    """
+    Dépendance chargeant le tournoi de la route une seule fois par requête,
+    selon un profil de LOAD_PROFILES, et vérifiant que l'utilisateur en est l'admin.
+
+    Le tournoi est conservé dans request.state et dans l'identity map de la session
+    (partagée avec la route via get_db) : les fonctions CRUD qui le relisent par
+    db.query(Tournament).get(id) n'émettent pas de nouvelle requête.
+    Le cache est indexé par (tournoi, profil) : une dépendance demandant un profil
+    plus riche dans la même requête ne reçoit pas un tournoi chargé plus léger.
+    """
+    options = LOAD_PROFILES[profile]
+
+    async def dependency(
+        tournament_id: int,
+        request: Request,
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+    ) -> Tournament:
+        loaded = getattr(request.state, "tournaments", None)
+        if loaded is None:
+            loaded = request.state.tournaments = {}
+        key = (tournament_id, profile)
+        if key not in loaded:
+            loaded[key] = check_tournament_admin(tournament_id, current_user.id, db, options)
+        return loaded[key]
+
+    return dependency
+
+def if_match_version(if_match: Optional[str] = Header(None)) -> Optional[int]:
+    """
+    Version du tournoi connue du client, lue dans l'en-tête If-Match
+    (formes acceptées : 3, "3", W/"3", ou l'ETag de GET /tournaments/{id}
+    "3-<empreinte>"). Absent ou "*" : pas de précondition.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    value = if_match.strip()
+    if value.startswith("W/"):
+        value = value[2:]
+    try:
+        return int(value.strip('"').split("-", 1)[0])
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="En-tête If-Match invalide"
+        )
+
+
 @router.post("/", response_model=TournamentResponse)
 async def create_tournament(
     tournament: TournamentCreate,
@@ -71,38 +156,155 @@ async def create_tournament(
             detail=str(e)
         )
 
-@router.get("/", response_model=List[TournamentResponse])
+@router.post("/import", response_model=ResultsImportReport)
+async def import_tournament_results(
+    file: UploadFile = File(...),
+    league_id: Optional[int] = None,
+    file_format: Optional[str] = None,
+    chunk_size: int = 1000,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Importe l'historique des résultats d'une ligue depuis un fichier CSV ou NDJSON
+    (admin de la ligue uniquement, format des colonnes : voir crud/results_import.py)
+    """
+    league_id = league_id or current_user.league_id
+    is_admin = db.query(LeagueAdmin).filter(
+        LeagueAdmin.league_id == league_id,
+        LeagueAdmin.user_id == current_user.id
+    ).first()
+    if not is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Seuls les administrateurs de la ligue peuvent importer des résultats"
+        )
+
+    file_format = (file_format or (file.filename or "").rsplit(".", 1)[-1]).lower()
+    if file_format in ("json", "jsonl"):
+        file_format = "ndjson"
+    if file_format not in ("csv", "ndjson"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Format de fichier non supporté (csv ou ndjson)"
+        )
+    if not 1 <= chunk_size <= 10000:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="chunk_size doit être compris entre 1 et 10000"
+        )
+
+    # Le fichier reçu est déjà sur disque (SpooledTemporaryFile) : lecture ligne à ligne
+    lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    rows = results_import.iter_csv_rows(lines) if file_format == "csv" else results_import.iter_ndjson_rows(lines)
+
+    def log_progress(report):
+        logger.info(
+            f"Import ligue {league_id} : {report.rows_read} lignes lues, "
+            f"{report.tournaments_imported} tournois importés"
+        )
+
+    # Import synchrone et potentiellement long : hors de la boucle d'événements
+    report = results_import.ImportReport()
+    error = None
+    try:
+        await run_in_threadpool(
+            results_import.import_results,
+            db, league_id, current_user.id, rows, chunk_size, log_progress, report
+        )
+    except UnicodeDecodeError:
+        error = (status.HTTP_400_BAD_REQUEST, "Le fichier doit être encodé en UTF-8")
+    except SQLAlchemyError:
+        logger.exception(f"Import ligue {league_id} interrompu")
+        error = (status.HTTP_500_INTERNAL_SERVER_ERROR, "Erreur de base de données pendant l'import")
+    finally:
+        # Les lots déjà commités restent en base, même si l'import s'est interrompu
+        if report.updated_user_ids:
+            leaderboard_service.refresh_players(db, league_id, list(report.updated_user_ids))
+            clay_token_cache.invalidate()
+
+    if error:
+        status_code, message = error
+        return JSONResponse(
+            status_code=status_code,
+            content={"detail": f"{message} (import interrompu)", "report": report.to_dict()}
+        )
+
+    return report.to_dict()
+
+@router.get("/", response_model=List[TournamentResponse], dependencies=[Depends(query_budget(2))])
 async def list_tournaments(
     skip: int = 0,
     limit: int = 100,
     status: Optional[TournamentStatus] = None,
     tournament_type: Optional[TournamentType] = None,
-    db: Session = Depends(get_db)
+    fields: Optional[FrozenSet[str]] = Depends(sparse_fields(TournamentResponse)),
+    db: Session = Depends(get_read_db)
 ):
-    """Liste les tournois avec filtres optionnels"""
+    """Liste les tournois avec filtres optionnels (?fields= : champs renvoyés)"""
     logger.debug("Recherche de la liste des tournois")
 
-    return tournament_crud.list_tournaments(
-        db, 
-        skip=skip, 
+    # Dictionnaires lus en base au format TournamentResponse : pas de revalidation
+    return trusted_response(fast_reads.list_tournament_responses(
+        db,
+        skip=skip,
         limit=limit,
         status=status,
-        tournament_type=tournament_type
-    )
+        tournament_type=tournament_type,
+        fields=fields
+    ))
+
+@router.get("/history", response_model=List[TournamentResponse], dependencies=[Depends(query_budget(3))])
+async def list_tournament_history(
+    skip: int = 0,
+    limit: int = 50,
+    league_id: Optional[int] = None,
+    db: Session = Depends(get_read_db)
+):
+    """Liste les tournois terminés, y compris les tournois archivés"""
+    return archive_crud.list_tournament_history(db, skip=skip, limit=limit, league_id=league_id)
 
-@router.get("/{tournament_id}", response_model=TournamentResponse)
+@router.get("/{tournament_id}", response_model=TournamentResponse, dependencies=[Depends(query_budget(3))])
 async def get_tournament(
     tournament_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    fields: Optional[FrozenSet[str]] = Depends(sparse_fields(TournamentResponse)),
+    db: Session = Depends(get_read_db)
 ):
-    """Récupère les détails d'un tournoi spécifique"""
-    tournament = tournament_crud.get_tournament(db, tournament_id)
-    if not tournament:
+    """
+    Récupère les détails d'un tournoi spécifique (archives incluses).
+    ?fields=status,current_level : seuls ces champs sont lus et renvoyés.
+
+    Réponse accompagnée d'un ETag ("<version>-<empreinte>") : avec If-None-Match,
+    un tournoi inchangé est validé par une seule requête (304, sans corps).
+    """
+    stamp = fast_reads.get_tournament_stamp(db, tournament_id)
+    if not stamp:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tournoi non trouvé"
         )
-    return tournament
+    etag = entity_tag(stamp["stamp"], tuple(sorted(fields or ())), version=stamp["version"])
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+
+    tournament = fast_reads.get_tournament_response(db, tournament_id, fields, archived=stamp["archived"])
+    return trusted_response(tournament, headers=etag_headers(etag))
+
+@router.get("/{tournament_id}/clock", dependencies=[Depends(query_budget(1))])
+async def get_tournament_clock(
+    tournament_id: int,
+    db: Session = Depends(get_read_db)
+):
+    """Horloge du tournoi : niveau, blindes et temps restant à l'instant de la lecture"""
+    clock = fast_reads.get_clock_snapshot(db, tournament_id)
+    if not clock:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tournoi non trouvé"
+        )
+    return clock
 
 @router.post("/{tournament_id}/register")
 async def register_to_tournament(
@@ -125,6 +327,30 @@ async def register_to_tournament(
         )
 
 
+@router.post("/{tournament_id}/registrations:bulk", response_model=BulkRegistrationResponse,
+             dependencies=[Depends(query_budget(7))])
+async def bulk_register_to_tournament(
+    tournament_id: int,
+    request: BulkRegistrationRequest,
+    db: Session = Depends(get_db),
+    tournament: Tournament = Depends(load_tournament())
+):
+    """Inscrit une liste de joueurs au tournoi (admin uniquement), avec un résultat par joueur"""
+    try:
+        results = tournament_crud.register_players(db, tournament_id, request.user_ids)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    return BulkRegistrationResponse(
+        tournament_id=tournament_id,
+        registered_count=sum(1 for result in results if result["status"] == "registered"),
+        results=results
+    )
+
+
 @router.post("/{tournament_id}/unregister")
 async def unregister_from_tournament(
         tournament_id: int,
@@ -148,20 +374,28 @@ async def unregister_from_tournament(
             detail=f"Erreur lors de la désinscription: {str(e)}"
         )
 
-@router.post("/{tournament_id}/start")
+@router.post("/{tournament_id}/start", dependencies=[Depends(load_tournament())])
 async def start_tournament(
         tournament_id: int,
         background_tasks: BackgroundTasks,
         db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
+        current_user: User = Depends(get_current_user),
+        expected_version: Optional[int] = Depends(if_match_version)
 ):
     """Démarre le tournoi (admin uniquement)"""
-    tournament = tournament_crud.update_tournament_status(
-        db,
-        tournament_id,
-        TournamentStatus.IN_PROGRESS,
-        current_user.id
-    )
+    try:
+        tournament = tournament_crud.update_tournament_status(
+            db,
+            tournament_id,
+            TournamentStatus.IN_PROGRESS,
+            current_user.id,
+            expected_version
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     if not tournament:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -179,10 +413,11 @@ async def pause_tournament(
         tournament_id: int,
         background_tasks: BackgroundTasks,
         db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
+        tournament: Tournament = Depends(load_tournament()),
+        expected_version: Optional[int] = Depends(if_match_version)
 ):
     """Met en pause le tournoi """
-    tournament = check_tournament_admin(tournament_id, current_user.id, db)
+    tournament_crud.check_version(tournament, expected_version)
 
     # Vérification de l'état du tournoi
     if tournament.status != TournamentStatus.IN_PROGRESS:
@@ -205,7 +440,12 @@ async def pause_tournament(
         tournament.last_timer_update = now
 
     # Marquer comme en pause
-    tournament.paused_at = datetime.utcnow()
+    paused_at = datetime.utcnow()
+    tournament.paused_at = paused_at
+    events_crud.record_event(
+        db, tournament_id, TournamentEventType.PAUSED,
+        value=tournament.seconds_remaining, payload=events_crud.timer_payload(paused_at)
+    )
     db.commit()
     db.refresh(tournament)
 
@@ -231,22 +471,11 @@ async def resume_tournament(
         tournament_id: int,
         background_tasks: BackgroundTasks,
         db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
+        tournament: Tournament = Depends(load_tournament()),
+        expected_version: Optional[int] = Depends(if_match_version)
 ):
     """Reprend le tournoi après une pause avec validation et notification améliorées"""
-    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
-    if not tournament:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Tournoi non trouvé"
-        )
-
-    # Vérification stricte des autorisations
-    if tournament.admin_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Vous n'êtes pas l'administrateur de ce tournoi"
-        )
+    tournament_crud.check_version(tournament, expected_version)
 
     # Vérification de l'état du tournoi
     if tournament.status != TournamentStatus.IN_PROGRESS:
@@ -260,8 +489,13 @@ async def resume_tournament(
         return {"status": "success", "message": "Tournoi déjà en marche"}
 
     # Mettre à jour le timestamp
-    tournament.last_timer_update = datetime.utcnow()
+    now = datetime.utcnow()
+    tournament.last_timer_update = now
     tournament.paused_at = None
+    events_crud.record_event(
+        db, tournament_id, TournamentEventType.RESUMED,
+        value=tournament.seconds_remaining, payload=events_crud.timer_payload(now)
+    )
     db.commit()
     db.refresh(tournament)
 
@@ -288,22 +522,11 @@ async def update_tournament_level(
         level_number: int,
         background_tasks: BackgroundTasks,
         db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
+        tournament: Tournament = Depends(load_tournament("blinds")),
+        expected_version: Optional[int] = Depends(if_match_version)
 ):
     """Met à jour le niveau actuel du tournoi avec validation améliorée"""
-    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
-    if not tournament:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Tournoi non trouvé"
-        )
-
-    # Vérification stricte des autorisations
-    if tournament.admin_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Vous n'êtes pas l'administrateur de ce tournoi"
-        )
+    tournament_crud.check_version(tournament, expected_version)
 
     # Vérification de l'état du tournoi
     if tournament.status != TournamentStatus.IN_PROGRESS:
@@ -345,7 +568,12 @@ async def update_tournament_level(
     tournament.current_level = level_number
     tournament.seconds_remaining = level_data.get("duration", 15) * 60  # Convertir en secondes
     tournament.level_duration = level_data.get("duration", 15) * 60
-    tournament.last_timer_update = datetime.utcnow()
+    now = datetime.utcnow()
+    tournament.last_timer_update = now
+    events_crud.record_event(
+        db, tournament_id, TournamentEventType.LEVEL_CHANGED,
+        value=level_number, amount=tournament.level_duration, payload=events_crud.timer_payload(now)
+    )
     db.commit()
 
     # Notifier du changement de niveau
@@ -368,23 +596,22 @@ async def eliminate_player(
         background_tasks: BackgroundTasks,
         prize_amount: float = 0,
         db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
+        tournament: Tournament = Depends(load_tournament())
 ):
     """Élimine un joueur du tournoi"""
-    tournament = tournament_crud.get_tournament(db, tournament_id)
-    if not tournament or tournament.admin_id != current_user.id:
+    try:
+        result = tournament_crud.process_elimination(
+            db,
+            tournament_id,
+            player_id,
+            position,
+            prize_amount
+        )
+    except ValueError as e:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Permissions insuffisantes"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
-
-    result = tournament_crud.process_elimination(
-        db,
-        tournament_id,
-        player_id,
-        position,
-        prize_amount
-    )
     if not result:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -397,6 +624,30 @@ async def eliminate_player(
     return {"status": "success", "message": "Joueur éliminé"}
 
 
+@router.post("/{tournament_id}/results", dependencies=[Depends(query_budget(6))])
+async def record_tournament_results(
+        tournament_id: int,
+        request: TournamentResultsRequest,
+        background_tasks: BackgroundTasks,
+        db: Session = Depends(get_db),
+        tournament: Tournament = Depends(load_tournament())
+):
+    """Enregistre le classement final complet (positions et gains) en une opération"""
+    results = [result.dict() for result in request.results]
+    try:
+        updated = tournament_crud.record_results(db, tournament_id, results)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    # Une seule notification pour tout le classement
+    background_tasks.add_task(notify_results_recorded, tournament_id, results)
+
+    return {"status": "success", "message": f"{updated} résultats enregistrés"}
+
+
 @router.post("/{tournament_id}/rebuy")
 async def process_rebuy(
         tournament_id: int,
@@ -404,15 +655,14 @@ async def process_rebuy(
         amount: float,
         background_tasks: BackgroundTasks,
         db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
+        tournament: Tournament = Depends(load_tournament("blinds"))
 ):
     """Traite un rebuy pour un joueur"""
-    tournament = tournament_crud.get_tournament(db, tournament_id)
-    if not tournament or tournament.admin_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Permissions insuffisantes"
-        )
+    # Lu avant le commit, qui expire le tournoi (les jetons de départ sont
+    # portés par la structure de blindes de la configuration)
+    starting_chips = (
+        tournament.configuration.blinds_structure.starting_chips if tournament.configuration else None
+    )
 
     result = tournament_crud.process_rebuy(
         db,
@@ -431,7 +681,7 @@ async def process_rebuy(
         notify_rebuy,
         tournament_id,
         player_id,
-        tournament.configuration.starting_chips
+        starting_chips
     )
 
     return {"status": "success", "message": "Rebuy effectué"}
@@ -444,15 +694,11 @@ async def update_timer(
         seconds_remaining: int,
         background_tasks: BackgroundTasks,
         db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
+        tournament: Tournament = Depends(load_tournament()),
+        expected_version: Optional[int] = Depends(if_match_version)
 ):
     """Met à jour manuellement le temps restant du timer"""
-    tournament = tournament_crud.get_tournament(db, tournament_id)
-    if not tournament or tournament.admin_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Permissions insuffisantes"
-        )
+    tournament_crud.check_version(tournament, expected_version)
 
     # Valider les données
     if seconds_remaining < 0:
@@ -462,8 +708,15 @@ async def update_timer(
         )
 
     # Mettre à jour le timer
+    now = datetime.utcnow()
     tournament.seconds_remaining = seconds_remaining
-    tournament.last_timer_update = datetime.utcnow()
+    tournament.last_timer_update = now
+    # Lu avant le commit, qui expire le tournoi
+    level_duration = tournament.level_duration
+    events_crud.record_event(
+        db, tournament_id, TournamentEventType.TIMER_SET,
+        value=seconds_remaining, payload=events_crud.timer_payload(now)
+    )
     db.commit()
 
     # Notifier de la mise à jour
@@ -471,26 +724,28 @@ async def update_timer(
         notify_timer_tick,
         tournament_id,
         seconds_remaining,
-        tournament.level_duration
+        level_duration
     )
 
     return {"status": "success", "message": "Timer mis à jour"}
 
 
-@router.post("/{tournament_id}/tables")
+@router.post("/{tournament_id}/tables", dependencies=[Depends(load_tournament())])
 async def update_tables_state(
         tournament_id: int,
         tables_state: dict,
         background_tasks: BackgroundTasks,
         db: Session = Depends(get_db),
-        current_user: User = Depends(get_current_user)
+        current_user: User = Depends(get_current_user),
+        expected_version: Optional[int] = Depends(if_match_version)
 ):
     """Met à jour l'état des tables"""
     result = tournament_crud.update_table_state(
         db,
         tournament_id,
         tables_state,
-        current_user.id
+        current_user.id,
+        expected_version
     )
     if not result:
         raise HTTPException(
@@ -503,24 +758,39 @@ async def update_tables_state(
 
     return {"status": "success", "message": "État des tables mis à jour"}
 
-@router.post("/{tournament_id}/complete")
+@router.post("/{tournament_id}/complete", dependencies=[Depends(load_tournament())])
 async def complete_tournament(
     tournament_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    expected_version: Optional[int] = Depends(if_match_version)
 ):
     """Termine le tournoi"""
-    tournament = tournament_crud.update_tournament_status(
-        db,
-        tournament_id,
-        TournamentStatus.COMPLETED,
-        current_user.id
-    )
+    try:
+        tournament = tournament_crud.update_tournament_status(
+            db,
+            tournament_id,
+            TournamentStatus.COMPLETED,
+            current_user.id,
+            expected_version
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     if not tournament:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tournoi non trouvé ou permissions insuffisantes"
         )
+
+    # Rafraîchir les classements des joueurs du tournoi
+    leaderboard_service.refresh_tournament(db, tournament)
+
+    if tournament.tournament_type == TournamentType.JAPT:
+        clay_token_cache.invalidate()
+
     return {"status": "success", "message": "Tournoi terminé"}
 
 @router.post("/{tournament_id}/clay-token")
@@ -528,32 +798,40 @@ async def update_clay_token_holder(
     tournament_id: int,
     player_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    tournament: Tournament = Depends(load_tournament()),
+    expected_version: Optional[int] = Depends(if_match_version)
 ):
     """Met à jour le détenteur du jeton d'argile"""
-    tournament = tournament_crud.get_tournament(db, tournament_id)
-    if not tournament or tournament.admin_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Permissions insuffisantes"
-        )
-        
     result = tournament_crud.update_clay_token_holder(
         db,
         tournament_id,
-        player_id
+        player_id,
+        expected_version
     )
     if not result:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Erreur lors de la mise à jour du détenteur du jeton"
         )
+
+    clay_token_cache.invalidate()
+
     return {"status": "success", "message": "Détenteur du jeton mis à jour"}
 
+@router.get("/{tournament_id}/events", response_model=List[TournamentEventResponse])
+async def list_tournament_events(
+    tournament_id: int,
+    after_seq: int = 0,
+    limit: int = 500,
+    db: Session = Depends(get_read_db)
+):
+    """Journal des événements du tournoi, à partir d'un numéro de séquence"""
+    return events_crud.list_tournament_events(db, tournament_id, after_seq=after_seq, limit=limit)
+
 @router.get("/{tournament_id}/statistics")
 async def get_tournament_statistics(
     tournament_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Récupère les statistiques du tournoi"""
     stats = tournament_crud.get_tournament_statistics(db, tournament_id)
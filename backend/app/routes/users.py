@@ -1,17 +1,17 @@
 # backend/app/routes/users.py
 from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile
-from sqlalchemy import func, desc
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 import shutil
 import logging
 from pathlib import Path
 from datetime import datetime
 
 
-from ..database import get_db
+from ..database import get_db, get_read_db
 from ..crud import user as user_crud
-from ..models.models import Tournament, TournamentParticipation
+from ..crud import stats as stats_crud
+from ..crud import fast_reads
 
 from ..schemas.schemas import (
     UserResponse,
@@ -21,6 +21,9 @@ from ..schemas.schemas import (
     ClayTokenHistoryResponse
 )
 from .auth import get_current_user
+from ..services.clay_token_cache import clay_token_cache
+from ..instrumentation import query_budget
+from ..serialization import trusted_response, sparse_fields
 from ..models.models import User
 
 router = APIRouter()
@@ -44,16 +47,17 @@ PROFILE_IMAGES_DIR.mkdir(parents=True, exist_ok=True)
 #     return users
 
 
-@router.get("/profile", response_model=UserResponse)
+@router.get("/profile", response_model=UserResponse, dependencies=[Depends(query_budget(2))])
 async def get_profile(
+    fields: Optional[FrozenSet[str]] = Depends(sparse_fields(UserResponse)),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     """
     Endpoint pour récupérer les informations de l'utilisateur connecté
+    (?fields= : champs renvoyés)
     """
-    user = user_crud.get_user_with_league(db, current_user.id)
-    return user
+    return trusted_response(fast_reads.get_user_response(db, current_user.id, fields))
 
 
 @router.put("/profile", response_model=UserResponse)
@@ -75,6 +79,10 @@ async def update_profile(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Erreur lors de la mise à jour du profil"
         )
+
+    if profile_data.profile_image_path is not None:
+        clay_token_cache.invalidate()
+
     return updated_user
 
 @router.post("/profile/image")
@@ -122,6 +130,9 @@ async def upload_profile_image(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Erreur lors de la mise à jour du profil"
         )
+
+    # L'image du détenteur est copiée dans la chronologie du jeton d'argile
+    clay_token_cache.invalidate()
     
     return {
         "status": "success",
@@ -131,25 +142,14 @@ async def upload_profile_image(
 
 
 
-@router.get("/current-clay-token-holder", response_model=ClayTokenHistoryResponse)
+@router.get("/current-clay-token-holder", response_model=ClayTokenHistoryResponse,
+            dependencies=[Depends(query_budget(2))])
 async def get_current_clay_token_holder(db: Session = Depends(get_db)):
     """Récupère l'utilisateur qui détient actuellement le jeton d'argile"""
-    # On cherche le dernier tournoi terminé de type JAPT
-    print("Route called")
-
-    last_tournament = (
-        db.query(Tournament)
-        .filter(
-                Tournament.tournament_type == 'JAPT',
-                Tournament.status == 'COMPLETED',
-                Tournament.clay_token_holder_id.isnot(None)
-        )
-        .order_by(Tournament.end_time.desc())
-        .first()
-    )
+    # Dernier tournoi JAPT terminé, lu depuis le cache de la chronologie
+    current_holder = clay_token_cache.current(db)
 
-
-    if not last_tournament:
+    if not current_holder:
         return ClayTokenHistoryResponse(
             tournament_id=0,
             holder_id=0,
@@ -159,37 +159,23 @@ async def get_current_clay_token_holder(db: Session = Depends(get_db)):
             tournament_name="Aucun tournoi"
         )
 
-
-    # Construction de la réponse
-    return ClayTokenHistoryResponse(
-        tournament_id=last_tournament.id,
-        holder_id=last_tournament.clay_token_holder_id,
-        holder_username=last_tournament.clay_token_holder.username,
-        holder_profile_image=last_tournament.clay_token_holder.profile_image_path,
-        date=last_tournament.end_time,
-        tournament_name=last_tournament.name
-    )
+    return ClayTokenHistoryResponse(**current_holder)
 
 
 @router.get("/bounty-hunters", response_model=List[BountyHunterResponse])
 async def get_bounty_hunters_ranking(
     limit: int = 10,
-    db: Session = Depends(get_db)
+    league_id: Optional[int] = None,
+    season: Optional[int] = None,
+    db: Session = Depends(get_read_db)
 ):
     """Récupère le classement des chasseurs de primes"""
-    # Calcul du nombre de primes obtenues par joueur
-    bounty_hunters = (
-        db.query(
-            User,
-            func.count(Tournament.bounty_hunter_id).label('bounty_count'),
-            func.sum(Tournament.prize_pool * 0.1).label('bounty_earnings')  # 10% du prize pool
-        )
-        .join(Tournament, Tournament.bounty_hunter_id == User.id)
-        .filter(Tournament.status == 'COMPLETED')
-        .group_by(User.id)
-        .order_by(desc('bounty_count'), desc('bounty_earnings'))
-        .limit(limit)
-        .all()
+    # Lecture des compteurs pré-calculés dans player_stats
+    bounty_hunters = stats_crud.get_bounty_hunters_ranking(
+        db,
+        limit=limit,
+        league_id=league_id,
+        season=season
     )
 
     return [
@@ -203,42 +189,36 @@ async def get_bounty_hunters_ranking(
         for hunter in bounty_hunters
     ]
 
-@router.get("/clay-token/history", response_model=List[ClayTokenHistoryResponse])
+@router.get("/clay-token/history", response_model=List[ClayTokenHistoryResponse],
+            dependencies=[Depends(query_budget(2))])
 async def get_clay_token_history(
     skip: int = 0,
     limit: int = 50,
     db: Session = Depends(get_db)
 ):
     """Récupère l'historique des détenteurs du jeton d'argile"""
-    history = (
-        db.query(Tournament)
-        .filter(
-            Tournament.tournament_type == 'JAPT',
-            Tournament.status == 'COMPLETED',
-            Tournament.clay_token_holder_id.isnot(None)
-        )
-        .order_by(Tournament.end_time.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
-
+    # Chronologie chargée en une requête par table (détenteurs inclus) puis mise en cache
     return [
-        ClayTokenHistoryResponse(
-            tournament_id=tournament.id,
-            holder_id=tournament.clay_token_holder_id,
-            holder_username=tournament.clay_token_holder.username,
-            holder_profile_image=tournament.clay_token_holder.profile_image_path,
-            date=tournament.end_time,
-            tournament_name=tournament.name
-        )
-        for tournament in history
+        ClayTokenHistoryResponse(**entry)
+        for entry in clay_token_cache.history(db, skip=skip, limit=limit)
     ]
 
+@router.get("/statistics/league/{league_id}", response_model=List[dict])
+async def get_league_statistics(
+    league_id: int,
+    season: Optional[int] = None,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Récupère les statistiques cumulées de tous les joueurs d'une ligue"""
+    return stats_crud.list_league_player_stats(db, league_id, season)
+
 @router.get("/statistics/{user_id}", response_model=dict)
 async def get_user_statistics(
     user_id: int,
-    db: Session = Depends(get_db),
+    league_id: Optional[int] = None,
+    season: Optional[int] = None,
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Récupère les statistiques d'un joueur"""
@@ -249,65 +229,23 @@ async def get_user_statistics(
             detail="Utilisateur non trouvé"
         )
 
-    # Statistiques générales
-    participations = (
-        db.query(TournamentParticipation)
-        .filter(TournamentParticipation.user_id == user_id)
-        .join(Tournament)
-        .filter(Tournament.status == 'COMPLETED')
-        .all()
-    )
-
-    total_games = len(participations)
-    if total_games == 0:
-        return {
-            "total_games": 0,
-            "total_earnings": 0,
-            "roi": 0,
-            "average_position": 0,
-            "victories": 0,
-            "bounties": 0
-        }
-
-    total_buyin = sum(p.total_buyin for p in participations)
-    total_earnings = sum(p.prize_won for p in participations)
-    roi = ((total_earnings - total_buyin) / total_buyin * 100) if total_buyin > 0 else 0
-
-    # Nombre de victoires
-    victories = sum(1 for p in participations if p.current_position == 1)
-
-    # Nombre de primes obtenues
-    bounties = (
-        db.query(func.count(Tournament.id))
-        .filter(Tournament.bounty_hunter_id == user_id)
-        .scalar()
-    )
-
-    # Position moyenne
-    avg_position = sum(p.current_position for p in participations) / total_games
-
-    return {
-        "total_games": total_games,
-        "total_earnings": total_earnings,
-        "roi": roi,
-        "average_position": avg_position,
-        "victories": victories,
-        "bounties": bounties
-    }
+    # Statistiques pré-agrégées (quelques lignes par joueur dans player_stats)
+    return stats_crud.get_user_statistics(db, user_id, league_id=league_id, season=season)
 
-@router.get("/{user_id}", response_model=UserResponse)
+@router.get("/{user_id}", response_model=UserResponse, dependencies=[Depends(query_budget(2))])
 async def get_user(
     user_id: int,
+    fields: Optional[FrozenSet[str]] = Depends(sparse_fields(UserResponse)),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Récupère les informations d'un utilisateur spécifique
+    Récupère les informations d'un utilisateur spécifique (?fields= : champs renvoyés)
     """
-    user = user_crud.get_user_by_id(db, user_id)
+    user = fast_reads.get_user_response(db, user_id, fields)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Utilisateur non trouvé"
         )
-    return user
\ No newline at end of file
+    return trusted_response(user)
\ No newline at end of file
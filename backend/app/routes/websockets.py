@@ -4,13 +4,14 @@ from sqlalchemy.orm import Session, joinedload
 from typing import Dict, List, Optional
 import asyncio
 import json
-import datetime
+from datetime import datetime
 import logging
 
 
 from ..database import get_db
 from ..models.configuration import TournamentConfiguration
-from ..models.models import Tournament, TournamentStatus, TournamentParticipation
+from ..models.models import Tournament, TournamentStatus
+from ..services.tournament_state import tournament_state_store
 
 router = APIRouter()
 
@@ -88,11 +89,10 @@ async def tournament_websocket(
         db: Session = Depends(get_db)
 ):
     """Point de terminaison WebSocket pour les mises à jour en temps réel des tournois"""
-    # Vérifier que le tournoi existe avec toutes les relations nécessaires
+    # Vérifier que le tournoi existe (données statiques uniquement : l'état en
+    # direct est reconstruit depuis le journal d'événements)
     tournament = db.query(Tournament).options(
-        joinedload(Tournament.participations).joinedload(TournamentParticipation.user),
-        joinedload(Tournament.configuration).joinedload(TournamentConfiguration.blinds_structure),
-        joinedload(Tournament.sound_configuration)
+        joinedload(Tournament.configuration).joinedload(TournamentConfiguration.blinds_structure)
     ).filter(Tournament.id == tournament_id).first()
 
     if not tournament:
@@ -113,16 +113,8 @@ async def tournament_websocket(
             "data": {
                 "id": tournament.id,
                 "name": tournament.name,
-                "status": tournament.status.value,
-                "current_level": tournament.current_level or 1,  # Utiliser 1 comme valeur par défaut
-                "seconds_remaining": tournament.seconds_remaining or 0,
-                "level_duration": tournament.level_duration or 0,
-                "players_count": len(tournament.participations),
-                "active_players_count": sum(1 for p in tournament.participations if p.is_active),
-                "paused": tournament.paused_at is not None,
-                "tables_state": tournament.tables_state or {},
                 "blinds_structure": blinds_structure,  # Inclure la structure complète des blindes
-                "last_update_time": tournament.last_timer_update.isoformat() if tournament.last_timer_update else None
+                **tournament_state_store.live_state(db, tournament_id)
             }
         }
         await websocket.send_json(initial_state)
@@ -137,22 +129,17 @@ async def tournament_websocket(
                 await websocket.send_json({"type": "pong"})
             elif data.get("type") == "request_sync":
                 # Permettre au client de demander une synchronisation
-                # Récupérer l'état actuel du tournoi
-                current_tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
-                if current_tournament:
-                    # Envoyer un état actualisé
-                    sync_state = {
-                        "type": "sync_state",
-                        "data": {
-                            "current_level": current_tournament.current_level,
-                            "seconds_remaining": current_tournament.seconds_remaining,
-                            "level_duration": current_tournament.level_duration,
-                            "paused": current_tournament.paused_at is not None,
-                            "tables_state": current_tournament.tables_state or {},
-                            "timestamp": datetime.utcnow().isoformat()
-                        }
+                # État actuel : agrégat rattrapé avec les derniers événements
+                # (fin de la transaction précédente pour lire les nouveaux événements)
+                db.rollback()
+                sync_state = {
+                    "type": "sync_state",
+                    "data": {
+                        **tournament_state_store.live_state(db, tournament_id),
+                        "timestamp": datetime.utcnow().isoformat()
                     }
-                    await websocket.send_json(sync_state)
+                }
+                await websocket.send_json(sync_state)
 
     except WebSocketDisconnect:
          # Gérer la déconnexion
@@ -238,6 +225,18 @@ async def notify_player_eliminated(tournament_id: int, player_id: int, position:
     )
 
 
+async def notify_results_recorded(tournament_id: int, results: List[dict]):
+    """Événement unique pour un classement final saisi en lot"""
+    await broadcast_tournament_event(
+        tournament_id,
+        "results_recorded",
+        {
+            "results": results,
+            "time": datetime.now().isoformat()
+        }
+    )
+
+
 async def notify_rebuy(tournament_id: int, player_id: int, new_chips: float):
     await broadcast_tournament_event(
         tournament_id,
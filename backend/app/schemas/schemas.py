@@ -113,6 +113,21 @@ class BountyHunterResponse(BaseModel):
         from_attributes = True
 
 
+class LeaderboardEntry(BaseModel):
+    rank: int
+    user_id: int
+    username: str
+    profile_image_path: Optional[str] = None
+    score: float
+
+
+class LeaderboardRankResponse(BaseModel):
+    user_id: int
+    rank: Optional[int] = None
+    score: Optional[float] = None
+    total_players: int
+
+
 class ClayTokenHistoryResponse(BaseModel):
     tournament_id: int
     holder_id: int
@@ -268,6 +283,84 @@ class ParticipationResponse(ParticipationBase):
 
 
 
+class BulkRegistrationRequest(BaseModel):
+    """
+    Inscription groupée de joueurs à un tournoi (admin du tournoi)
+    """
+    user_ids: List[int] = Field(..., min_length=1, max_length=500)
+
+
+class RegistrationResult(BaseModel):
+    """
+    Résultat de l'inscription d'un joueur
+    (registered, already_registered, duplicate, user_not_found, wrong_league, tournament_full)
+    """
+    user_id: int
+    status: str
+    detail: Optional[str] = None
+
+
+class BulkRegistrationResponse(BaseModel):
+    tournament_id: int
+    registered_count: int
+    results: List[RegistrationResult]
+
+
+class PlayerResult(BaseModel):
+    """
+    Classement final et gains d'un joueur
+    """
+    player_id: int
+    position: int = Field(..., ge=1)
+    prize_amount: float = Field(0, ge=0)
+
+
+class TournamentResultsRequest(BaseModel):
+    """
+    Saisie groupée des résultats d'un tournoi
+    """
+    results: List[PlayerResult] = Field(..., min_length=1)
+
+
+class TournamentEventResponse(BaseModel):
+    """
+    Événement du journal d'un tournoi
+    """
+    seq: int
+    type: str
+    user_id: Optional[int] = None
+    value: Optional[int] = None
+    amount: Optional[float] = None
+    payload: Optional[Dict] = None
+    created_at: Optional[datetime] = None
+
+    @field_validator('type', mode='before')
+    @classmethod
+    def event_type_value(cls, value):
+        return getattr(value, "value", value)
+
+    class Config:
+        from_attributes = True
+
+
+class ImportRowError(BaseModel):
+    line: int
+    message: str
+
+
+class ResultsImportReport(BaseModel):
+    """
+    Rapport d'un import de résultats historiques
+    """
+    rows_read: int
+    tournaments_imported: int
+    tournaments_skipped: int  # Déjà présents (même nom et même date)
+    tournaments_rejected: int
+    participations_imported: int
+    error_count: int
+    errors: List[ImportRowError] = Field(default_factory=list)  # Premières erreurs seulement
+
+
 class RebuyRequest(BaseModel):
     """
     Demande de rebuy pour un joueur
@@ -416,6 +509,8 @@ class TournamentResponse(TournamentBase):
     current_level: Optional[int]
     total_rebuys: Optional[int]
     prize_pool: Optional[float]
+    registered_count: int = 0
+    version: int = 1  # À renvoyer dans If-Match pour les modifications
     clay_token_holder_id: Optional[int]
     bounty_hunter_id: Optional[int]
     tables_state: Dict[str, Dict[str, int]]  # Structure des tables
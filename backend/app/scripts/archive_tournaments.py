@@ -0,0 +1,44 @@
+# backend/app/scripts/archive_tournaments.py
+"""
+Déplace les tournois terminés depuis plus de N mois (et leurs participations)
+vers les tables tournaments_archive et tournament_participations_archive.
+
+À planifier périodiquement (cron), par exemple chaque nuit.
+Les statistiques (player_stats) ne changent pas : elles sont déjà agrégées,
+et rebuild_player_stats relit aussi les archives.
+
+Utilisation (depuis le dossier backend) :
+    python -m app.scripts.archive_tournaments [--months N] [--batch-size 500]
+"""
+import argparse
+import logging
+from datetime import datetime, timedelta
+
+from ..config import settings
+from ..database import SessionLocal
+from ..models import models, configuration, blog, stats, events, archive  # noqa: F401 - enregistre tous les modèles
+from ..crud import archive as archive_crud
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Archivage des tournois terminés")
+    parser.add_argument("--months", type=int, default=settings.TOURNAMENT_ARCHIVE_AFTER_MONTHS,
+                        help="Ancienneté minimale (mois de 30 jours) depuis la fin du tournoi")
+    parser.add_argument("--batch-size", type=int, default=500, help="Tournois déplacés par transaction")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    completed_before = datetime.utcnow() - timedelta(days=30 * args.months)
+    db = SessionLocal()
+    try:
+        count = archive_crud.archive_completed_tournaments(db, completed_before, batch_size=args.batch_size)
+        logger.info(f"{count} tournois terminés avant le {completed_before:%Y-%m-%d} archivés")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
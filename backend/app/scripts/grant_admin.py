@@ -0,0 +1,42 @@
+# backend/app/scripts/grant_admin.py
+"""
+Accorde (ou retire) le rôle d'administrateur de l'application à un utilisateur.
+Le changement est pris en compte par l'API à l'expiration du cache d'authentification.
+
+Utilisation (depuis le dossier backend) :
+    python -m app.scripts.grant_admin USERNAME [--revoke]
+"""
+import argparse
+import logging
+import sys
+
+from ..database import SessionLocal
+from ..models import models, configuration, blog, stats, events, archive  # noqa: F401 - enregistre tous les modèles
+from ..crud import user as user_crud
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gestion des administrateurs de l'application")
+    parser.add_argument("username", help="Nom d'utilisateur")
+    parser.add_argument("--revoke", action="store_true", help="Retirer le rôle au lieu de l'accorder")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    db = SessionLocal()
+    try:
+        user = user_crud.get_user_by_username(db, args.username)
+        if user is None:
+            logger.error(f"Utilisateur introuvable : {args.username}")
+            sys.exit(1)
+        user.is_admin = not args.revoke
+        db.commit()
+        logger.info(f"{args.username} : administrateur = {user.is_admin}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# backend/app/scripts/import_results.py
+"""
+Importe l'historique des résultats d'une ligue depuis un fichier CSV ou NDJSON
+(format des colonnes : voir app/crud/results_import.py).
+
+Le fichier est lu en flux et écrit par lots, chacun dans sa propre transaction ;
+un import interrompu peut être relancé (les tournois déjà présents sont ignorés).
+
+Utilisation (depuis le dossier backend) :
+    python -m app.scripts.import_results --league-id 1 --admin-id 3 resultats.csv
+    python -m app.scripts.import_results --league-id 1 --admin-id 3 --format ndjson - < resultats.ndjson
+"""
+import argparse
+import io
+import logging
+import sys
+
+from ..database import SessionLocal
+from ..models import models, configuration, blog, stats, events, archive  # noqa: F401 - enregistre tous les modèles
+from ..crud import results_import
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import des résultats historiques")
+    parser.add_argument("path", help="Fichier à importer (- pour l'entrée standard)")
+    parser.add_argument("--league-id", type=int, required=True, help="Ligue des tournois importés")
+    parser.add_argument("--admin-id", type=int, required=True, help="Administrateur des tournois importés")
+    parser.add_argument("--format", choices=("csv", "ndjson"), default=None,
+                        help="Format du fichier (déduit de l'extension par défaut)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Lignes par transaction")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    file_format = args.format or ("ndjson" if args.path.endswith((".ndjson", ".jsonl", ".json")) else "csv")
+    if args.path == "-":
+        lines = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8-sig", newline="")
+    else:
+        lines = open(args.path, encoding="utf-8-sig", newline="")
+
+    def log_progress(report):
+        logger.info(
+            f"{report.rows_read} lignes lues, {report.tournaments_imported} tournois importés, "
+            f"{report.tournaments_skipped} ignorés, {report.tournaments_rejected} rejetés"
+        )
+
+    db = SessionLocal()
+    try:
+        rows = results_import.iter_csv_rows(lines) if file_format == "csv" else results_import.iter_ndjson_rows(lines)
+        report = results_import.import_results(
+            db, args.league_id, args.admin_id, rows, args.chunk_size, log_progress
+        )
+    finally:
+        db.close()
+        lines.close()
+
+    for error in report.errors:
+        logger.warning(f"Ligne {error['line']} : {error['message']}")
+    if report.error_count > len(report.errors):
+        logger.warning(f"... {report.error_count - len(report.errors)} autres erreurs")
+    logger.info(
+        f"Import terminé : {report.tournaments_imported} tournois, "
+        f"{report.participations_imported} participations"
+    )
+    # Classements en mémoire de l'API : POST /leaderboards/rebuild
+    sys.exit(1 if report.error_count else 0)
+
+
+if __name__ == "__main__":
+    main()
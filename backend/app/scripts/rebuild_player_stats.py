@@ -0,0 +1,34 @@
+# backend/app/scripts/rebuild_player_stats.py
+"""
+Reconstruit la table player_stats depuis l'historique des tournois terminés.
+
+Utilisation (depuis le dossier backend) :
+    python -m app.scripts.rebuild_player_stats [--league-id ID]
+"""
+import argparse
+import logging
+
+from ..database import SessionLocal
+from ..models import models, configuration, blog, stats, events, archive  # noqa: F401 - enregistre tous les modèles
+from ..crud import stats as stats_crud
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reconstruction des statistiques joueurs")
+    parser.add_argument("--league-id", type=int, default=None, help="Limiter à une ligue")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    db = SessionLocal()
+    try:
+        count = stats_crud.rebuild_player_stats(db, league_id=args.league_id)
+        logger.info(f"player_stats reconstruite : {count} lignes écrites")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# backend/app/scripts/snapshot_tournaments.py
+"""
+Écrit un instantané initial (tournament_snapshots) pour les tournois qui n'en
+ont pas, construit depuis leurs colonnes et participations actuelles.
+
+Nécessaire une fois pour les tournois créés avant le journal d'événements :
+leur état ne peut pas être reconstruit par le seul rejeu de tournament_events.
+
+Utilisation (depuis le dossier backend) :
+    python -m app.scripts.snapshot_tournaments
+"""
+import logging
+
+from sqlalchemy.orm import selectinload
+
+from ..database import SessionLocal
+from ..models import models, configuration, blog, stats, events, archive  # noqa: F401 - enregistre tous les modèles
+from ..models.events import TournamentSnapshot
+from ..models.models import Tournament
+from ..crud import events as events_crud
+from ..services.tournament_state import TournamentAggregate
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    db = SessionLocal()
+    try:
+        snapshotted = db.query(TournamentSnapshot.tournament_id).distinct()
+        tournaments = db.query(Tournament).options(
+            selectinload(Tournament.participations)
+        ).filter(Tournament.id.notin_(snapshotted)).all()
+
+        for tournament in tournaments:
+            aggregate = TournamentAggregate.from_tournament(tournament)
+            events_crud.save_snapshot(db, tournament.id, aggregate.seq, aggregate.to_dict())
+        db.commit()
+        logger.info(f"Instantané initial écrit pour {len(tournaments)} tournois")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+# backend/app/scripts/sync_registered_counts.py
+"""
+Recalcule tournaments.registered_count depuis les participations existantes.
+
+À exécuter une fois après l'ajout de la colonne sur une base existante :
+    ALTER TABLE tournaments ADD COLUMN registered_count INT NOT NULL DEFAULT 0;
+    ALTER TABLE tournament_participations
+        ADD UNIQUE KEY uq_participation_tournament_user (tournament_id, user_id);
+
+Utilisation (depuis le dossier backend) :
+    python -m app.scripts.sync_registered_counts
+"""
+import logging
+
+from ..database import SessionLocal
+from ..models import models, configuration, blog, stats, events, archive  # noqa: F401 - enregistre tous les modèles
+from ..crud import tournament as tournament_crud
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    db = SessionLocal()
+    try:
+        count = tournament_crud.sync_registered_counts(db)
+        logger.info(f"registered_count recalculé pour {count} tournois")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
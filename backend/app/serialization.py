@@ -0,0 +1,98 @@
+# backend/app/serialization.py
+"""
+Sérialisation JSON des réponses.
+
+L'application utilise ORJSONResponse comme classe de réponse par défaut (voir
+main.py) : l'encodage JSON est fait par orjson au lieu du module json.
+
+Par défaut FastAPI valide encore chaque réponse par son response_model. Pour des
+données déjà conformes (dictionnaires construits par crud/fast_reads.py à partir
+de la base, où elles ont été validées à l'écriture), trusted_response renvoie
+directement la réponse encodée : FastAPI ne revalide pas une Response, le
+response_model de la route ne sert plus qu'à la documentation OpenAPI.
+
+sparse_fields lit le paramètre ?fields= (sparse fieldsets) : les routes ne
+chargent et ne renvoient que les champs demandés du schéma de réponse.
+
+entity_tag et not_modified implémentent les GET conditionnels : l'ETag est
+calculé à partir des versions des entités lues (colonnes `version`), avant toute
+lecture de la représentation ; si If-None-Match correspond, la route répond 304
+sans charger ni sérialiser la ressource.
+"""
+import hashlib
+from typing import Any, Dict, FrozenSet, Optional, Type
+
+from fastapi import HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def trusted_response(content: Any, status_code: int = 200, headers: Optional[Dict[str, str]] = None) -> ORJSONResponse:
+    """
+    Réponse JSON encodée sans validation par le response_model.
+
+    À réserver aux contenus produits par le serveur exactement au format du
+    schéma de réponse (jamais à des données venant du client).
+    """
+    return ORJSONResponse(content=content, status_code=status_code, headers=headers)
+
+
+def sparse_fields(response_model: Type[BaseModel]):
+    """
+    Dépendance lisant ?fields=champ1,champ2 parmi les champs de premier niveau
+    de `response_model`. Retourne None (réponse complète) si le paramètre est
+    absent ; l'identifiant est toujours renvoyé.
+    """
+    allowed = frozenset(response_model.model_fields)
+
+    def dependency(
+        fields: Optional[str] = Query(
+            None,
+            description=f"Champs à renvoyer, séparés par des virgules, parmi : {', '.join(sorted(allowed))}"
+        )
+    ) -> Optional[FrozenSet[str]]:
+        if fields is None:
+            return None
+        requested = frozenset(field.strip() for field in fields.split(",") if field.strip())
+        unknown = requested - allowed
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Champs inconnus : {', '.join(sorted(unknown))}"
+            )
+        return requested | {"id"}
+
+    return dependency
+
+
+def entity_tag(*parts: Any, version: Optional[int] = None) -> str:
+    """
+    ETag fort dérivé des versions des entités composant une représentation
+    (et des paramètres qui la modifient, comme ?fields=). Les parties doivent
+    avoir une représentation stable (tuples triés plutôt qu'ensembles).
+
+    `version` préfixe l'empreinte ("3-9f2c..."), pour les ressources dont la
+    version sert aussi de précondition If-Match.
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+    return f'"{version}-{digest}"' if version is not None else f'"{digest}"'
+
+
+def etag_headers(etag: str) -> Dict[str, str]:
+    """En-têtes d'une représentation validable : le client revalide à chaque lecture"""
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """
+    Réponse 304 si l'en-tête If-None-Match de la requête contient `etag`
+    (comparaison faible, comme le prévoit la RFC 9110 pour If-None-Match),
+    None sinon.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return None
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    if "*" in candidates or etag in candidates:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag))
+    return None
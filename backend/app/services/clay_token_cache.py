@@ -0,0 +1,82 @@
+# backend/app/services/clay_token_cache.py
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session, joinedload
+
+from ..models.archive import ArchivedTournament
+from ..models.models import Tournament, TournamentStatus, TournamentType
+
+logger = logging.getLogger(__name__)
+
+
+class ClayTokenCache:
+    """
+    Cache en mémoire de la chronologie des détenteurs du jeton d'argile.
+    Chargée en une requête par table, courante et archive (détenteurs inclus),
+    et invalidée uniquement quand un tournoi JAPT se termine ou que le
+    détenteur d'un tournoi est modifié.
+    """
+
+    def __init__(self):
+        self._timeline: Optional[List[Dict]] = None
+        # Incrémenté à chaque invalidation : une chronologie chargée pendant une
+        # invalidation est plus ancienne qu'elle et n'est pas conservée
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        with self._lock:
+            self._timeline = None
+            self._generation += 1
+        logger.debug("Clay token timeline invalidated")
+
+    def _load(self, db: Session) -> List[Dict]:
+        tournaments = []
+        for model in (Tournament, ArchivedTournament):
+            tournaments.extend(
+                db.query(model)
+                .options(joinedload(model.clay_token_holder))
+                .filter(
+                    model.tournament_type == TournamentType.JAPT,
+                    model.status == TournamentStatus.COMPLETED,
+                    model.clay_token_holder_id.isnot(None)
+                )
+                .all()
+            )
+        # Les tournois archivés sont les plus anciens mais l'ordre est recalculé sur l'ensemble
+        tournaments.sort(key=lambda tournament: tournament.end_time or tournament.date, reverse=True)
+        return [
+            {
+                "tournament_id": tournament.id,
+                "holder_id": tournament.clay_token_holder_id,
+                "holder_username": tournament.clay_token_holder.username,
+                "holder_profile_image": tournament.clay_token_holder.profile_image_path,
+                "date": tournament.end_time,
+                "tournament_name": tournament.name
+            }
+            for tournament in tournaments
+        ]
+
+    def timeline(self, db: Session) -> List[Dict]:
+        """Chronologie complète, du plus récent au plus ancien"""
+        with self._lock:
+            timeline, generation = self._timeline, self._generation
+        if timeline is None:
+            timeline = self._load(db)
+            with self._lock:
+                if self._generation == generation:
+                    self._timeline = timeline
+        return timeline
+
+    def current(self, db: Session) -> Optional[Dict]:
+        timeline = self.timeline(db)
+        return timeline[0] if timeline else None
+
+    def history(self, db: Session, skip: int = 0, limit: int = 50) -> List[Dict]:
+        return self.timeline(db)[skip:skip + limit]
+
+
+# Créer une instance unique du cache
+clay_token_cache = ClayTokenCache()
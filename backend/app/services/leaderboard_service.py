@@ -0,0 +1,167 @@
+# backend/app/services/leaderboard_service.py
+import enum
+import logging
+import threading
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..crud.stats import COUNTER_FIELDS
+from ..models.stats import PlayerStats
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderboardMetric(str, enum.Enum):
+    """
+    Métriques de classement disponibles
+    """
+    BOUNTIES = "bounties"
+    EARNINGS = "earnings"
+    ROI = "roi"
+    POINTS = "points"
+
+
+def metric_score(metric: LeaderboardMetric, totals: Dict[str, float]) -> Optional[float]:
+    """
+    Calcule le score d'un joueur pour une métrique.
+    Retourne None si le joueur ne doit pas figurer au classement.
+    """
+    if metric == LeaderboardMetric.BOUNTIES:
+        return totals["bounty_count"] if totals["bounty_count"] > 0 else None
+    if metric == LeaderboardMetric.EARNINGS:
+        return totals["total_earnings"] - totals["total_buyin"]
+    if metric == LeaderboardMetric.ROI:
+        buyin = totals["total_buyin"]
+        if buyin <= 0:
+            return None
+        return (totals["total_earnings"] - buyin) / buyin * 100
+    if metric == LeaderboardMetric.POINTS:
+        return totals["season_points"]
+    return None
+
+
+class Leaderboard:
+    """
+    Classement trié en mémoire : liste de clés (-score, user_id) maintenue triée.
+    Rang et pages autour d'un joueur en O(log n).
+    """
+
+    def __init__(self):
+        self._keys: List[Tuple[float, int]] = []
+        self._scores: Dict[int, float] = {}
+
+    def __len__(self):
+        return len(self._keys)
+
+    def upsert(self, user_id: int, score: Optional[float]):
+        """Insère, déplace ou retire (score None) un joueur du classement"""
+        old_score = self._scores.pop(user_id, None)
+        if old_score is not None:
+            index = bisect_left(self._keys, (-old_score, user_id))
+            del self._keys[index]
+        if score is not None:
+            self._scores[user_id] = score
+            insort(self._keys, (-score, user_id))
+
+    def score(self, user_id: int) -> Optional[float]:
+        return self._scores.get(user_id)
+
+    def rank(self, user_id: int) -> Optional[int]:
+        """Rang du joueur (les ex-aequo partagent le même rang)"""
+        score = self.score(user_id)
+        if score is None:
+            return None
+        return bisect_left(self._keys, (-score,)) + 1
+
+    def _entries(self, start: int, stop: int) -> List[Dict]:
+        entries = []
+        for index in range(max(0, start), min(stop, len(self._keys))):
+            neg_score, user_id = self._keys[index]
+            entries.append({
+                "rank": bisect_left(self._keys, (neg_score,)) + 1,
+                "user_id": user_id,
+                "score": -neg_score
+            })
+        return entries
+
+    def page(self, skip: int = 0, limit: int = 20) -> List[Dict]:
+        return self._entries(skip, skip + limit)
+
+    def around(self, user_id: int, radius: int = 5) -> List[Dict]:
+        """Page centrée sur un joueur"""
+        score = self.score(user_id)
+        if score is None:
+            return []
+        index = bisect_left(self._keys, (-score, user_id))
+        return self._entries(index - radius, index + radius + 1)
+
+
+# Clé d'un classement : (league_id, saison ou None pour le cumul, métrique)
+BoardKey = Tuple[int, Optional[int], LeaderboardMetric]
+
+
+class LeaderboardService:
+    """
+    Classements matérialisés par ligue, reconstruits depuis player_stats au démarrage
+    puis rafraîchis joueur par joueur à la clôture des tournois.
+    """
+
+    def __init__(self):
+        self._boards: Dict[BoardKey, Leaderboard] = {}
+        self._lock = threading.Lock()
+
+    def get(self, league_id: int, metric: LeaderboardMetric, season: Optional[int] = None) -> Leaderboard:
+        return self._boards.get((league_id, season, metric)) or Leaderboard()
+
+    @staticmethod
+    def _aggregate(rows: Iterable[PlayerStats]) -> Dict[Tuple[int, Optional[int], int], Dict[str, float]]:
+        """Totaux par (ligue, saison) et par (ligue, cumul) pour chaque joueur"""
+        totals: Dict[Tuple[int, Optional[int], int], Dict[str, float]] = {}
+        for row in rows:
+            for season in (row.season, None):
+                total = totals.setdefault(
+                    (row.league_id, season, row.user_id),
+                    {field: 0 for field in COUNTER_FIELDS}
+                )
+                for field in COUNTER_FIELDS:
+                    total[field] += getattr(row, field) or 0
+        return totals
+
+    def _upsert_totals(self, totals: Dict[Tuple[int, Optional[int], int], Dict[str, float]]):
+        for (league_id, season, user_id), values in totals.items():
+            for metric in LeaderboardMetric:
+                board = self._boards.setdefault((league_id, season, metric), Leaderboard())
+                board.upsert(user_id, metric_score(metric, values))
+
+    def rebuild(self, db: Session):
+        """Reconstruit tous les classements depuis la table player_stats"""
+        totals = self._aggregate(db.query(PlayerStats).all())
+        with self._lock:
+            self._boards = {}
+            self._upsert_totals(totals)
+        logger.info(f"Leaderboards rebuilt: {len(self._boards)} classements")
+
+    def refresh_players(self, db: Session, league_id: int, user_ids: List[int]):
+        """Rafraîchit les classements d'une ligue pour quelques joueurs seulement"""
+        if not user_ids:
+            return
+        rows = db.query(PlayerStats).filter(
+            PlayerStats.league_id == league_id,
+            PlayerStats.user_id.in_(user_ids)
+        ).all()
+        with self._lock:
+            self._upsert_totals(self._aggregate(rows))
+
+    def refresh_tournament(self, db: Session, tournament):
+        """Rafraîchit les classements des joueurs concernés par un tournoi terminé"""
+        user_ids = {p.user_id for p in tournament.participations}
+        user_ids.update(
+            user_id for user_id in (tournament.bounty_hunter_id, tournament.clay_token_holder_id) if user_id
+        )
+        self.refresh_players(db, tournament.league_id, list(user_ids))
+
+
+# Créer une instance unique du service
+leaderboard_service = LeaderboardService()
@@ -0,0 +1,57 @@
+# backend/app/services/password_service.py
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+from ..config import settings
+
+# Pool borné : bcrypt consomme ~100-300 ms de CPU par appel, on ne bloque jamais
+# la boucle d'événements (WebSockets, timer) et on limite la concurrence
+_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash"
+)
+
+
+def hash_password_sync(password: str) -> str:
+    """Hache un mot de passe avec le coût configuré (bloquant)"""
+    return bcrypt.hashpw(
+        password.encode('utf-8'),
+        bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    ).decode('utf-8')
+
+
+def verify_password_sync(password: str, hashed_password: str) -> bool:
+    """Vérifie un mot de passe contre son hash (bloquant)"""
+    return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+
+def get_hash_rounds(hashed_password: str) -> int:
+    """Extrait le facteur de coût d'un hash bcrypt ($2b$12$...)"""
+    try:
+        return int(hashed_password.split('$')[2])
+    except (IndexError, ValueError):
+        return 0
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """Indique si le hash a été calculé avec un coût différent de celui configuré"""
+    return get_hash_rounds(hashed_password) != settings.BCRYPT_ROUNDS
+
+
+async def hash_password(password: str) -> str:
+    """Hache un mot de passe dans le pool dédié"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, hash_password_sync, password)
+
+
+async def verify_password(password: str, hashed_password: str) -> bool:
+    """Vérifie un mot de passe dans le pool dédié"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, verify_password_sync, password, hashed_password)
+
+
+def shutdown():
+    """Arrête le pool de hachage (arrêt de l'application)"""
+    _executor.shutdown(wait=False)
@@ -83,8 +83,21 @@ class TournamentTimerService:
 
                 # Vérifier si le temps a changé significativement (au moins 1 seconde)
                 if int(new_remaining) != int(tournament.seconds_remaining):
-                    tournament.seconds_remaining = new_remaining
-                    tournament.last_timer_update = now
+                    # UPDATE direct, conditionné à l'état lu : une pause ou un changement
+                    # de niveau fait entre-temps par un admin n'est pas écrasé, et la
+                    # version du tournoi (verrouillage optimiste) n'est pas incrémentée
+                    db.query(Tournament).filter(
+                        Tournament.id == tournament.id,
+                        Tournament.paused_at.is_(None),
+                        Tournament.current_level == tournament.current_level,
+                        Tournament.last_timer_update == tournament.last_timer_update
+                    ).update(
+                        {
+                            Tournament.seconds_remaining: new_remaining,
+                            Tournament.last_timer_update: now
+                        },
+                        synchronize_session=False
+                    )
 
                     # Si le temps est écoulé, on pourrait automatiquement passer au niveau suivant
                     # ou envoyer une notification (logique à implémenter selon les besoins)
@@ -0,0 +1,353 @@
+# backend/app/services/tournament_state.py
+"""
+État en direct des tournois reconstruit depuis le journal tournament_events.
+
+TournamentAggregate replie les événements d'un tournoi dans un état compact
+(statut, niveau, timer, joueurs actifs, rebuys, tables). Le magasin garde les
+agrégats en mémoire et ne relit que les événements postérieurs à leur numéro
+de séquence ; un instantané est persisté tous les TOURNAMENT_SNAPSHOT_INTERVAL
+événements, de sorte qu'après un redémarrage on charge le dernier instantané
+puis on rejoue la fin du journal. Sans instantané, l'état initial est lu dans
+la ligne du tournoi (tournois antérieurs au journal).
+"""
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload
+
+from ..config import settings
+from ..crud import events as events_crud
+from ..database import SessionLocal
+from ..models.events import TournamentEvent, TournamentEventType
+from ..models.models import Tournament, TournamentStatus
+
+logger = logging.getLogger(__name__)
+
+# Nombre d'événements lus par requête lors du rattrapage
+REPLAY_BATCH_SIZE = 1000
+
+
+class TournamentAggregate:
+    """
+    État d'un tournoi après l'événement `seq`
+    """
+
+    def __init__(self, tournament_id: int):
+        self.tournament_id = tournament_id
+        self.seq = 0
+        self.snapshot_seq = 0  # Numéro du dernier instantané persisté
+        self.status = TournamentStatus.PLANNED.value
+        self.current_level = 0
+        self.level_duration = None
+        self.seconds_remaining = None
+        self.timer_updated_at: Optional[datetime] = None  # Heure (UTC) de la dernière valeur du timer
+        self.paused = False
+        # Joueurs inscrits : user_id -> {"active", "position", "rebuys", "prize"}
+        self.players: Dict[int, Dict] = {}
+        self.total_rebuys = 0
+        self.rebuy_amount = 0.0
+        self.tables_state: Dict = {}
+        self.clay_token_holder_id = None
+
+    def _set_timer(self, seconds: Optional[int], at: Optional[datetime]):
+        self.seconds_remaining = seconds
+        self.timer_updated_at = at
+
+    @staticmethod
+    def _timer_at(event: TournamentEvent) -> Optional[datetime]:
+        """
+        Heure UTC de la valeur du timer portée par l'événement (events_crud.timer_payload).
+        Les événements antérieurs n'ont que created_at, à l'heure locale de la base.
+        """
+        timer_updated_at = (event.payload or {}).get("timer_updated_at")
+        if timer_updated_at:
+            return datetime.fromisoformat(timer_updated_at)
+        return event.created_at
+
+    def apply(self, event: TournamentEvent):
+        """
+        Applique un événement du journal (dans l'ordre des seq)
+        """
+        event_type = event.type
+        player = self.players.get(event.user_id)
+
+        if event_type == TournamentEventType.REGISTERED:
+            self.players[event.user_id] = {"active": True, "position": None, "rebuys": 0, "prize": 0.0}
+        elif event_type == TournamentEventType.UNREGISTERED:
+            self.players.pop(event.user_id, None)
+        elif event_type == TournamentEventType.STARTED:
+            self.status = TournamentStatus.IN_PROGRESS.value
+        elif event_type == TournamentEventType.PAUSED:
+            self.paused = True
+            self._set_timer(event.value, self._timer_at(event))
+        elif event_type == TournamentEventType.RESUMED:
+            self.paused = False
+            self._set_timer(event.value, self._timer_at(event))
+        elif event_type == TournamentEventType.LEVEL_CHANGED:
+            self.current_level = event.value
+            self.level_duration = int(event.amount) if event.amount is not None else None
+            self._set_timer(self.level_duration, self._timer_at(event))
+        elif event_type == TournamentEventType.TIMER_SET:
+            self._set_timer(event.value, self._timer_at(event))
+        elif event_type == TournamentEventType.REBUY:
+            self.total_rebuys += 1
+            self.rebuy_amount += event.amount or 0
+            if player is not None:
+                player["rebuys"] += 1
+        elif event_type in (TournamentEventType.ELIMINATED, TournamentEventType.FINISHED):
+            if player is not None:
+                player["position"] = event.value
+                player["prize"] = event.amount or 0.0
+                # Le vainqueur d'un classement saisi en lot reste actif
+                player["active"] = event_type == TournamentEventType.FINISHED and event.value == 1
+        elif event_type == TournamentEventType.TABLES_UPDATED:
+            self.tables_state = event.payload or {}
+        elif event_type == TournamentEventType.CLAY_TOKEN_AWARDED:
+            self.clay_token_holder_id = event.user_id
+        elif event_type == TournamentEventType.COMPLETED:
+            self.status = TournamentStatus.COMPLETED.value
+
+        self.seq = event.seq
+
+    @property
+    def players_count(self) -> int:
+        return len(self.players)
+
+    @property
+    def active_players_count(self) -> int:
+        return sum(1 for player in self.players.values() if player["active"])
+
+    def seconds_remaining_at(self, now: datetime) -> Optional[int]:
+        """Temps restant projeté à `now` (le timer tourne sauf en pause)"""
+        if self.seconds_remaining is None:
+            return None
+        if (self.paused or self.timer_updated_at is None
+                or self.status != TournamentStatus.IN_PROGRESS.value):
+            return self.seconds_remaining
+        updated_at = self.timer_updated_at.replace(tzinfo=None)
+        elapsed = int((now - updated_at).total_seconds())
+        return max(0, self.seconds_remaining - max(0, elapsed))
+
+    def live_state(self) -> Dict:
+        """
+        Champs en direct envoyés aux clients WebSocket
+        """
+        return {
+            "seq": self.seq,
+            "status": self.status,
+            "current_level": self.current_level or 1,
+            "seconds_remaining": self.seconds_remaining_at(datetime.utcnow()) or 0,
+            "level_duration": self.level_duration or 0,
+            "paused": self.paused,
+            "players_count": self.players_count,
+            "active_players_count": self.active_players_count,
+            "total_rebuys": self.total_rebuys,
+            "tables_state": self.tables_state or {},
+            "clay_token_holder_id": self.clay_token_holder_id,
+            "last_update_time": self.timer_updated_at.isoformat() if self.timer_updated_at else None
+        }
+
+    def to_dict(self) -> Dict:
+        """État sérialisable en JSON (instantané)"""
+        return {
+            "status": self.status,
+            "current_level": self.current_level,
+            "level_duration": self.level_duration,
+            "seconds_remaining": self.seconds_remaining,
+            "timer_updated_at": self.timer_updated_at.isoformat() if self.timer_updated_at else None,
+            "paused": self.paused,
+            "players": {str(user_id): player for user_id, player in self.players.items()},
+            "total_rebuys": self.total_rebuys,
+            "rebuy_amount": self.rebuy_amount,
+            "tables_state": self.tables_state,
+            "clay_token_holder_id": self.clay_token_holder_id
+        }
+
+    @classmethod
+    def from_dict(cls, tournament_id: int, seq: int, state: Dict) -> "TournamentAggregate":
+        aggregate = cls(tournament_id)
+        aggregate.seq = aggregate.snapshot_seq = seq
+        aggregate.status = state["status"]
+        aggregate.current_level = state["current_level"]
+        aggregate.level_duration = state["level_duration"]
+        aggregate.seconds_remaining = state["seconds_remaining"]
+        timer_updated_at = state.get("timer_updated_at")
+        aggregate.timer_updated_at = datetime.fromisoformat(timer_updated_at) if timer_updated_at else None
+        aggregate.paused = state["paused"]
+        # Les clés JSON sont des chaînes
+        aggregate.players = {int(user_id): player for user_id, player in state["players"].items()}
+        aggregate.total_rebuys = state["total_rebuys"]
+        aggregate.rebuy_amount = state["rebuy_amount"]
+        aggregate.tables_state = state["tables_state"] or {}
+        aggregate.clay_token_holder_id = state["clay_token_holder_id"]
+        return aggregate
+
+    @classmethod
+    def from_tournament(cls, tournament: Tournament) -> "TournamentAggregate":
+        """
+        État construit depuis les colonnes et participations d'un tournoi
+        (tournois antérieurs au journal, voir scripts/snapshot_tournaments.py)
+        """
+        aggregate = cls(tournament.id)
+        aggregate.seq = tournament.event_seq or 0
+        aggregate.status = tournament.status.value
+        aggregate.current_level = tournament.current_level or 0
+        aggregate.level_duration = tournament.level_duration
+        aggregate.seconds_remaining = tournament.seconds_remaining
+        aggregate.timer_updated_at = tournament.last_timer_update
+        aggregate.paused = tournament.paused_at is not None
+        aggregate.players = {
+            participation.user_id: {
+                "active": bool(participation.is_active),
+                "position": participation.current_position,
+                "rebuys": participation.num_rebuys or 0,
+                "prize": participation.prize_won or 0.0
+            }
+            for participation in tournament.participations
+        }
+        aggregate.total_rebuys = tournament.total_rebuys or 0
+        aggregate.rebuy_amount = sum(
+            (participation.total_buyin or 0) - (tournament.buy_in or 0)
+            for participation in tournament.participations
+        )
+        aggregate.tables_state = tournament.tables_state or {}
+        aggregate.clay_token_holder_id = tournament.clay_token_holder_id
+        return aggregate
+
+
+class _CachedAggregate:
+    """Agrégat en mémoire d'un tournoi et son verrou (chargé à la première lecture)"""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.aggregate: Optional[TournamentAggregate] = None
+
+
+class TournamentStateStore:
+    """
+    Agrégats en mémoire (LRU borné), rattrapés à chaque lecture par les
+    événements postérieurs : toujours à jour, y compris avec plusieurs workers.
+
+    Un verrou par tournoi protège le rattrapage : les lectures des autres tournois
+    ne l'attendent pas. Le verrou du magasin ne protège que le LRU. Un agrégat
+    évincé pendant sa lecture reste valide pour son lecteur ; la lecture suivante
+    en recharge un nouveau, avec son propre verrou.
+    """
+
+    def __init__(self, snapshot_interval: int, max_size: int):
+        self.snapshot_interval = snapshot_interval
+        self.max_size = max_size
+        self._entries: "OrderedDict[int, _CachedAggregate]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def invalidate(self, tournament_id: Optional[int] = None):
+        with self._lock:
+            if tournament_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(tournament_id, None)
+
+    def _entry(self, tournament_id: int) -> _CachedAggregate:
+        with self._lock:
+            entry = self._entries.get(tournament_id)
+            if entry is None:
+                entry = self._entries[tournament_id] = _CachedAggregate()
+                if len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.move_to_end(tournament_id)
+            return entry
+
+    def _load(self, db: Session, tournament_id: int) -> TournamentAggregate:
+        """
+        Dernier instantané ; à défaut, état lu dans la ligne du tournoi et ses
+        participations (une requête), valable jusqu'à son event_seq
+        """
+        snapshot = events_crud.get_latest_snapshot(db, tournament_id)
+        if snapshot is not None:
+            return TournamentAggregate.from_dict(tournament_id, snapshot.seq, snapshot.state)
+        tournament = db.query(Tournament).options(
+            joinedload(Tournament.participations)
+        ).filter(Tournament.id == tournament_id).first()
+        if tournament is None:
+            return TournamentAggregate(tournament_id)
+        return TournamentAggregate.from_tournament(tournament)
+
+    def _read(self, db: Session, tournament_id: int, read: Callable[[TournamentAggregate], Any]):
+        """
+        Rattrape l'agrégat sous le verrou du tournoi et y applique `read`.
+        L'instantané éventuel est écrit après avoir relâché le verrou.
+        """
+        entry = self._entry(tournament_id)
+        snapshot = None
+        with entry.lock:
+            if entry.aggregate is None:
+                entry.aggregate = self._load(db, tournament_id)
+            aggregate = entry.aggregate
+
+            while True:
+                events = events_crud.list_tournament_events(
+                    db, tournament_id, after_seq=aggregate.seq, limit=REPLAY_BATCH_SIZE
+                )
+                for event in events:
+                    aggregate.apply(event)
+                if len(events) < REPLAY_BATCH_SIZE:
+                    break
+
+            result = read(aggregate)
+
+            if aggregate.seq - aggregate.snapshot_seq >= self.snapshot_interval:
+                # Réservé avant l'écriture : les lectures concurrentes ne l'écrivent pas aussi
+                snapshot = (aggregate.snapshot_seq, aggregate.seq, aggregate.to_dict())
+                aggregate.snapshot_seq = aggregate.seq
+
+        if snapshot is not None:
+            previous_seq, seq, state = snapshot
+            if not self._save_snapshot(tournament_id, seq, state):
+                with entry.lock:
+                    if aggregate.snapshot_seq == seq:
+                        aggregate.snapshot_seq = previous_seq
+        return result
+
+    def get(self, db: Session, tournament_id: int) -> TournamentAggregate:
+        """
+        État courant d'un tournoi : agrégat en mémoire, dernier instantané ou
+        ligne du tournoi, puis rejeu des événements suivants
+        """
+        return self._read(db, tournament_id, lambda aggregate: aggregate)
+
+    def live_state(self, db: Session, tournament_id: int) -> Dict:
+        """Champs en direct de l'état courant (lus sous le verrou du tournoi)"""
+        return self._read(db, tournament_id, TournamentAggregate.live_state)
+
+    def _save_snapshot(self, tournament_id: int, seq: int, state: Dict) -> bool:
+        """
+        Returns:
+            bool: False si l'instantané n'a pas pu être écrit (à réessayer)
+        """
+        # Session dédiée : la session de l'appelant peut être en lecture seule (réplica)
+        db = SessionLocal()
+        try:
+            events_crud.save_snapshot(db, tournament_id, seq, state)
+            db.commit()
+        except IntegrityError:
+            # Instantané déjà écrit par un autre worker pour ce seq
+            db.rollback()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error saving snapshot for tournament {tournament_id}: {e}")
+            return False
+        finally:
+            db.close()
+        return True
+
+
+# Créer une instance unique du magasin d'états
+tournament_state_store = TournamentStateStore(
+    settings.TOURNAMENT_SNAPSHOT_INTERVAL,
+    settings.TOURNAMENT_STATE_CACHE_SIZE
+)
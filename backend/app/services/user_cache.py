@@ -0,0 +1,94 @@
+# backend/app/services/user_cache.py
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from ..config import settings
+from ..models.models import User
+
+
+class AuthenticatedUserCache:
+    """
+    Cache LRU borné avec expiration (TTL) des utilisateurs authentifiés,
+    indexé par le sujet du token (nom d'utilisateur).
+
+    On stocke un instantané des colonnes et non l'objet ORM : à chaque requête
+    l'utilisateur est rattaché à la session courante sans aucune requête SQL.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _snapshot(user: User) -> Dict:
+        return {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+
+    def get(self, db: Session, username: str) -> Optional[User]:
+        """Retourne l'utilisateur rattaché à la session, ou None si absent/expiré"""
+        with self._lock:
+            entry = self._entries.get(username)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[username]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(username)
+            self.hits += 1
+            columns = entry[1]
+
+        user = User(**columns)
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+
+    def put(self, username: str, user: User):
+        with self._lock:
+            self._entries[username] = (time.monotonic() + self.ttl_seconds, self._snapshot(user))
+            self._entries.move_to_end(username)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate_user(self, user_id: Optional[int] = None, username: Optional[str] = None):
+        """Retire un utilisateur du cache (profil, ligue ou mot de passe modifiés)"""
+        with self._lock:
+            if username is not None and self._entries.pop(username, None) is not None:
+                self.invalidations += 1
+            if user_id is not None:
+                for key in [key for key, (_, columns) in self._entries.items() if columns["id"] == user_id]:
+                    del self._entries[key]
+                    self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations
+        }
+
+
+# Créer une instance unique du cache
+user_cache = AuthenticatedUserCache(
+    settings.AUTH_USER_CACHE_SIZE,
+    settings.AUTH_USER_CACHE_TTL_SECONDS
+)
@@ -7,7 +7,8 @@ USE pokweb;
 CREATE TABLE leagues (
    id INT AUTO_INCREMENT PRIMARY KEY,
    name VARCHAR(100) NOT NULL UNIQUE,
-   description VARCHAR(500)
+   description VARCHAR(500),
+   version INT NOT NULL DEFAULT 1  -- ETag de la liste des ligues (membres et administrateurs inclus)
 );
 
 -- Table des utilisateurs
@@ -20,9 +21,11 @@ CREATE TABLE users (
    hashed_password VARCHAR(255) NOT NULL,
    address VARCHAR(255),
    member_status VARCHAR(255),
+   is_admin BOOLEAN NOT NULL DEFAULT FALSE,  -- Administrateur de l'application
    profile_image_path VARCHAR(255),
    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
    last_login TIMESTAMP NULL,
+   version INT NOT NULL DEFAULT 1,  -- Incrémentée à chaque modification (ETag)
    league_id INT,
    FOREIGN KEY (league_id) REFERENCES leagues(id)
 );
@@ -44,6 +47,7 @@ CREATE TABLE blinds_structures (
    starting_chips INT NOT NULL DEFAULT 20000,  -- Ajouté ici depuis PayoutStructure
    created_by_id INT,
    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+   version INT NOT NULL DEFAULT 1,  -- Incrémentée à chaque modification (ETag)
    FOREIGN KEY (created_by_id) REFERENCES users(id)
 );
 
@@ -55,6 +59,7 @@ CREATE TABLE sound_configurations (
    sounds JSON NOT NULL,
    created_by_id INT,
    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+   version INT NOT NULL DEFAULT 1,  -- Incrémentée à chaque modification (ETag)
    FOREIGN KEY (created_by_id) REFERENCES users(id)
 );
 
@@ -70,6 +75,7 @@ CREATE TABLE tournament_configurations (
    sound_configuration_id INT,
    created_by_id INT,
    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+   version INT NOT NULL DEFAULT 1,  -- Incrémentée à chaque modification (ETag)
    FOREIGN KEY (blinds_structure_id) REFERENCES blinds_structures(id),
    FOREIGN KEY (sound_configuration_id) REFERENCES sound_configurations(id),
    FOREIGN KEY (created_by_id) REFERENCES users(id)
@@ -92,6 +98,7 @@ CREATE TABLE tournaments (
    paused_at TIMESTAMP NULL,
    last_timer_update TIMESTAMP NULL,
    max_players INT NOT NULL,
+   registered_count INT NOT NULL DEFAULT 0,
    buy_in DECIMAL(10,2) NOT NULL,
    num_tables INT DEFAULT 1,
    players_per_table INT DEFAULT 10,
@@ -103,6 +110,8 @@ CREATE TABLE tournaments (
    tables_state JSON,
    admin_id INT NOT NULL,
    league_id INT NOT NULL,
+   version INT NOT NULL DEFAULT 1,
+   event_seq INT NOT NULL DEFAULT 0,
    FOREIGN KEY (configuration_id) REFERENCES tournament_configurations(id),
    FOREIGN KEY (sound_configuration_id) REFERENCES sound_configurations(id),
    FOREIGN KEY (admin_id) REFERENCES users(id),
@@ -125,10 +134,120 @@ CREATE TABLE tournament_participations (
    total_buyin DECIMAL(10,2) DEFAULT 0,
    prize_won DECIMAL(10,2) DEFAULT 0,
    action_history JSON,
+   UNIQUE KEY uq_participation_tournament_user (tournament_id, user_id),
    FOREIGN KEY (tournament_id) REFERENCES tournaments(id),
    FOREIGN KEY (user_id) REFERENCES users(id)
 );
 
+-- Archives des tournois terminés depuis plus de TOURNAMENT_ARCHIVE_AFTER_MONTHS mois
+-- (mêmes colonnes et identifiants, voir python -m app.scripts.archive_tournaments)
+CREATE TABLE tournaments_archive (
+   id INT PRIMARY KEY,
+   name VARCHAR(100) NOT NULL,
+   tournament_type ENUM('CLASSIQUE', 'MTT', 'JAPT') NOT NULL,
+   status ENUM('PLANNED', 'IN_PROGRESS', 'COMPLETED') NOT NULL,
+   configuration_id INT,
+   sound_configuration_id INT,
+   date TIMESTAMP NOT NULL,
+   start_time TIMESTAMP NULL,
+   end_time TIMESTAMP NULL,
+   current_level INT DEFAULT 0,
+   seconds_remaining INT NULL,
+   level_duration INT NULL,
+   paused_at TIMESTAMP NULL,
+   last_timer_update TIMESTAMP NULL,
+   max_players INT NOT NULL,
+   registered_count INT NOT NULL DEFAULT 0,
+   buy_in DECIMAL(10,2) NOT NULL,
+   num_tables INT DEFAULT 1,
+   players_per_table INT DEFAULT 10,
+   total_buyin DECIMAL(10,2) DEFAULT 0,
+   total_rebuys INT DEFAULT 0,
+   prize_pool DECIMAL(10,2) DEFAULT 0,
+   clay_token_holder_id INT,
+   bounty_hunter_id INT,
+   tables_state JSON,
+   admin_id INT,
+   league_id INT NOT NULL,
+   version INT NOT NULL DEFAULT 1,
+   event_seq INT NOT NULL DEFAULT 0,
+   archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+   KEY ix_tournaments_archive_league_date (league_id, date),
+   FOREIGN KEY (configuration_id) REFERENCES tournament_configurations(id),
+   FOREIGN KEY (sound_configuration_id) REFERENCES sound_configurations(id),
+   FOREIGN KEY (admin_id) REFERENCES users(id),
+   FOREIGN KEY (clay_token_holder_id) REFERENCES users(id),
+   FOREIGN KEY (bounty_hunter_id) REFERENCES users(id),
+   FOREIGN KEY (league_id) REFERENCES leagues(id)
+);
+
+CREATE TABLE tournament_participations_archive (
+   id INT PRIMARY KEY,
+   tournament_id INT NOT NULL,
+   user_id INT NOT NULL,
+   is_registered BOOLEAN DEFAULT TRUE,
+   is_active BOOLEAN DEFAULT TRUE,
+   registration_time TIMESTAMP NULL,
+   elimination_time TIMESTAMP NULL,
+   current_position INT NULL,
+   num_rebuys INT DEFAULT 0,
+   total_buyin DECIMAL(10,2) DEFAULT 0,
+   prize_won DECIMAL(10,2) DEFAULT 0,
+   KEY ix_participations_archive_tournament (tournament_id),
+   KEY ix_participations_archive_user (user_id),
+   FOREIGN KEY (tournament_id) REFERENCES tournaments_archive(id),
+   FOREIGN KEY (user_id) REFERENCES users(id)
+);
+
+-- Journal append-only des événements de tournoi (sans clé étrangère : archivable)
+CREATE TABLE tournament_events (
+   id BIGINT AUTO_INCREMENT PRIMARY KEY,
+   tournament_id INT NOT NULL,
+   seq INT NOT NULL,
+   type ENUM('REGISTERED', 'UNREGISTERED', 'STARTED', 'PAUSED', 'RESUMED', 'LEVEL_CHANGED', 'TIMER_SET',
+             'REBUY', 'ELIMINATED', 'FINISHED', 'TABLES_UPDATED', 'CLAY_TOKEN_AWARDED', 'COMPLETED') NOT NULL,
+   user_id INT NULL,
+   value INT NULL,
+   amount FLOAT NULL,
+   payload JSON NULL,
+   created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+   UNIQUE KEY uq_tournament_events_seq (tournament_id, seq),
+   KEY ix_tournament_events_user_type (user_id, type)
+);
+
+-- Instantanés de l'état replié des tournois (un tous les N événements)
+CREATE TABLE tournament_snapshots (
+   tournament_id INT NOT NULL,
+   seq INT NOT NULL,
+   state JSON NOT NULL,
+   created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+   PRIMARY KEY (tournament_id, seq)
+);
+
+-- Statistiques agrégées des joueurs par ligue et par saison
+CREATE TABLE player_stats (
+   id INT AUTO_INCREMENT PRIMARY KEY,
+   user_id INT NOT NULL,
+   league_id INT NOT NULL,
+   season INT NOT NULL,
+   games_played INT NOT NULL DEFAULT 0,
+   victories INT NOT NULL DEFAULT 0,
+   itm_count INT NOT NULL DEFAULT 0,
+   positions_sum INT NOT NULL DEFAULT 0,
+   positions_count INT NOT NULL DEFAULT 0,
+   total_buyin DECIMAL(10,2) NOT NULL DEFAULT 0,
+   total_earnings DECIMAL(10,2) NOT NULL DEFAULT 0,
+   bounty_count INT NOT NULL DEFAULT 0,
+   bounty_earnings DECIMAL(10,2) NOT NULL DEFAULT 0,
+   clay_token_wins INT NOT NULL DEFAULT 0,
+   season_points INT NOT NULL DEFAULT 0,
+   updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+   UNIQUE KEY uq_player_stats_scope (user_id, league_id, season),
+   INDEX ix_player_stats_league_season (league_id, season),
+   FOREIGN KEY (user_id) REFERENCES users(id),
+   FOREIGN KEY (league_id) REFERENCES leagues(id)
+);
+
 -- Table des articles du blog
 CREATE TABLE blog_posts (
    id INT AUTO_INCREMENT PRIMARY KEY,
@@ -138,6 +138,14 @@ export const authService = {
     return response.data
   },
 
+  // Statistiques cumulées des joueurs d'une ligue
+  async getLeagueStatistics(leagueId, season = null) {
+    const response = await api.get(`/users/statistics/league/${leagueId}`, {
+      params: season ? { season } : {}
+    })
+    return response.data
+  },
+
   // Historique du jeton d'argile
   async getClayTokenHistory(skip = 0, limit = 50) {
     const response = await api.get('/users/clay-token/history', {